@@ -0,0 +1,44 @@
+from algorithms.steps import Step, PLACE, BACKTRACK
+
+# ---------------------------------------------
+# Backtracking as Step Generators
+# ---------------------------------------------
+# The generators return True / False (read it with `yield from` or from
+# StopIteration.value) and mutate the board, grid, maze or flags in place.
+# N-Queens and Sudoku live in algorithms/nqueens.py and algorithms/sudoku.py,
+# with their bitmask engines.
+
+
+# ---------------- Rat in a Maze ----------------
+def maze_steps(maze, x, y, path):
+    n = len(maze)
+    if x == n - 1 and y == n - 1:
+        path.append((x, y))
+        yield Step(PLACE, x, y)
+        return True
+    if 0 <= x < n and 0 <= y < n and maze[x][y] == 1:
+        maze[x][y] = 0
+        path.append((x, y))
+        yield Step(PLACE, x, y)
+        if (yield from maze_steps(maze, x + 1, y, path)) or (yield from maze_steps(maze, x, y + 1, path)):
+            return True
+        path.pop()
+        yield Step(BACKTRACK, x, y)
+        maze[x][y] = 1
+    return False
+
+
+# ---------------- Subset Sum ----------------
+def subset_sum_steps(arr, target, chosen, idx=0, total=0):
+    """chosen is a list of booleans (one per element) updated in place."""
+    if total == target:
+        return True
+    if idx >= len(arr) or total > target:
+        return False
+    chosen[idx] = True
+    yield Step(PLACE, idx)
+    if (yield from subset_sum_steps(arr, target, chosen, idx + 1, total + arr[idx])):
+        return True
+    chosen[idx] = False
+    yield Step(BACKTRACK, idx)
+    return (yield from subset_sum_steps(arr, target, chosen, idx + 1, total))
@@ -0,0 +1,334 @@
+import bisect
+import math
+
+import numpy as np
+from algorithms.steps import Step, WRITE
+from algorithms.sorting_steps import SORTING_STEPS
+from algorithms.search_steps import linear_search_steps, binary_search_steps
+from algorithms.graph_steps import (bfs_steps, dfs_steps, dijkstra_steps, astar_steps,
+                                    bidirectional_dijkstra_steps, euclidean_heuristic)
+from algorithms.graph_generators import GRAPH_GENERATORS
+from algorithms.dp_steps import lcs_steps, matrix_chain_steps, new_table, new_chain_table
+from algorithms.compact_graph import CompactGraph
+from algorithms.floyd_warshall import from_graph, floyd_warshall_rounds, reconstruct_path
+from algorithms.knapsack import knapsack_rounds, random_items, value_dtype, choice_table, reconstruct_items
+from algorithms.lcs import lcs, lcs_length, is_subsequence
+from algorithms.matrix_chain import chain_dp, hu_shing, chain_cost
+from algorithms.backtracking_steps import maze_steps, subset_sum_steps
+from algorithms.sudoku import sudoku_steps, solve_batch, shuffled, parse, is_solved, SUDOKU_PUZZLE, PUZZLES
+from algorithms.nqueens import queens_steps, is_solution, count_solutions, SOLUTION_COUNTS
+
+# -----------------------------------------------------
+# 📋 Headless Benchmark Cases
+# -----------------------------------------------------
+# The inputs and setups benchmark.py runs. registry.py names the case and
+# default sizes of each algorithm; the input distributions are per
+# category (SORT_DISTRIBUTIONS, GRAPH_KINDS below).
+# -----------------------------------------------------
+# 🎲 Inputs
+# -----------------------------------------------------
+def make_array(n, rng, distribution="random"):
+    if distribution == "sorted":
+        return sorted(rng.randint(0, n) for _ in range(n))
+    if distribution == "reversed":
+        return sorted((rng.randint(0, n) for _ in range(n)), reverse=True)
+    if distribution == "few_unique":
+        return [rng.randint(0, 9) for _ in range(n)]
+    return [rng.randint(0, n) for _ in range(n)]
+
+
+def is_sorted(arr):
+    return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
+
+
+def reachable(graph, start):
+    """The nodes reachable from start, found by expanding whole frontiers on the CSR arrays."""
+    seen = np.zeros(len(graph), dtype=bool)
+    seen[start] = True
+    frontier = np.array([start])
+    while len(frontier):
+        starts = graph.offsets[frontier]
+        counts = graph.offsets[frontier + 1] - starts
+        ends = np.cumsum(counts)
+        neighbours = graph.targets[np.arange(int(ends[-1])) + np.repeat(starts - (ends - counts), counts)]
+        frontier = np.unique(neighbours[~seen[neighbours]])
+        seen[frontier] = True
+    return set(np.flatnonzero(seen).tolist())
+
+
+def capture(steps, result):
+    """Runs a step generator unchanged, storing its return value in result["value"]."""
+    result["value"] = yield from steps
+
+
+# -----------------------------------------------------
+# 🧪 Cases
+# -----------------------------------------------------
+# Each setup(n, rng, distribution) returns (steps, check); check() is run
+# after the steps are drained and must return True.
+def sorting_case(name):
+    def setup(n, rng, distribution):
+        arr = make_array(n, rng, distribution)
+        return SORTING_STEPS[name](arr), lambda: is_sorted(arr)
+    return setup
+
+
+def linear_search_case(n, rng, distribution):
+    arr = make_array(n, rng)
+    target = rng.randint(0, n)
+    result = {}
+    expected = arr.index(target) if target in arr else None
+    return capture(linear_search_steps(arr, target), result), lambda: result["value"] == expected
+
+
+def binary_search_case(n, rng, distribution):
+    # with duplicates any matching index will do, so only presence is compared with bisect
+    arr = make_array(n, rng, "sorted")
+    target = rng.randint(0, n)
+    result = {}
+    i = bisect.bisect_left(arr, target)
+    present = i < len(arr) and arr[i] == target
+
+    def check():
+        found = result["value"]
+        return arr[found] == target if present else found is None
+
+    return capture(binary_search_steps(arr, target), result), check
+
+
+GRAPH_STEPS = {"BFS": bfs_steps, "DFS": dfs_steps, "Dijkstra": dijkstra_steps}
+
+
+def graph_case(name):
+    # for graphs the "distribution" is the generator (G(n,p), Geometric, Grid, ...)
+    steps_for = GRAPH_STEPS[name]
+
+    def setup(n, rng, distribution):
+        graph = GRAPH_GENERATORS[distribution](n, seed=rng.randrange(2 ** 32))
+        if name == "Dijkstra":
+            dist = [math.inf] * n
+            steps = steps_for(graph, 0, dist)
+
+            def visited():
+                return {v for v, d in enumerate(dist) if d < math.inf}
+        else:
+            seen = set()
+            steps = steps_for(graph, 0, seen)
+
+            def visited():
+                return seen
+        return steps, lambda: visited() == reachable(graph, 0)
+    return setup
+
+
+def shortest_path_case(mode):
+    # a point-to-point query between random nodes; check() re-answers it with plain Dijkstra
+    def setup(n, rng, distribution):
+        graph = GRAPH_GENERATORS[distribution](n, seed=rng.randrange(2 ** 32))
+        start, target = rng.randrange(n), rng.randrange(n)
+        if mode == "A*":
+            steps = astar_steps(graph, start, target, euclidean_heuristic(graph, target))
+        elif mode == "Bidirectional Dijkstra":
+            steps = bidirectional_dijkstra_steps(graph, start, target)
+        else:
+            steps = dijkstra_steps(graph, start, target=target)
+        result = []
+
+        def run():
+            result.append((yield from steps))
+
+        def check():
+            expected = run_headless_result(dijkstra_steps(graph, start, target=target))
+            return (result[0] and result[0][0]) == (expected and expected[0])
+        return run(), check
+    return setup
+
+
+def run_headless_result(steps):
+    """Drains a step generator and returns its return value."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+def floyd_warshall_case(n, rng, distribution):
+    arcs = 8 * n
+    src = [rng.randrange(n) for _ in range(arcs)]
+    dst = [rng.randrange(n) for _ in range(arcs)]
+    weights = [rng.randint(1, 99) for _ in range(arcs)]
+    graph = CompactGraph.from_edges(n, src, dst, weights, undirected=False)
+    dist, nxt = from_graph(graph, dtype="float32")
+    start, end = src[0], dst[0]
+
+    def check():
+        # the path rebuilt from nxt adds up, and start's row matches plain Dijkstra
+        path = reconstruct_path(nxt, start, end)
+        first, _ = from_graph(graph, dtype="float32")
+        expected = [math.inf] * n
+        run_headless_result(dijkstra_steps(graph, start, expected))
+        return bool(dist[start, end] == sum(first[a, b] for a, b in zip(path, path[1:]))
+                    and np.array_equal(dist[start], np.array(expected, dtype=np.float32)))
+
+    return floyd_warshall_rounds(dist, nxt), check
+
+
+def knapsack_table_best(weights, values, capacity):
+    """The textbook 2-D DP, kept a row at a time: row i is built fresh from row i - 1 only."""
+    prev = np.zeros(capacity + 1, dtype=np.int64)
+    for w, v in zip(weights, values):
+        row = prev.copy()
+        if w <= capacity:
+            row[w:] = np.maximum(prev[w:], prev[:capacity + 1 - w] + v)
+        prev = row
+    return int(prev[-1])
+
+
+def knapsack_case(n, rng, distribution):
+    capacity = 100 * n
+    weights, values = random_items(n, capacity, rng)
+    dp = np.zeros(capacity + 1, dtype=value_dtype(values))
+    choices = choice_table(n, capacity)
+
+    def check():
+        chosen = reconstruct_items(weights, choices, capacity)
+        return bool(sum(weights[i] for i in chosen) <= capacity
+                    and sum(values[i] for i in chosen) == dp[-1] == knapsack_table_best(weights, values, capacity))
+
+    return knapsack_rounds(weights, values, dp, choices), check
+
+
+def lcs_case(n, rng, distribution):
+    X = "".join(rng.choice("ACGT") for _ in range(n))
+    Y = "".join(rng.choice("ACGT") for _ in range(n))
+    dp = new_table(n + 1, n + 1)
+    return lcs_steps(X, Y, dp), lambda: dp[n][n] == lcs_length(X, Y)
+
+
+def lcs_engine_case(mode):
+    """The linear-space engines in algorithms/lcs.py, run as one step."""
+    def setup(n, rng, distribution):
+        X = "".join(rng.choice("ACGT") for _ in range(n))
+        Y = "".join(rng.choice("ACGT") for _ in range(n))
+        result = {}
+
+        def steps():
+            result["lcs"] = lcs(X, Y, mode)
+            yield Step(WRITE, n, n, result["lcs"])
+
+        def check():
+            if mode == "bit-parallel":
+                # the length must be reached by an actual common subsequence
+                found = lcs(X, Y, "hirschberg")
+                return (result["lcs"] == len(found)
+                        and is_subsequence(found, X) and is_subsequence(found, Y))
+            found = result["lcs"]
+            return len(found) == lcs_length(X, Y) and is_subsequence(found, X) and is_subsequence(found, Y)
+
+        return steps(), check
+    return setup
+
+
+def matrix_chain_case(n, rng, distribution):
+    dims = [rng.randint(5, 50) for _ in range(n + 1)]
+    m = new_chain_table(n)
+    return matrix_chain_steps(dims, m), lambda: bool(m[0][n - 1] == chain_dp(dims)[0])
+
+
+def matrix_chain_engine_case(solver):
+    """chain_dp or hu_shing from algorithms/matrix_chain.py, run as one step."""
+    solve = {"dp": chain_dp, "hu-shing": hu_shing}[solver]
+
+    def setup(n, rng, distribution):
+        dims = [rng.randint(1, 1000) for _ in range(n + 1)]
+        result = {}
+
+        def steps():
+            result["cost"], result["split"] = solve(dims)
+            yield Step(WRITE, 0, n - 1, result["cost"])
+
+        return steps(), lambda: chain_cost(dims, result["split"]) == result["cost"]
+    return setup
+
+
+def nqueens_case(n, rng, distribution):
+    cols = [None] * n
+    return queens_steps(n, cols), lambda: is_solution(cols)
+
+
+def nqueens_count_case(n, rng, distribution):
+    """Every solution, counted by the array engine in algorithms/nqueens.py as one step."""
+    result = {}
+
+    def steps():
+        result["solutions"], result["nodes"] = count_solutions(n)
+        yield Step(WRITE, n, result["nodes"], result["solutions"])
+
+    return steps(), lambda: n >= len(SOLUTION_COUNTS) or result["solutions"] == SOLUTION_COUNTS[n]
+
+
+def sudoku_case(n, rng, distribution):
+    grid = [row[:] for row in SUDOKU_PUZZLE]
+    puzzle = [d for row in SUDOKU_PUZZLE for d in row]
+    return sudoku_steps(grid), lambda: is_solved(puzzle, [d for row in grid for d in row])
+
+
+def sudoku_batch_case(method):
+    """n shuffled copies of the built-in puzzles, solved by algorithms/sudoku.py as one step."""
+    def setup(n, rng, distribution):
+        bases = [parse(line) for line in PUZZLES.values()]
+        puzzles = [shuffled(rng.choice(bases), rng) for _ in range(n)]
+        result = {}
+
+        def steps():
+            result["solutions"] = solve_batch(puzzles, method)
+            yield Step(WRITE, n, None, n)
+
+        return steps(), lambda: all(map(is_solved, puzzles, result["solutions"]))
+    return setup
+
+
+def make_maze(n, rng, open_chance=0.4):
+    """n x n grid of 1 (open) / 0 (wall) with a random down/right path kept open.
+
+    Denser mazes make the unmemoized search blow up on some seeds.
+    """
+    maze = [[1 if rng.random() < open_chance else 0 for _ in range(n)] for _ in range(n)]
+    x = y = 0
+    maze[0][0] = 1
+    while (x, y) != (n - 1, n - 1):
+        if y == n - 1 or (x < n - 1 and rng.random() < 0.5):
+            x += 1
+        else:
+            y += 1
+        maze[x][y] = 1
+    return maze
+
+
+def maze_case(n, rng, distribution):
+    maze = make_maze(n, rng)
+    original = [row[:] for row in maze]
+    path = []
+    result = {}
+
+    def check():
+        # a chain of down / right moves over open cells from corner to corner
+        moves = {(b[0] - a[0], b[1] - a[1]) for a, b in zip(path, path[1:])}
+        return bool(result["value"] and path[0] == (0, 0) and path[-1] == (n - 1, n - 1)
+                    and moves <= {(1, 0), (0, 1)} and all(original[i][j] for i, j in path))
+
+    return capture(maze_steps(maze, 0, 0, path), result), check
+
+
+def subset_sum_case(n, rng, distribution):
+    # a target above the total is never reached or pruned, so the whole tree is searched
+    arr = [rng.randint(1, 50) for _ in range(n)]
+    chosen = [False] * n
+    result = {}
+    steps = capture(subset_sum_steps(arr, sum(arr) + 1, chosen), result)
+    return steps, lambda: result["value"] is False and not any(chosen)
+
+
+SORT_DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique")
+GRAPH_KINDS = tuple(GRAPH_GENERATORS)
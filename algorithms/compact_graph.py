@@ -0,0 +1,115 @@
+import numpy as np
+
+# ---------------------------------------------
+# Compact (CSR) Graph
+# ---------------------------------------------
+# Large graphs (10^5 - 10^7 edges) are stored as three flat NumPy arrays
+# instead of per-edge Python tuples: the neighbours of u are
+# targets[offsets[u]:offsets[u + 1]] with matching weights. Indexing the
+# graph, graph[u], yields (v, weight) pairs, so it plugs straight into the
+# step generators in algorithms/graph_steps.py.
+#
+# Generated graphs also carry node positions (xs, ys in the unit square)
+# and `scale`: every edge weight is at least scale * its Euclidean length,
+# so scale * straight-line distance never overestimates a path.
+# Graphs loaded from files (algorithms/graph_loaders.py) may be directed;
+# reverse() gives the graph a backward search walks.
+
+
+# indices added to the sort keys per np.arange, so no full-length index array is made
+ORDER_CHUNK = 1 << 20
+
+
+def stable_order(keys, n):
+    """argsort(keys, kind="stable") for ints in [0, n), several times faster on 10^7 keys.
+
+    Sorting the unique values key * m + index is an unstable-but-fast sort
+    that still comes out in stable order; the remainder is the index. The
+    order comes back as int32 when m fits, and the only full-length
+    temporary is the int64 array being sorted.
+    """
+    m = len(keys)
+    if m == 0 or n * m >= 2 ** 62:
+        return np.argsort(keys, kind="stable")
+    combined = keys.astype(np.int64)
+    combined *= m
+    for start in range(0, m, ORDER_CHUNK):
+        combined[start:start + ORDER_CHUNK] += np.arange(start, min(start + ORDER_CHUNK, m))
+    combined.sort()
+    order = np.empty(m, dtype=np.int32 if m <= np.iinfo(np.int32).max else np.int64)
+    return np.remainder(combined, m, out=order, casting="unsafe")
+
+
+class CompactGraph:
+    def __init__(self, offsets, targets, weights, xs=None, ys=None, scale=None, directed=False):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.xs = xs
+        self.ys = ys
+        self.scale = scale
+        self.directed = directed
+
+    @classmethod
+    def from_edges(cls, n, src, dst, weights, xs=None, ys=None, scale=None, undirected=True):
+        """Builds the CSR arrays from parallel edge arrays (each undirected edge listed once).
+
+        Integer arrays are used as given (int32 ids from the file loaders stay
+        int32), which keeps the peak memory of a 10^7-edge build down.
+        """
+        src = np.asarray(src)
+        dst = np.asarray(dst)
+        weights = np.asarray(weights)
+        # each doubled (both directions) array is made just before it is gathered and
+        # dropped right after, so at most one of them is alive next to the order
+        keys = np.concatenate((src, dst)) if undirected else src
+        order = stable_order(keys, n)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=n), out=offsets[1:])
+        del keys
+        targets = (np.concatenate((dst, src)) if undirected else dst)[order].astype(np.int32, copy=False)
+        weights = (np.concatenate((weights, weights)) if undirected else weights)[order]
+        return cls(offsets, targets, weights, xs, ys, scale, not undirected)
+
+    def reverse(self):
+        """The graph with every arc flipped; an undirected graph is its own reverse."""
+        if not self.directed:
+            return self
+        src = np.repeat(np.arange(len(self), dtype=np.int32), self.degrees())
+        return CompactGraph.from_edges(len(self), self.targets, src, self.weights,
+                                       self.xs, self.ys, self.scale, undirected=False)
+
+    # ---------- adjacency ----------
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, u):
+        a, b = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[a:b].tolist(), self.weights[a:b].tolist())
+
+    @property
+    def num_nodes(self):
+        return len(self)
+
+    @property
+    def num_arcs(self):
+        """Directed adjacency entries (an undirected edge counts twice)."""
+        return len(self.targets)
+
+    def degrees(self):
+        return np.diff(self.offsets)
+
+    def edge_arrays(self):
+        """(src, dst, weight) arrays with each undirected edge once (src < dst), for drawing.
+
+        A directed graph returns every arc.
+        """
+        src = np.repeat(np.arange(len(self), dtype=np.int32), self.degrees())
+        if self.directed:
+            return src, self.targets, self.weights
+        keep = src < self.targets
+        return src[keep], self.targets[keep], self.weights[keep]
+
+    def edges(self):
+        """(a, b, w) tuples, each undirected edge once; meant for small graphs only."""
+        return list(zip(*(a.tolist() for a in self.edge_arrays())))
@@ -0,0 +1,50 @@
+import math
+from algorithms.steps import Step, COMPARE, WRITE
+
+# ---------------------------------------------
+# Dynamic Programming as Step Generators
+# ---------------------------------------------
+# Every generator fills a caller-owned table in place. Steps use
+# a = row, b = column, so a visualizer highlights cell (step.a, step.b).
+# The engines for large inputs live in their own modules:
+# algorithms/floyd_warshall.py, knapsack.py, lcs.py and matrix_chain.py.
+
+
+def lcs_steps(X, Y, dp):
+    """dp must be an (m+1) x (n+1) table of zeros."""
+    m, n = len(X), len(Y)
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            yield Step(COMPARE, i, j)
+            if X[i - 1] == Y[j - 1]:
+                dp[i][j] = dp[i - 1][j - 1] + 1
+            else:
+                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+            yield Step(WRITE, i, j, dp[i][j])
+
+
+def matrix_chain_steps(dims, m, split=None):
+    """m must be an n x n table with 0 on the diagonal and inf elsewhere.
+
+    split, an n x n table, records the best k for each (i, j).
+    """
+    n = len(dims) - 1
+    for L in range(2, n + 1):
+        for i in range(n - L + 1):
+            j = i + L - 1
+            for k in range(i, j):
+                yield Step(COMPARE, i, j, k)
+                q = m[i][k] + m[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                if q < m[i][j]:
+                    m[i][j] = q
+                    if split is not None:
+                        split[i][j] = k
+                    yield Step(WRITE, i, j, q)
+
+
+def new_table(rows, cols, fill=0):
+    return [[fill] * cols for _ in range(rows)]
+
+
+def new_chain_table(n):
+    return [[0 if i == j else math.inf for j in range(n)] for i in range(n)]
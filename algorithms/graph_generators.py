@@ -0,0 +1,194 @@
+import math
+import random
+import numpy as np
+from algorithms.compact_graph import CompactGraph
+
+# ---------------------------------------------
+# Scalable Seeded Random Graph Generators
+# ---------------------------------------------
+# Every generator is O(V + E), takes a seed and returns a CompactGraph with
+# node positions in the unit square, so the same call always builds the
+# same graph and 10^6-node graphs take seconds rather than the O(V^2) of
+# testing every pair.
+#
+#   gnp_graph               Erdős–Rényi G(n, p), geometric skipping over pairs
+#   random_geometric_graph  points joined within a radius, found by grid hashing
+#   grid_graph              jittered lattice, road-network-like
+#   barabasi_albert_graph   preferential attachment (scale-free hubs)
+#
+# Edge weights are ceil(scale * length * detour), detour in [1, 2), so
+# every weight is at least scale * Euclidean length (see CompactGraph).
+# scale grows with sqrt(n), which keeps typical weights in the tens at any
+# size.
+
+WEIGHT_UNITS = 10
+
+
+def weight_scale(n):
+    return WEIGHT_UNITS * math.sqrt(max(n, 1))
+
+
+def edge_weights(xs, ys, src, dst, rng, scale):
+    length = np.hypot(xs[src] - xs[dst], ys[src] - ys[dst])
+    detour = rng.uniform(1.0, 2.0, size=len(src))
+    return np.maximum(1, np.ceil(scale * length * detour)).astype(np.int32)
+
+
+def jittered_grid(n, rng, jitter=0.6):
+    """n points, one per cell of a near-square grid, so small layouts never overlap."""
+    cols = max(1, math.ceil(math.sqrt(n)))
+    rows = math.ceil(n / cols)
+    i = np.arange(n)
+    xs = (i % cols + 0.5 + rng.uniform(-jitter / 2, jitter / 2, n)) / cols
+    ys = (i // cols + 0.5 + rng.uniform(-jitter / 2, jitter / 2, n)) / rows
+    return xs, ys
+
+
+def _finish(n, src, dst, xs, ys, rng):
+    scale = weight_scale(n)
+    weights = edge_weights(xs, ys, src, dst, rng, scale)
+    return CompactGraph.from_edges(n, src, dst, weights, xs.astype(np.float32), ys.astype(np.float32), scale)
+
+
+def _ranges(starts, counts):
+    """Concatenation of arange(s, s + c) for each (s, c), without a Python loop."""
+    ends = np.cumsum(counts)
+    return np.arange(int(ends[-1]) if len(ends) else 0) + np.repeat(starts - (ends - counts), counts)
+
+
+# ---------- Erdős–Rényi ----------
+def gnp_graph(n, p=None, avg_degree=4, seed=None):
+    """G(n, p): each of the n(n-1)/2 pairs is an edge with probability p.
+
+    Instead of flipping a coin per pair, the gap to the next edge is drawn
+    from a geometric distribution (Batagelj & Brandes), so the cost is
+    O(V + E). p defaults to avg_degree / (n - 1).
+    """
+    rng = np.random.default_rng(seed)
+    pairs = n * (n - 1) // 2
+    if p is None:
+        p = min(1.0, avg_degree / max(n - 1, 1))
+
+    chunks = []
+    if p > 0 and pairs:
+        pos = -1
+        batch = int(p * pairs * 1.05) + 64
+        while pos < pairs:
+            k = pos + np.cumsum(rng.geometric(p, size=batch))
+            chunks.append(k[k < pairs])
+            pos = int(k[-1])
+    k = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+    # pair index k -> (i, j), i < j, rows of the upper triangle laid end to end
+    b = 2 * n - 1
+    i = np.floor((b - np.sqrt(b * b - 8.0 * k)) / 2).astype(np.int64)
+    row_start = i * (b - i) // 2
+    i -= row_start > k  # float rounding can land one row too far either way
+    row_start = i * (b - i) // 2
+    over = k - row_start >= n - 1 - i
+    i += over
+    row_start = i * (b - i) // 2
+    j = k - row_start + i + 1
+
+    xs, ys = jittered_grid(n, rng)
+    return _finish(n, i, j, xs, ys, rng)
+
+
+# ---------- random geometric ----------
+def random_geometric_graph(n, radius=None, avg_degree=6, seed=None):
+    """Uniform points joined when closer than radius (default gives ~avg_degree neighbours).
+
+    Points are hashed into square cells of side radius, so candidate pairs
+    come only from a cell and its neighbours: O(V + E) expected.
+    """
+    rng = np.random.default_rng(seed)
+    xs, ys = rng.random(n), rng.random(n)
+    if radius is None:
+        radius = math.sqrt(avg_degree / (math.pi * max(n, 1)))
+    cells = max(1, int(1 / radius))
+    cx = np.minimum((xs * cells).astype(np.int64), cells - 1)
+    cy = np.minimum((ys * cells).astype(np.int64), cells - 1)
+    cell = cy * cells + cx
+
+    order = np.argsort(cell, kind="stable")
+    counts = np.bincount(cell, minlength=cells * cells)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    src_parts, dst_parts = [], []
+    # each unordered pair of neighbouring cells is visited from one side only
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        nx, ny = cx + dx, cy + dy
+        ok = (nx >= 0) & (nx < cells) & (ny < cells)
+        a = np.flatnonzero(ok)
+        other = ny[a] * cells + nx[a]
+        a = np.repeat(a, counts[other])
+        b = order[_ranges(starts[other], counts[other])]
+        keep = np.hypot(xs[a] - xs[b], ys[a] - ys[b]) <= radius
+        if dx == 0 and dy == 0:
+            keep &= a < b
+        src_parts.append(a[keep])
+        dst_parts.append(b[keep])
+
+    return _finish(n, np.concatenate(src_parts), np.concatenate(dst_parts), xs, ys, rng)
+
+
+# ---------- grid / road-like ----------
+def grid_graph(n, seed=None, jitter=0.5, diagonals=0.0):
+    """n nodes on a jittered near-square lattice joined to their right/down neighbours.
+
+    diagonals: share of cells that also get one diagonal shortcut.
+    """
+    rng = np.random.default_rng(seed)
+    cols = max(1, math.ceil(math.sqrt(n)))
+    xs, ys = jittered_grid(n, rng, jitter)
+    i = np.arange(n)
+    right = i[(i % cols < cols - 1) & (i + 1 < n)]
+    down = i[i + cols < n]
+    src, dst = [right, down], [right + 1, down + cols]
+    if diagonals:
+        diag = i[(i % cols < cols - 1) & (i + cols + 1 < n)]
+        diag = diag[rng.random(len(diag)) < diagonals]
+        src.append(diag)
+        dst.append(diag + cols + 1)
+    return _finish(n, np.concatenate(src), np.concatenate(dst), xs, ys, rng)
+
+
+# ---------- Barabási–Albert ----------
+def barabasi_albert_graph(n, m=2, seed=None):
+    """Preferential attachment: every new node links to m existing ones, chosen by degree.
+
+    Picking a uniform entry of the list of all edge endpoints picks a node
+    with probability proportional to its degree, so each node costs O(m).
+    """
+    rng = np.random.default_rng(seed)
+    pick = random.Random(seed)
+    m = max(1, min(m, n - 1))
+    src, dst = [], []
+    # start from a small clique on m + 1 nodes
+    for a in range(min(n, m + 1)):
+        for b in range(a + 1, min(n, m + 1)):
+            src.append(a)
+            dst.append(b)
+    endpoints = src + dst
+
+    for t in range(m + 1, n):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(endpoints[int(pick.random() * len(endpoints))])
+        for v in chosen:
+            src.append(t)
+            dst.append(v)
+            endpoints.append(t)
+            endpoints.append(v)
+
+    xs, ys = jittered_grid(n, rng)
+    return _finish(n, np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64), xs, ys, rng)
+
+
+# name -> generator(n, seed=...)
+GRAPH_GENERATORS = {
+    "G(n,p)": gnp_graph,
+    "Geometric": random_geometric_graph,
+    "Grid": grid_graph,
+    "Barabási–Albert": barabasi_albert_graph,
+}
@@ -0,0 +1,196 @@
+import math
+from collections import deque
+from algorithms.steps import Step, VISIT, RELAX
+from algorithms.indexed_heap import IndexedHeap
+
+# ---------------------------------------------
+# Graph Algorithms as Step Generators
+# ---------------------------------------------
+# `adj[u]` is any iterable of (v, weight) pairs, so a plain list of lists
+# from build_adjacency() works just as well as a CompactGraph
+# (algorithms/compact_graph.py) holding millions of edges.
+
+
+def build_adjacency(num_nodes, edges):
+    """Turns an (a, b, w) edge list into an adjacency list of (b, w) pairs."""
+    adj = [[] for _ in range(num_nodes)]
+    for (a, b, w) in edges:
+        adj[a].append((b, w))
+    return adj
+
+
+def bfs_steps(adj, start=0, visited=None):
+    if visited is None:
+        visited = set()
+    q = deque([start])
+    visited.add(start)
+
+    while q:
+        current = q.popleft()
+        yield Step(VISIT, current)
+        for neighbor, _ in adj[current]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                q.append(neighbor)
+
+
+def dfs_steps(adj, start=0, visited=None):
+    # Iterative, but visits nodes in exactly the order of the recursive DFS.
+    if visited is None:
+        visited = set()
+    visited.add(start)
+    yield Step(VISIT, start)
+    stack = [iter(adj[start])]
+
+    while stack:
+        for v, _ in stack[-1]:
+            if v not in visited:
+                visited.add(v)
+                yield Step(VISIT, v)
+                stack.append(iter(adj[v]))
+                break
+        else:
+            stack.pop()
+
+
+def reconstruct_path(parent, target):
+    """Follows parent links back from target; returns the path start -> target."""
+    path = [target]
+    while parent[path[-1]] is not None and parent[path[-1]] != path[-1]:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+def dijkstra_steps(adj, start=0, dist=None, target=None, parent=None):
+    """Yields VISIT when a node is settled and RELAX when a distance improves.
+
+    `dist` and `parent` (optional lists) are filled in place so callers can
+    read distances and paths. With a target the search stops once it is
+    settled and returns (distance, path); it returns None if unreachable.
+    Uses an indexed heap with decrease-key, so no stale entries are popped.
+    """
+    n = len(adj)
+    if dist is None:
+        dist = [math.inf] * n
+    if parent is None:
+        parent = [None] * n
+    dist[start] = 0
+    parent[start] = start
+    heap = IndexedHeap(n)
+    heap.push(start, 0)
+
+    while heap:
+        u, d = heap.pop()
+        yield Step(VISIT, u, value=d)
+        if u == target:
+            return d, reconstruct_path(parent, target)
+
+        for v, w in adj[u]:
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                heap.push(v, nd)
+                yield Step(RELAX, u, v, nd)
+    return None
+
+
+# ---------------------------------------------
+# Point-to-Point Shortest Paths
+# ---------------------------------------------
+def euclidean_heuristic(graph, target):
+    """h(v) = straight-line distance to target in weight units (CompactGraph positions).
+
+    Never overestimates because every weight is at least graph.scale times
+    the edge's length; the tiny factor absorbs float32 position rounding.
+    """
+    import numpy as np
+    xs, ys = graph.xs.astype(np.float64), graph.ys.astype(np.float64)
+    h = np.hypot(xs - xs[target], ys - ys[target]) * (graph.scale * (1 - 1e-6))
+    return h.tolist()
+
+
+def astar_steps(adj, start, target, h, dist=None, parent=None):
+    """A*: Dijkstra ordered by dist + h[v]; settles only nodes that look like they lead to target.
+
+    h: list (or indexable) of admissible estimates of the distance to
+    target. Same steps and return value as dijkstra_steps(..., target).
+    """
+    n = len(adj)
+    if dist is None:
+        dist = [math.inf] * n
+    if parent is None:
+        parent = [None] * n
+    dist[start] = 0
+    parent[start] = start
+    heap = IndexedHeap(n)
+    heap.push(start, h[start])
+    closed = set()
+
+    while heap:
+        u, _ = heap.pop()
+        d = dist[u]
+        closed.add(u)
+        yield Step(VISIT, u, value=d)
+        if u == target:
+            return d, reconstruct_path(parent, target)
+
+        for v, w in adj[u]:
+            nd = d + w
+            if nd < dist[v] and v not in closed:
+                dist[v] = nd
+                parent[v] = u
+                heap.push(v, nd + h[v])
+                yield Step(RELAX, u, v, nd)
+    return None
+
+
+def bidirectional_dijkstra_steps(adj, start, target, radj=None):
+    """Dijkstra from both ends at once, always growing the side whose frontier is closer.
+
+    Stops when the two frontier minima add up to at least the best path
+    seen through any meeting edge. VISIT steps carry the side in b
+    (0 = from start, 1 = from target). radj is the reverse graph (defaults
+    to adj, right for undirected graphs). Returns (distance, path) or None.
+    """
+    n = len(adj)
+    graphs = (adj, adj if radj is None else radj)
+    dist = ([math.inf] * n, [math.inf] * n)
+    parent = ([None] * n, [None] * n)
+    heaps = (IndexedHeap(n), IndexedHeap(n))
+    settled = (set(), set())
+    for side, source in ((0, start), (1, target)):
+        dist[side][source] = 0
+        parent[side][source] = source
+        heaps[side].push(source, 0)
+
+    best, meet = math.inf, None
+    if start == target:
+        best, meet = 0, start
+
+    while heaps[0] and heaps[1]:
+        if heaps[0].peek()[1] + heaps[1].peek()[1] >= best:
+            break
+        side = 0 if heaps[0].peek()[1] <= heaps[1].peek()[1] else 1
+        u, d = heaps[side].pop()
+        settled[side].add(u)
+        yield Step(VISIT, u, side, d)
+
+        other = dist[1 - side]
+        for v, w in graphs[side][u]:
+            nd = d + w
+            if nd < dist[side][v]:
+                dist[side][v] = nd
+                parent[side][v] = u
+                heaps[side].push(v, nd)
+                # every improvement on either side re-checks the path through v
+                if nd + other[v] < best:
+                    best, meet = nd + other[v], v
+                yield Step(RELAX, u, v, nd)
+
+    if meet is None:
+        return None
+    forward = reconstruct_path(parent[0], meet)
+    backward = reconstruct_path(parent[1], meet)
+    return best, forward + backward[-2::-1]
@@ -0,0 +1,88 @@
+# ---------------------------------------------
+# Indexed Binary Heap (real decrease-key)
+# ---------------------------------------------
+# A min-heap over the integer items 0..n-1 that also records where each item
+# sits, so lowering an item's priority moves it up in place instead of
+# pushing a duplicate entry. The heap therefore never holds more than one
+# entry per node, and nothing stale is ever popped and skipped.
+
+
+class IndexedHeap:
+    def __init__(self, n):
+        self.items = []  # heap order
+        self.prio = []  # prio[k] is the priority of items[k]
+        self.pos = [-1] * n  # item -> index in items, -1 when absent
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return self.pos[item] >= 0
+
+    def priority(self, item):
+        return self.prio[self.pos[item]]
+
+    def peek(self):
+        """(item, priority) with the smallest priority, without removing it."""
+        return self.items[0], self.prio[0]
+
+    def push(self, item, priority):
+        """Adds item, or lowers its priority if it is already queued; returns True if it changed."""
+        k = self.pos[item]
+        if k < 0:
+            self.items.append(item)
+            self.prio.append(priority)
+            k = len(self.items) - 1
+            self.pos[item] = k
+        elif priority < self.prio[k]:
+            self.prio[k] = priority
+        else:
+            return False
+        self._sift_up(k)
+        return True
+
+    decrease_key = push
+
+    def pop(self):
+        """Removes and returns (item, priority) with the smallest priority."""
+        items, prio = self.items, self.prio
+        item, priority = items[0], prio[0]
+        last_item, last_prio = items.pop(), prio.pop()
+        self.pos[item] = -1
+        if items:
+            items[0], prio[0] = last_item, last_prio
+            self.pos[last_item] = 0
+            self._sift_down(0)
+        return item, priority
+
+    # ---------- sifting ----------
+    def _sift_up(self, k):
+        items, prio, pos = self.items, self.prio, self.pos
+        item, p = items[k], prio[k]
+        while k > 0:
+            parent = (k - 1) >> 1
+            if prio[parent] <= p:
+                break
+            items[k], prio[k] = items[parent], prio[parent]
+            pos[items[k]] = k
+            k = parent
+        items[k], prio[k] = item, p
+        pos[item] = k
+
+    def _sift_down(self, k):
+        items, prio, pos = self.items, self.prio, self.pos
+        n = len(items)
+        item, p = items[k], prio[k]
+        while True:
+            child = 2 * k + 1
+            if child >= n:
+                break
+            if child + 1 < n and prio[child + 1] < prio[child]:
+                child += 1
+            if prio[child] >= p:
+                break
+            items[k], prio[k] = items[child], prio[child]
+            pos[items[k]] = k
+            k = child
+        items[k], prio[k] = item, p
+        pos[item] = k
@@ -0,0 +1,164 @@
+import argparse
+import random
+import time
+
+import numpy as np
+from algorithms.steps import Step, WRITE
+
+# ---------------------------------------------
+# 0/1 Knapsack on a Rolling 1-D Array
+# ---------------------------------------------
+# dp[c] is the best value of the items added so far within capacity c.
+# Adding an item of weight w and value v is one vectorized update:
+#
+#   dp[w:] = max(dp[w:], dp[:-w] + v)
+#
+# with the right-hand side read before anything is written, so every item
+# is used at most once. Only this one row of W + 1 values is kept instead
+# of the (n + 1) x (W + 1) table.
+#
+# The chosen items are recovered in one of two ways:
+#
+#   "bits"   records, per item, whether it was taken at each capacity, packed
+#            8 capacities to a byte: n * W / 8 bytes, one pass over the items.
+#   "split"  divide and conquer: solve each half of the items for every
+#            capacity, find the capacity split where the halves' best values
+#            add up to the optimum, and recurse. O(W) memory, about twice the
+#            time.
+#
+# W = 10^6 with 100 items: the row is 4-8 MB, "bits" adds 12.5 MB and
+# "split" nothing; the full table would take gigabytes.
+
+METHODS = ("bits", "split")
+
+
+def value_dtype(values):
+    """int32 when the total value fits, so the rows take half the memory."""
+    return np.int32 if sum(values) < 2 ** 31 else np.int64
+
+
+def choice_table(n, capacity):
+    """Packed take/skip bits: row i, bit c says item i was taken at capacity c."""
+    return np.zeros((n, capacity // 8 + 1), dtype=np.uint8)
+
+
+def took(choices, i, c):
+    return bool((choices[i, c >> 3] >> (7 - (c & 7))) & 1)
+
+
+def knapsack_rounds(weights, values, dp, choices=None):
+    """Adds the items to dp one at a time, yielding Step(WRITE, i, w, best) after each.
+
+    dp must be zeros of length W + 1; choices, if given, a choice_table(n, W).
+    """
+    size = len(dp)
+    tmp = np.empty_like(dp)
+    take = np.zeros(size, dtype=bool)
+    for i, (w, v) in enumerate(zip(weights, values)):
+        if w < size:
+            np.add(dp[:size - w], v, out=tmp[w:])
+            np.greater(tmp[w:], dp[w:], out=take[w:])
+            np.copyto(dp[w:], tmp[w:], where=take[w:])
+            if choices is not None:
+                take[:w] = False  # left over from lighter items
+                choices[i] = np.packbits(take)
+        yield Step(WRITE, i, w, dp[-1].item())
+
+
+def best_row(weights, values, capacity, dtype=np.int64):
+    """dp after every item: the best value at each capacity 0..capacity."""
+    dp = np.zeros(capacity + 1, dtype=dtype)
+    for _ in knapsack_rounds(weights, values, dp):
+        pass
+    return dp
+
+
+def reconstruct_items(weights, choices, capacity):
+    """Chosen item indices, read back from the choice table."""
+    items = []
+    for i in range(len(weights) - 1, -1, -1):
+        if took(choices, i, capacity):
+            items.append(i)
+            capacity -= weights[i]
+    return items[::-1]
+
+
+def _split(weights, values, items, capacity, dtype, chosen):
+    if not items or capacity < 0:
+        return
+    if len(items) == 1:
+        i = items[0]
+        if weights[i] <= capacity and values[i] > 0:
+            chosen.append(i)
+        return
+    mid = len(items) // 2
+    left, right = items[:mid], items[mid:]
+    best = best_row([weights[i] for i in left], [values[i] for i in left], capacity, dtype)
+    best += best_row([weights[i] for i in right], [values[i] for i in right], capacity, dtype)[::-1]
+    c = int(np.argmax(best))
+    del best
+    _split(weights, values, left, c, dtype, chosen)
+    _split(weights, values, right, capacity - c, dtype, chosen)
+
+
+def knapsack(weights, values, capacity, method="bits"):
+    """(best value, chosen item indices)."""
+    dtype = value_dtype(values)
+    if method == "split":
+        chosen = []
+        _split(weights, values, list(range(len(weights))), capacity, dtype, chosen)
+        return sum(values[i] for i in chosen), chosen
+    if method != "bits":
+        raise ValueError(f"unknown reconstruction {method!r} (expected one of {METHODS})")
+    dp = np.zeros(capacity + 1, dtype=dtype)
+    choices = choice_table(len(weights), capacity)
+    for _ in knapsack_rounds(weights, values, dp, choices):
+        pass
+    return dp[-1].item(), reconstruct_items(weights, choices, capacity)
+
+
+def random_items(n, capacity, rng=random):
+    """n items weighing 1..capacity/4 with values roughly proportional to weight."""
+    top = max(1, capacity // 4)
+    weights = [rng.randint(1, top) for _ in range(n)]
+    values = [max(1, w + rng.randint(-w // 2, w // 2)) for w in weights]
+    return weights, values
+
+
+# -----------------------------------------------------
+# 🧪 Command Line
+# -----------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Solve a 0/1 knapsack and report the chosen items.")
+    parser.add_argument("--capacity", type=int, default=1_000_000)
+    parser.add_argument("--items", type=int, default=100, help="random item count")
+    parser.add_argument("--weights", help="comma-separated weights (with --values)")
+    parser.add_argument("--values", help="comma-separated values")
+    parser.add_argument("--method", choices=METHODS + ("both",), default="both")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.weights or args.values:
+        if not (args.weights and args.values):
+            parser.error("--weights and --values go together")
+        weights = [int(x) for x in args.weights.split(",")]
+        values = [int(x) for x in args.values.split(",")]
+        if len(weights) != len(values):
+            parser.error("--weights and --values need the same number of items")
+    else:
+        weights, values = random_items(args.items, args.capacity, random.Random(args.seed))
+    if min(weights) < 0 or args.capacity < 0:
+        parser.error("weights and capacity must not be negative")
+
+    for method in METHODS if args.method == "both" else (args.method,):
+        start = time.perf_counter()
+        best, chosen = knapsack(weights, values, args.capacity, method)
+        elapsed = time.perf_counter() - start
+        print(f"🎒 {method:5s} best value {best} with {len(chosen)} items "
+              f"(weight {sum(weights[i] for i in chosen)}/{args.capacity}) in {elapsed:.2f}s")
+    if len(chosen) <= 20:
+        print("   items:", ", ".join(map(str, chosen)))
+
+
+if __name__ == "__main__":
+    main()
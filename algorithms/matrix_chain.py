@@ -0,0 +1,327 @@
+import argparse
+import heapq
+import random
+import time
+from bisect import bisect_left
+from fractions import Fraction
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ---------------------------------------------
+# Matrix-Chain Ordering: O(n³) DP and Hu–Shing
+# ---------------------------------------------
+# Matrix k is dims[k] x dims[k + 1]. Both solvers return (cost, split), where
+# split[i, j] = k means the product of matrices i..j is computed as
+# (i..k)(k+1..j). A split is indexed like a 2-D array: the DP returns the
+# whole n x n table and Hu–Shing a dict with only the n - 1 splits it uses.
+#
+# chain_dp is the textbook table, one diagonal (chain length) at a time, with
+# every i and every split point of that length in one NumPy expression.
+#
+# hu_shing follows Hu & Shing's reduction to triangulating a polygon whose
+# vertices carry the dimensions; a triangle costs the product of its three
+# weights. Rotate the polygon so the lightest vertex V0 comes first:
+#
+#   - Potential h-arcs. An arc i-j with every vertex below it (on the side
+#     away from V0) heavier than both ends. They nest (never cross) and
+#     form a tree. One stack sweep finds them all.
+#   - Every optimal triangulation uses some of these arcs. The region between
+#     chosen arcs is fanned from its lightest vertex, which for the region
+#     under an arc is the arc's lighter end.
+#   - Whether an arc is worth keeping depends only on the weight x of the
+#     fan vertex of the region around it: it is kept when x >= its
+#     "supporting weight". The cost of a subtree as a function of x is
+#     concave and piecewise linear. It is built bottom-up as the linear
+#     piece above its breakpoints plus a max-heap of the breakpoints. The
+#     heaps are merged smaller-into-larger, and finding a supporting weight
+#     pops the breakpoints above it.
+#
+# That is O(n log² n) here; Hu and Shing's mergeable heaps give O(n log n).
+# Supporting weights are kept as exact fractions.
+
+
+# -----------------------------------------------------
+# 📐 O(n³) Dynamic Programming
+# -----------------------------------------------------
+def chain_dp(dims):
+    """(cost, split) with split an n x n array."""
+    n = len(dims) - 1
+    dtype = np.int64 if max(dims) ** 3 * n < 2 ** 62 else object
+    d = np.asarray(dims, dtype=dtype)
+    # by_start[i, t] = m[i][i + t], by_end[j, t] = m[j - t][j]: both are
+    # contiguous slices for one chain length
+    by_start = np.zeros((n, n), dtype=dtype)
+    by_end = np.zeros((n, n), dtype=dtype)
+    split = np.zeros((n, n), dtype=np.int32)
+    for L in range(2, n + 1):
+        count = n - L + 1
+        i = np.arange(count)
+        j = i + L - 1
+        cost = by_start[:count, :L - 1] + by_end[L - 1:, L - 2::-1]
+        cost += sliding_window_view(d[1:n], L - 1) * (d[:count] * d[L:])[:, None]
+        k = cost.argmin(axis=1)
+        best = cost[i, k]
+        by_start[i, L - 1] = best
+        by_end[j, L - 1] = best
+        split[i, j] = i + k
+    return (int(by_start[0, n - 1]) if n else 0), split
+
+
+# -----------------------------------------------------
+# 🔺 Hu–Shing
+# -----------------------------------------------------
+def potential_h_arcs(rank):
+    """Arcs (i, j), i < j, with every vertex strictly between ranked above both (V0 excluded)."""
+    arcs = []
+    stack = [0]
+    for j in range(1, len(rank)):
+        while rank[stack[-1]] > rank[j]:
+            stack.pop()
+            i = stack[-1]
+            if i > 0 and j - i > 1:
+                arcs.append((i, j))
+        stack.append(j)
+    return arcs
+
+
+def _merge(into, other):
+    """Merges two (heap, A, B) functions, smaller heap into larger."""
+    heap, A, B = into
+    other_heap, other_A, other_B = other
+    if len(other_heap) > len(heap):
+        heap, other_heap = other_heap, heap
+    for entry in other_heap:
+        heapq.heappush(heap, entry)
+    return [heap, A + other_A, B + other_B]
+
+
+def _drop_above(f, x):
+    """Folds breakpoints >= x into the linear piece: f is only evaluated below x."""
+    heap = f[0]
+    while heap and -heap[0][0] >= x:
+        t, delta = heapq.heappop(heap)
+        f[1] += delta * t  # t is negated: A - delta * breakpoint
+        f[2] += delta
+
+
+def hu_shing(dims):
+    """(cost, split) with split a dict of the n - 1 splits used."""
+    n = len(dims) - 1
+    if n < 2:
+        return 0, {}
+    N = n + 1
+    r = min(range(N), key=lambda v: (dims[v], v))
+    w = [dims[(r + p) % N] for p in range(N)]
+    order = sorted(range(N), key=lambda p: (w[p], p))
+    rank = [0] * N
+    for position, p in enumerate(order):
+        rank[p] = position
+    edges = [0]  # edges[p] = sum of w[q] * w[q + 1] for q < p
+    for p in range(N - 1):
+        edges.append(edges[-1] + w[p] * w[p + 1])
+
+    # the arc tree: preorder, so children come after their parent
+    arcs = sorted(potential_h_arcs(rank), key=lambda a: (a[0], -a[1]))
+    children = [[] for _ in range(len(arcs) + 1)]
+    root = len(arcs)
+    open_arcs = []
+    for c, (i, j) in enumerate(arcs):
+        while open_arcs and arcs[open_arcs[-1]][1] <= i:
+            open_arcs.pop()
+        children[open_arcs[-1] if open_arcs else root].append(c)
+        open_arcs.append(c)
+
+    # bottom-up: cost with the arc kept, supporting weight, cost function of x
+    kept_cost = [0] * len(arcs)
+    support = [None] * len(arcs)
+    function = [None] * len(arcs)
+    for c in range(len(arcs) - 1, -1, -1):
+        i, j = arcs[c]
+        lo = i if rank[i] < rank[j] else j
+        x = w[lo]
+        kids = children[c]
+        shared = None
+        if kids and lo == i and arcs[kids[0]][0] == i:
+            shared = kids[0]
+        elif kids and lo == j and arcs[kids[-1]][1] == j:
+            shared = kids[-1]
+
+        own = edges[j] - edges[i] - sum(edges[arcs[k][1]] - edges[arcs[k][0]] for k in kids)
+        if shared is not None:
+            own_incident = 0
+        else:
+            own_incident = w[i] * w[i + 1] if lo == i else w[j - 1] * w[j]
+
+        f = [[], 0, own]
+        for k in kids:
+            if k != shared:
+                f = _merge(f, function[k])
+                function[k] = None
+        _drop_above(f, x)
+        # the fan from lo skips lo's own edges; a child ending at lo costs the same kept or not
+        cost = f[1] + f[2] * x - x * own_incident
+        if shared is not None:
+            cost += kept_cost[shared]
+            f = _merge(f, function[shared])
+            function[shared] = None
+            _drop_above(f, x)
+        kept_cost[c] = cost
+
+        # supporting weight: where cost + x * w_i * w_j meets the subtree function
+        product = w[i] * w[j]
+        heap = f[0]
+        while True:
+            s = Fraction(cost - f[1], f[2] - product)
+            if heap and -heap[0][0] > s:
+                t, delta = heapq.heappop(heap)
+                f[1] += delta * t
+                f[2] += delta
+                continue
+            break
+        if s < x:
+            support[c] = s
+            heapq.heappush(heap, (-s, f[2] - product))
+            f[1], f[2] = cost, product
+        function[c] = f
+
+    # the root region, fanned from V0 (its two polygon edges skipped)
+    f = [[], 0, edges[N - 1] - edges[1] - sum(edges[arcs[k][1]] - edges[arcs[k][0]] for k in children[root])]
+    for k in children[root]:
+        f = _merge(f, function[k])
+    _drop_above(f, w[0])
+    total = f[1] + f[2] * w[0]
+
+    diagonals = _triangulation(arcs, children, rank, support, w, N)
+    split = _splits([tuple(sorted(((a + r) % N, (b + r) % N))) for a, b in diagonals], N)
+    return int(total), split
+
+
+def _triangulation(arcs, children, rank, support, w, N):
+    """Kept arcs plus the fan diagonals of every region (rotated positions)."""
+    diagonals = []
+    regions = [(0, N - 1, children[len(arcs)], 0)]  # (first, last, child arcs, fan vertex)
+    while regions:
+        first, last, kids, m = regions.pop()
+        boundary = []
+        stack = [(first, last, iter(kids))]
+        while stack:
+            start, end, it = stack[-1]
+            c = next(it, None)
+            if c is None:
+                boundary.extend(range(start, end))
+                stack.pop()
+                continue
+            i, j = arcs[c]
+            boundary.extend(range(start, i))
+            stack[-1] = (j, end, it)
+            if m in (i, j) or (support[c] is not None and support[c] <= w[m]):
+                boundary.append(i)
+                diagonals.append((i, j))
+                regions.append((i, j, children[c], i if rank[i] < rank[j] else j))
+            else:
+                stack.append((i, j, iter(children[c])))
+        boundary.append(last)
+
+        # fan from m to every boundary vertex except its two neighbours
+        at = boundary.index(m)
+        size = len(boundary)
+        for step in range(2, size - 1):
+            diagonals.append((m, boundary[(at + step) % size]))
+    return diagonals
+
+
+def _splits(diagonals, N):
+    """Split dict from a triangulation given as (a, b) vertex pairs, a < b."""
+    right = [[a + 1] for a in range(N)]
+    for a, b in diagonals:
+        right[a].append(b)
+    for r in right:
+        r.sort()
+    split = {}
+    stack = [(0, N - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        k = right[a][bisect_left(right[a], b) - 1]  # the triangle on side a-b has its apex at k
+        split[a, b - 1] = k - 1
+        stack.append((a, k))
+        stack.append((k, b))
+    return split
+
+
+# -----------------------------------------------------
+# 🧾 Results
+# -----------------------------------------------------
+def parenthesization(split, n, names=None):
+    """'((A1A2)A3)'-style string for matrices 0..n-1."""
+    names = names or [f"A{k + 1}" for k in range(n)]
+    out = []
+    stack = [(0, n - 1)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            out.append(item)
+            continue
+        i, j = item
+        if i == j:
+            out.append(names[i])
+            continue
+        k = int(split[i, j])
+        stack.extend([")", (k + 1, j), (i, k), "("])
+    return "".join(out)
+
+
+def chain_cost(dims, split):
+    """Scalar multiplications of the order given by split (checks a solver's result)."""
+    total = 0
+    stack = [(0, len(dims) - 2)]
+    while stack:
+        i, j = stack.pop()
+        if i < j:
+            k = int(split[i, j])
+            total += dims[i] * dims[k + 1] * dims[j + 1]
+            stack.extend([(i, k), (k + 1, j)])
+    return total
+
+
+# -----------------------------------------------------
+# 🧪 Command Line
+# -----------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Optimal matrix-chain order: O(n³) DP vs Hu–Shing.")
+    parser.add_argument("--n", type=int, nargs="+", default=[100, 300, 1000], help="random chain lengths")
+    parser.add_argument("--dims", help="comma-separated dimensions (n + 1 numbers) instead of random chains")
+    parser.add_argument("--max-dim", type=int, default=1000)
+    parser.add_argument("--skip-dp", type=int, default=3000, help="no DP above this length")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.dims:
+        chains = [[int(x) for x in args.dims.split(",")]]
+    else:
+        chains = [[rng.randint(1, args.max_dim) for _ in range(n + 1)] for n in args.n]
+
+    print(f"{'n':>7} {'DP (s)':>9} {'Hu–Shing (s)':>13}  cost")
+    for dims in chains:
+        n = len(dims) - 1
+        start = time.perf_counter()
+        cost, split = hu_shing(dims)
+        hs_time = time.perf_counter() - start
+        assert chain_cost(dims, split) == cost
+        dp_time = "-"
+        if n <= args.skip_dp:
+            start = time.perf_counter()
+            dp_cost, _ = chain_dp(dims)
+            dp_time = f"{time.perf_counter() - start:.3f}"
+            if dp_cost != cost:
+                raise SystemExit(f"❌ n={n}: DP cost {dp_cost} != Hu–Shing cost {cost}")
+        print(f"{n:>7} {dp_time:>9} {hs_time:>13.3f}  {cost}")
+        order = parenthesization(split, n)
+        print("       ", order if len(order) <= 200 else order[:200] + "...")
+
+
+if __name__ == "__main__":
+    main()
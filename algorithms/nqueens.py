@@ -0,0 +1,268 @@
+import argparse
+import multiprocessing
+import time
+
+import numpy as np
+from algorithms.steps import Step, PLACE, BACKTRACK
+
+# ---------------------------------------------
+# N-Queens with Column and Diagonal Bitmasks
+# ---------------------------------------------
+# A partial placement of the first rows is three ints, bit c meaning
+# column c of the next row is attacked:
+#
+#   cols   by a queen in the same column
+#   ld     along a diagonal, shifted one column left per row (<< 1)
+#   rd     along the other diagonal, shifted one column right (>> 1)
+#
+# so the free squares of the next row are full & ~(cols | ld | rd), and
+# free & -free picks them one at a time, lowest column first. Nothing is
+# scanned and no board is kept.
+#
+# Mirror symmetry: reflecting a solution left-right gives another solution,
+# with the first-row queen in the mirrored column. So only first-row queens
+# in the left half are searched and their counts doubled. For odd n, the
+# middle column is its own mirror, and the same cut is made on the second
+# row instead. The first solution found also starts in the left half.
+#
+# Modes:
+#
+#   "first"  depth-first, lowest columns first, stopping at the first solution
+#   "count"  every solution. The placements of one row are NumPy arrays:
+#            each pass expands the whole frontier by one row. Frontiers
+#            are processed in chunks of CHUNK placements, so memory stays
+#            bounded however wide the tree gets.
+#
+# One core: n = 14 takes about 1 s, n = 16 about 33 s (15-17M nodes/s).
+# --workers spreads the first-row subtrees over processes.
+
+MODES = ("first", "count")
+
+# frontier placements expanded per NumPy pass
+CHUNK = 1 << 14
+
+# solutions for n = 0, 1, 2, ... (OEIS A000170), to check counts against
+SOLUTION_COUNTS = (1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680, 14200, 73712, 365596,
+                   2279184, 14772512, 95815104, 666090624)
+
+
+def queens_steps(n, cols, row=0, masks=(0, 0, 0)):
+    """Step generator for the visualizer; cols[row] is the queen's column (None while empty).
+
+    Returns True at the first solution, with cols filled in.
+    """
+    full = (1 << n) - 1
+    attacked, ld, rd = masks
+    if attacked == full:
+        return True
+    free = full & ~(attacked | ld | rd)
+    if row == 0:
+        free &= (1 << (n + 1) // 2) - 1  # the mirror of any solution starts in the left half
+    while free:
+        bit = free & -free
+        free ^= bit
+        col = bit.bit_length() - 1
+        cols[row] = col
+        yield Step(PLACE, row, col)
+        if (yield from queens_steps(n, cols, row + 1,
+                                    (attacked | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1))):
+            return True
+        cols[row] = None
+        yield Step(BACKTRACK, row, col)
+    return False
+
+
+def attacked_squares(n, cols):
+    """Bitmask per row of the squares attacked by the queens placed in cols."""
+    rows = []
+    for r in range(n):
+        mask = 0
+        for q, c in enumerate(cols):
+            if c is not None and q != r:
+                mask |= 1 << c
+                for d in (c - (r - q), c + (r - q)):
+                    if 0 <= d < n:
+                        mask |= 1 << d
+        rows.append(mask)
+    return rows
+
+
+# -----------------------------------------------------
+# 🥇 First Solution
+# -----------------------------------------------------
+def first_solution(n):
+    """(columns, nodes): the first solution in lowest-column-first order, or (None, nodes)."""
+    full = (1 << n) - 1
+    if n == 0:
+        return [], 0
+    nodes = 0
+    stack, bits = [], []  # per placed row: (free squares left, masks above it), its queen
+    cols = ld = rd = 0
+    free = full & ((1 << (n + 1) // 2) - 1)
+    while True:
+        if free:
+            bit = free & -free
+            free ^= bit
+            nodes += 1
+            if cols | bit == full:
+                return [b.bit_length() - 1 for b in bits + [bit]], nodes
+            stack.append((free, cols, ld, rd))
+            bits.append(bit)
+            cols, ld, rd = cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1
+            free = full & ~(cols | ld | rd)
+        elif stack:
+            free, cols, ld, rd = stack.pop()
+            bits.pop()
+        else:
+            return None, nodes
+
+
+# -----------------------------------------------------
+# 🔢 Counting Every Solution
+# -----------------------------------------------------
+def _expand(full, cols, ld, rd):
+    """Every placement one row down from the given ones (equal-length arrays)."""
+    free = full & ~(cols | ld | rd)
+    parts = ([], [], [])
+    while True:
+        keep = free != 0
+        if not keep.all():
+            free, cols, ld, rd = free[keep], cols[keep], ld[keep], rd[keep]
+        if not len(free):
+            break
+        bit = free & -free
+        free ^= bit
+        parts[0].append(cols | bit)
+        parts[1].append(((ld | bit) << 1) & full)
+        parts[2].append((rd | bit) >> 1)
+    return [np.concatenate(p) if p else cols[:0] for p in parts]
+
+
+def count_below(n, row, cols, ld, rd):
+    """(solutions, nodes) under placements of the first `row` rows, given as mask arrays."""
+    full = (1 << n) - 1
+    solutions = nodes = 0
+    stack = [(row, cols, ld, rd)]
+    while stack:
+        row, cols, ld, rd = stack.pop()
+        if row == n:
+            solutions += len(cols)
+            continue
+        if len(cols) > CHUNK:
+            for s in range(0, len(cols), CHUNK):
+                stack.append((row, cols[s:s + CHUNK], ld[s:s + CHUNK], rd[s:s + CHUNK]))
+            continue
+        if row == n - 1:
+            # the last row has one column left: a free square there is a solution
+            found = int(np.count_nonzero(full & ~(cols | ld | rd)))
+            solutions += found
+            nodes += found
+            continue
+        cols, ld, rd = _expand(full, cols, ld, rd)
+        nodes += len(cols)
+        if len(cols):
+            stack.append((row + 1, cols, ld, rd))
+    return solutions, nodes
+
+
+def _roots(n, symmetry=True):
+    """(jobs, nodes): jobs are (weight, row, cols, ld, rd) subtrees whose counts add up to the total."""
+    full = (1 << n) - 1
+    dtype = np.int32 if n < 31 else np.int64
+    jobs, nodes = [], 0
+
+    def place(row, cols, ld, rd, bit):
+        return row + 1, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1
+
+    first = range(n // 2) if symmetry else range(n)
+    for c in first:
+        nodes += 1
+        jobs.append((2 if symmetry else 1,) + place(0, 0, 0, 0, 1 << c))
+    if symmetry and n % 2:
+        nodes += 1
+        middle = place(0, 0, 0, 0, 1 << n // 2)
+        if n == 1:
+            jobs.append((1,) + middle)
+        else:
+            row, cols, ld, rd = middle
+            free = full & ~(cols | ld | rd) & ((1 << n // 2) - 1)
+            while free:
+                bit = free & -free
+                free ^= bit
+                nodes += 1
+                jobs.append((2,) + place(row, cols, ld, rd, bit))
+    return [(w, row, np.array([c], dtype), np.array([l], dtype), np.array([r], dtype))
+            for w, row, c, l, r in jobs], nodes
+
+
+def _count_job(args):
+    n, (weight, row, cols, ld, rd) = args
+    solutions, nodes = count_below(n, row, cols, ld, rd)
+    return weight * solutions, nodes
+
+
+def count_solutions(n, symmetry=True, workers=1, progress=None):
+    """(solutions, nodes explored).
+
+    progress(done, total) is called after each first-row subtree is counted.
+    """
+    if n == 0:
+        return 1, 0
+    jobs, nodes = _roots(n, symmetry)
+    tasks = [(n, job) for job in jobs]
+    solutions = 0
+
+    def collect(results):
+        nonlocal solutions, nodes
+        for done, (found, explored) in enumerate(results, 1):
+            solutions += found
+            nodes += explored
+            if progress:
+                progress(done, len(tasks))
+
+    if workers > 1:
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            collect(pool.imap(_count_job, tasks, chunksize=1))
+    else:
+        collect(map(_count_job, tasks))
+    return solutions, nodes
+
+
+def is_solution(cols):
+    n = len(cols)
+    return (sorted(cols) == list(range(n))
+            and len({r + c for r, c in enumerate(cols)}) == n
+            and len({r - c for r, c in enumerate(cols)}) == n)
+
+
+# -----------------------------------------------------
+# 🧪 Command Line
+# -----------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Find or count N-Queens solutions with bitmasks.")
+    parser.add_argument("--n", type=int, nargs="+", default=[8, 12, 14], help="board sizes")
+    parser.add_argument("--mode", choices=MODES + ("both",), default="both")
+    parser.add_argument("--no-symmetry", action="store_true", help="count without the mirror cut")
+    parser.add_argument("--workers", type=int, default=1, help="counting processes")
+    args = parser.parse_args()
+
+    for n in args.n:
+        if args.mode in ("first", "both"):
+            start = time.perf_counter()
+            cols, nodes = first_solution(n)
+            elapsed = time.perf_counter() - start
+            shown = "none" if cols is None else " ".join(map(str, cols)) if n <= 32 else f"{n} columns"
+            print(f"♛ n={n:<3} first solution after {nodes:,} nodes in {elapsed:.3f}s: {shown}")
+        if args.mode in ("count", "both"):
+            start = time.perf_counter()
+            solutions, nodes = count_solutions(n, not args.no_symmetry, args.workers)
+            elapsed = time.perf_counter() - start
+            rate = nodes / elapsed if elapsed else 0
+            if n < len(SOLUTION_COUNTS) and solutions != SOLUTION_COUNTS[n]:
+                raise SystemExit(f"❌ n={n}: counted {solutions}, expected {SOLUTION_COUNTS[n]}")
+            print(f"♛ n={n:<3} {solutions:,} solutions, {nodes:,} nodes in {elapsed:.2f}s "
+                  f"({rate / 1e6:.1f}M nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from algorithms.steps import Step, COMPARE
+
+# ---------------------------------------------
+# Searching Algorithms as Step Generators
+# ---------------------------------------------
+# Each generator yields a COMPARE step per probe and returns the index of
+# `target` (or None when it is absent).
+
+
+def linear_search_steps(arr, target):
+    for i in range(len(arr)):
+        yield Step(COMPARE, i)
+        if arr[i] == target:
+            return i
+    return None
+
+
+def binary_search_steps(arr, target):
+    """arr must be sorted; each COMPARE carries the (low, high) window as its value."""
+    low, high = 0, len(arr) - 1
+    while low <= high:
+        mid = (low + high) // 2
+        yield Step(COMPARE, mid, value=(low, high))
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            low = mid + 1
+        else:
+            high = mid - 1
+    return None
@@ -1,96 +1,161 @@
 import pygame
 import sys
 import random
-import os
 import math
+from visuals.bar_renderer import BarRenderer, LABEL_OFFSET
+from visuals.layers import StaticLayer
+from visuals.fonts import get_font
+from visuals.scheduler import StepScheduler
+from visuals.sounds import play_sound
+from visuals.sprites import disc_sprite, glow_sprite, halo_sprite, blit_centered
+from visuals.tween import ease_out_back, ease_out_cubic
+from algorithms.search_steps import linear_search_steps, binary_search_steps
+from registry import ALGORITHMS, algorithms_in, visual
 
-# ---------------------------
-# Initialization
-# ---------------------------
-pygame.init()
-pygame.font.init()
-
-FONT = pygame.font.Font(None, 36)
-BIG_FONT = pygame.font.Font(None, 60)
-SMALL_FONT = pygame.font.Font(None, 28)
+FONT = get_font(36)
+BIG_FONT = get_font(60)
+SMALL_FONT = get_font(28)
 
-# ---------------------------
-# Sound loading
-# ---------------------------
-sound_enabled = True
-sound_path = os.path.join("assets", "sounds")
-
-try:
-    pygame.mixer.init()
-except Exception:
-    # mixer might fail on some systems; we'll handle gracefully
-    pass
-
-try:
-    click_sound = pygame.mixer.Sound(os.path.join(sound_path, "click.wav"))
-    success_sound = pygame.mixer.Sound(os.path.join(sound_path, "success.wav"))
-    error_sound = pygame.mixer.Sound(os.path.join(sound_path, "error.wav"))
-except Exception as e:
-    # missing/invalid files -> disable sound
-    # print for dev awareness but keep running
-    print(f"⚠️ Sound files not found or failed to load: {e}")
-    sound_enabled = False
-    click_sound = success_sound = error_sound = None
-
-
-def play_sound(effect, muted=False):
-    """Play sound effect if available and not muted."""
-    if muted or not sound_enabled:
-        return
-    try:
-        if effect == "click" and click_sound:
-            click_sound.play()
-        elif effect == "success" and success_sound:
-            success_sound.play()
-        elif effect == "error" and error_sound:
-            error_sound.play()
-    except Exception:
-        pass
+# about the old 350-500 ms per probe; +/- and 0 change it during a search
+SCHEDULER = StepScheduler(steps_per_second=2.5)
 
 
 # ---------------------------
 # Drawing / UI
 # ---------------------------
+BAR_COLORS = ((0, 100, 255), (0, 255, 128))
+POINTER_COLORS = {
+    "low": (255, 165, 0),
+    "mid": (255, 0, 0),
+    "high": (0, 255, 255),
+    "i": (255, 0, 0),  # 🔴 Red for Linear Search
+}
+GLOW_COLOR = (255, 0, 0)
+FOUND_COLOR = (0, 255, 0)
+FOUND_POINTER_COLORS = dict(POINTER_COLORS, i=FOUND_COLOR, mid=FOUND_COLOR)
+FOUND_LIFT = 30  # px the found bar pops up
+HALO_SPREAD = 12
+GLOW_RADIUS = 36
+POINTER_GLIDE_S = 0.25  # pointers glide to each new probe over this long
+POP_S = 0.35
+LINEAR_TIME = ALGORITHMS["Linear Search"].time  # complexity panel labels
+BINARY_TIME = ALGORITHMS["Binary Search"].time
+
+def draw_gradient(surface):
+    """Subtle vertical gradient behind the whole interface."""
+    WIDTH, HEIGHT = surface.get_size()
+    for y in range(HEIGHT):
+        shade = 230 + int(25 * (y / HEIGHT))
+        pygame.draw.line(surface, (shade, shade, 255), (0, y), (WIDTH, y))
+
+
+BACKGROUND_LAYER = StaticLayer(draw_gradient)
+
+
+def get_background(screen):
+    """Gradient surface used for full frames and to restore dirty regions."""
+    return BACKGROUND_LAYER.get(screen)
+
+
+def make_bar_renderer(screen):
+    HEIGHT = screen.get_height()
+    return BarRenderer(screen, bottom=HEIGHT - 50, max_height=HEIGHT - 250, colors=BAR_COLORS,
+                       background=get_background(screen), outline=(255, 255, 255),
+                       label_font=SMALL_FONT)
+
+
+def message_rect(screen):
+    return pygame.Rect(0, 145, screen.get_width() - 270, 33)
+
+
+def pointer_rect(screen):
+    # strip below the bars holding the pointer arrows and the mute hint
+    HEIGHT = screen.get_height()
+    return pygame.Rect(0, HEIGHT - 50, screen.get_width(), 50)
+
+
+def begin_region(screen, rect):
+    """Restores rect from the background and clips drawing to it (undo with set_clip(None))."""
+    screen.blit(get_background(screen), rect, rect)
+    screen.set_clip(rect)
+
+
+def draw_complexity_panel(screen, complexity, comparisons):
+    WIDTH = screen.get_width()
+    # stops just above the tallest bar's value label
+    rect = pygame.Rect(WIDTH - 260, 30, 230, 148)
+    begin_region(screen, rect)
+    pygame.draw.rect(screen, (230, 230, 255), (WIDTH - 260, 30, 230, 130), border_radius=12)
+    pygame.draw.rect(screen, (0, 0, 0), (WIDTH - 260, 30, 230, 130), 2, border_radius=12)
+    screen.blit(FONT.render("📊 Complexity", True, (0, 0, 0)), (WIDTH - 245, 40))
+    screen.blit(SMALL_FONT.render(f"Time: {complexity}", True, (0, 0, 0)), (WIDTH - 245, 80))
+    screen.blit(SMALL_FONT.render("Space: O(1)", True, (0, 0, 0)), (WIDTH - 245, 105))
+
+    # comparisons
+    compare_text = FONT.render(f"🔁 Comparisons: {comparisons}", True, (0, 0, 0))
+    screen.blit(compare_text, (WIDTH - 245, 155))
+    screen.set_clip(None)
+    return rect
+
+
+def draw_pointers(screen, pointers, bar_width, muted, colors=POINTER_COLORS):
+    """Redraws the pointer strip (low/mid/high/i arrows + mute hint)."""
+    HEIGHT = screen.get_height()
+    rect = pointer_rect(screen)
+    begin_region(screen, rect)
+
+    # mute hint
+    mute_text = SMALL_FONT.render(f"🔈 {'ON' if not muted else 'MUTED'} (Press M)", True, (0, 0, 0))
+    screen.blit(mute_text, (20, HEIGHT - 40))
+
+    for key, index in (pointers or {}).items():
+        if index is None:
+            continue
+        x = index * bar_width + bar_width // 2
+        y = HEIGHT - 40
+        color = colors.get(key, (255, 255, 255))
+
+        # triangle arrow, tip touching the bottom of the bars
+        pygame.draw.polygon(screen, color, [
+            (x - 10, y + 10),
+            (x + 10, y + 10),
+            (x, y - 10)
+        ])
+        label = SMALL_FONT.render(key.upper(), True, color)
+        screen.blit(label, (x - 10, y + 12))
+    screen.set_clip(None)
+    return rect
+
+
+def draw_message(screen, message, color=(200, 30, 30)):
+    rect = message_rect(screen)
+    begin_region(screen, rect)
+    msg_text = FONT.render(message, True, color)
+    screen.blit(msg_text, (20, 150))
+    screen.set_clip(None)
+    return rect
+
+
 def draw_interface(screen, arr, highlight=None, title="Searching Visualizer",
-                   message="", input_text="", comparisons=0, complexity="O(n)",
-                   pointers=None, muted=False, glow_effect=None):
+                   message="", input_text="", comparisons=0, complexity=LINEAR_TIME,
+                   pointers=None, muted=False, glow_effect=None, bars=None):
     """
     glow_effect: None or dict { "pos": (x,y), "rings": [(radius, alpha), ...] }
     pointers: dict like {"low": idx, "mid": idx, "high": idx} (indices may be floats for animation)
+    bars: optional BarRenderer left in sync so later frames can use update_interface()
     """
     if highlight is None:
         highlight = []
 
     WIDTH, HEIGHT = screen.get_size()
-    screen.fill((240, 248, 255))
-    bar_count = len(arr)
-    bar_width = max(1, WIDTH // bar_count)
-    max_val = max(arr) if arr else 1
-
-    # subtle vertical gradient
-    for y in range(HEIGHT):
-        shade = 230 + int(25 * (y / HEIGHT))
-        pygame.draw.line(screen, (shade, shade, 255), (0, y), (WIDTH, y))
+    screen.blit(get_background(screen), (0, 0))
 
     # bars
-    for i, val in enumerate(arr):
-        is_high = i in highlight
-        color = (0, 255, 128) if is_high else (0, 100, 255)
-        bar_height = int((val / max_val) * (HEIGHT - 250))
-        x = i * bar_width
-        y = HEIGHT - bar_height - 50
-        pygame.draw.rect(screen, color, (x, y, bar_width - 2, bar_height))
-        pygame.draw.rect(screen, (255, 255, 255), (x, y, bar_width - 2, bar_height), 1)
-        # value label
-        t = SMALL_FONT.render(str(val), True, (0, 0, 0))
-        screen.blit(t, (x + max(2, bar_width // 4), y - 22))
-
-    # glow rings (if any)
+    if bars is None:
+        bars = make_bar_renderer(screen)
+    bars.draw_all(arr, highlight)
+
+    # glow rings (if any): cached ring-sized sprites, not a full-screen layer per ring
     if glow_effect is not None:
         # expect glow_effect = {"pos": (x, y), "rings":[(r,alpha), ...]}
         pos = glow_effect.get("pos")
@@ -98,10 +163,7 @@ def draw_interface(screen, arr, highlight=None, title="Searching Visualizer",
         for radius, alpha in rings:
             if radius <= 0 or alpha <= 0:
                 continue
-            glow_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            glow_color = (255, 0, 0, int(alpha))
-            pygame.draw.circle(glow_surface, glow_color, pos, int(radius))
-            screen.blit(glow_surface, (0, 0))
+            blit_centered(screen, disc_sprite(radius, GLOW_COLOR, alpha), pos)
 
     # title
     title_text = BIG_FONT.render(title, True, (0, 0, 80))
@@ -115,62 +177,98 @@ def draw_interface(screen, arr, highlight=None, title="Searching Visualizer",
     input_surface = FONT.render(input_text, True, (0, 0, 0))
     screen.blit(input_surface, (240, 95))
 
-    # message
-    msg_text = FONT.render(message, True, (200, 30, 30))
-    screen.blit(msg_text, (20, 150))
+    draw_message(screen, message)
+    draw_complexity_panel(screen, complexity, comparisons)
+    draw_pointers(screen, pointers, bars.bar_width, muted)
 
-    # complexity panel
-    pygame.draw.rect(screen, (230, 230, 255), (WIDTH - 260, 30, 230, 130), border_radius=12)
-    pygame.draw.rect(screen, (0, 0, 0), (WIDTH - 260, 30, 230, 130), 2, border_radius=12)
-    screen.blit(FONT.render("📊 Complexity", True, (0, 0, 0)), (WIDTH - 245, 40))
-    screen.blit(SMALL_FONT.render(f"Time: {complexity}", True, (0, 0, 0)), (WIDTH - 245, 80))
-    screen.blit(SMALL_FONT.render("Space: O(1)", True, (0, 0, 0)), (WIDTH - 245, 105))
+    pygame.display.flip()
 
-    # comparisons
-    compare_text = FONT.render(f"🔁 Comparisons: {comparisons}", True, (0, 0, 0))
-    screen.blit(compare_text, (WIDTH - 245, 155))
 
-    # mute hint
-    mute_text = SMALL_FONT.render(f"🔈 {'ON' if not muted else 'MUTED'} (Press M)", True, (0, 0, 0))
-    screen.blit(mute_text, (20, HEIGHT - 40))
+def update_interface(screen, bars, arr, highlight=None, message="", comparisons=0,
+                     complexity=LINEAR_TIME, pointers=None, muted=False):
+    """Per-step frame after draw_interface(..., bars=bars): repaints only the bars,
+    message, complexity panel and pointer strip that can change, and pushes
+    just those rects with pygame.display.update()."""
+    extra = [
+        draw_message(screen, message),
+        draw_complexity_panel(screen, complexity, comparisons),
+        draw_pointers(screen, pointers, bars.bar_width, muted),
+    ]
+    bars.update(arr, highlight or [], extra)
 
-    # pointers (low/mid/high)
-    # pointers (low/mid/high/i)
-    if pointers:
-        for key, index in pointers.items():
-            if index is None:
-                continue
-            x = index * bar_width + bar_width // 2
-            y = HEIGHT - 60
-
-            color_map = {
-                "low": (255, 165, 0),
-                "mid": (255, 0, 0),
-                "high": (0, 255, 255),
-                "i": (255, 0, 0),  # 🔴 Red for Linear Search
-
-            }
-            color = color_map.get(key, (255, 255, 255))
-
-            # draw pointer arrow
-            pygame.draw.polygon(screen, color, [
-                (x - 10, y + 10),
-                (x + 10, y + 10),
-                (x, y - 10)
-            ])
-            label = SMALL_FONT.render(key.upper(), True, color)
-            screen.blit(label, (x - 10, y + 22))
-
-            # triangle arrow
-            pygame.draw.polygon(screen, color, [
-                (x - 10, y + 10),
-                (x + 10, y + 10),
-                (x, y - 10)
-            ])
-            label = SMALL_FONT.render(key.upper(), True, color)
-            screen.blit(label, (x - 20, y + 22))
 
-    pygame.display.flip()
+# ---------------------------
+# Pointer glides + found pop (tweens, sprites, dirty rects)
+# ---------------------------
+def glide_pointers(pointers):
+    """Tweens each pointer towards its new index; the scheduler keeps rendering until they land."""
+    for key, index in pointers.items():
+        SCHEDULER.tweens.animate(("pointer", key), index, POINTER_GLIDE_S)
+
+
+def gliding(pointers):
+    """Current (possibly fractional) on-screen pointer positions."""
+    return {key: SCHEDULER.tweens.value(("pointer", key), index) for key, index in pointers.items()}
+
+
+def effects_rect(screen):
+    """Area between the message line and the pointer strip that the pop may touch."""
+    top = message_rect(screen).bottom
+    return pygame.Rect(0, top, screen.get_width(), pointer_rect(screen).top - top)
+
+
+def found_bar_rect(bars, arr, index, lift):
+    bar_height = int((arr[index] / bars.max_val) * bars.max_height)
+    return pygame.Rect(index * bars.bar_width, bars.bottom - bar_height - int(lift),
+                       bars.bar_width - bars.gap, bar_height)
+
+
+def draw_found_bar(screen, bars, arr, index, lift, color=FOUND_COLOR, glow_alpha=140):
+    """Repaints the found bar lifted by `lift` px with its halo and top glow; returns the touched rect."""
+    base = found_bar_rect(bars, arr, index, 0)
+    # fixed per bar and roomy enough for the pop's overshoot, so each frame erases the last
+    reach = FOUND_LIFT + LABEL_OFFSET + HALO_SPREAD
+    top_glow = pygame.Rect(0, 0, 2 * GLOW_RADIUS, 2 * GLOW_RADIUS)
+    top_glow.center = (base.centerx, base.top - FOUND_LIFT)
+    region = base.inflate(2 * HALO_SPREAD, 2 * HALO_SPREAD).union(
+        base.move(0, -reach).inflate(2 * HALO_SPREAD, 2 * HALO_SPREAD)).union(top_glow.inflate(0, 20))
+    region = bars.redraw_region(arr, region.clip(effects_rect(screen)), skip=(index,))
+
+    bar = found_bar_rect(bars, arr, index, lift)
+    color = tuple(int(c) for c in color)
+    screen.set_clip(region)
+    if glow_alpha >= 10:
+        # alpha in steps of 10 keeps the fade down to a handful of cached sprites
+        blit_centered(screen, glow_sprite(GLOW_RADIUS, FOUND_COLOR, int(glow_alpha) // 10 * 10), bar.midtop)
+    blit_centered(screen, halo_sprite(bar.size, color, 170, HALO_SPREAD), bar.center)
+    pygame.draw.rect(screen, color, bar)
+    pygame.draw.rect(screen, (255, 255, 255), bar, 1)
+    val_text = SMALL_FONT.render(str(arr[index]), True, (0, 0, 0))
+    screen.blit(val_text, (bar.x + max(2, bars.bar_width // 4), bar.y - LABEL_OFFSET))
+    screen.set_clip(None)
+    return region
+
+
+def found_pop(screen, bars, arr, index, target, pointers, muted, hold_ms=1100):
+    """Pops the found bar (lift, color and glow tweens) while holding the result on screen."""
+    tweens = SCHEDULER.tweens
+    tweens.animate("lift", FOUND_LIFT, POP_S, ease_out_back, start=0)
+    tweens.animate("found color", FOUND_COLOR, POP_S, start=BAR_COLORS[1])
+    tweens.animate("glow alpha", 140, POP_S, ease_out_cubic, start=0)
+    glide_pointers(pointers)
+    message = f"✅ Found {target} at index {index}"
+
+    def render():
+        rects = [
+            draw_found_bar(screen, bars, arr, index, tweens.value("lift"),
+                           tweens.value("found color"), tweens.value("glow alpha")),
+            draw_message(screen, message, (0, 150, 0)),
+            draw_pointers(screen, gliding(pointers), bars.bar_width, muted, FOUND_POINTER_COLORS),
+        ]
+        pygame.display.update(rects)
+
+    render()
+    SCHEDULER.hold(hold_ms, render)
 
 
 # ---------------------------
@@ -178,187 +276,112 @@ def draw_interface(screen, arr, highlight=None, title="Searching Visualizer",
 # ---------------------------
 def linear_search_visual(screen, arr, target, muted):
     comparisons = 0
-    bar_width = max(1, screen.get_width() // len(arr))
-    HEIGHT = screen.get_height()
-    max_val = max(arr)
 
-    for i in range(len(arr)):
+    # one full frame, then each check repaints only what changed
+    bars = make_bar_renderer(screen)
+    draw_interface(screen, arr, title="Linear Search", input_text=str(target),
+                   complexity=LINEAR_TIME, muted=muted, bars=bars)
+
+    probe = {"i": 0}
+    SCHEDULER.tweens.clear()
+    sounded = 0  # comparisons already clicked for; frames in between only animate
+
+    def on_step(step):
+        nonlocal comparisons
         comparisons += 1
-        pointers = {"i": i}
-
-        # Regular checking frame
-        draw_interface(screen, arr, highlight=[i], title="Linear Search",
-                       message=f"Checking index {i}...", input_text=str(target),
-                       comparisons=comparisons, complexity="O(n)",
-                       pointers=pointers, muted=muted)
-        play_sound("click", muted)
-        pygame.time.delay(350)
-
-        # Found condition
-        if arr[i] == target:
-            play_sound("success", muted)
-
-            # 🎨 Pop animation (bar jumps up)
-            for lift in range(0, 30, 3):
-                screen.fill((240, 248, 255))
-                popped_arr = arr.copy()
-                # Draw bars, but make the found one higher and green
-                for j, val in enumerate(popped_arr):
-                    bar_height = int((val / max_val) * (HEIGHT - 250))
-                    x = j * bar_width
-                    y = HEIGHT - bar_height - 50
-
-                    if j == i:
-                        y -= lift  # lift upward
-                        color = (0, 255, 0)  # bright green
-                    else:
-                        color = (0, 100, 255)
-
-                    pygame.draw.rect(screen, color, (x, y, bar_width - 2, bar_height))
-                    pygame.draw.rect(screen, (255, 255, 255), (x, y, bar_width - 2, bar_height), 1)
-                    val_text = SMALL_FONT.render(str(val), True, (0, 0, 0))
-                    screen.blit(val_text, (x + bar_width // 4, y - 25))
-
-                # Pointer above found bar
-                x_pointer = i * bar_width + bar_width // 2
-                pygame.draw.polygon(screen, (0, 255, 0), [
-                    (x_pointer - 10, HEIGHT - 60),
-                    (x_pointer + 10, HEIGHT - 60),
-                    (x_pointer, HEIGHT - 80)
-                ])
-                label = SMALL_FONT.render("I", True, (0, 255, 0))
-                screen.blit(label, (x_pointer - 10, HEIGHT - 100))
-
-                msg_text = FONT.render(f"✅ Found {target} at index {i}", True, (0, 150, 0))
-                screen.blit(msg_text, (20, 150))
-
-                pygame.display.flip()
-                pygame.time.delay(30)
-
-            pygame.time.delay(800)
-            return True, comparisons
+        probe["i"] = step.a
+        glide_pointers(probe)
+
+    def render():
+        nonlocal sounded
+        i = probe["i"]
+        update_interface(screen, bars, arr, highlight=[i],
+                         message=f"Checking index {i}...",
+                         comparisons=comparisons, complexity=LINEAR_TIME,
+                         pointers=gliding(probe), muted=muted)
+        if sounded != comparisons:
+            sounded = comparisons
+            play_sound("click", muted)
+
+    i = SCHEDULER.run(linear_search_steps(arr, target), on_step, render)
+
+    # Found condition
+    if i is not None:
+        play_sound("success", muted)
+
+        # 🎨 Pop animation (bar jumps up)
+        found_pop(screen, bars, arr, i, target, {"i": i}, muted)
+        return True, comparisons
 
     # ❌ Not found
     draw_interface(screen, arr, [], title="Linear Search",
                    message=f"❌ {target} not found", input_text=str(target),
-                   comparisons=comparisons, complexity="O(n)", muted=muted)
+                   comparisons=comparisons, complexity=LINEAR_TIME, muted=muted)
     play_sound("error", muted)
-    pygame.time.delay(1000)
+    SCHEDULER.hold(1000)
     return False, comparisons
 
 
 
 # ---------------------------
-# Binary Search (with animated pointers, sound & glow)
+# Binary Search (with low/mid/high pointers, sound & glow)
 # ---------------------------
 def binary_search_visual(screen, arr, target, muted):
     arr.sort()
     low, high = 0, len(arr) - 1
     comparisons = 0
-    WIDTH, HEIGHT = screen.get_size()
-    bar_width = max(1, WIDTH // len(arr))
-    max_val = max(arr)
 
-    # previous pointers for smooth movement
-    prev_ptrs = {"low": low, "mid": (low + high) // 2, "high": high}
+    # one full frame of the sorted array, then incremental updates
+    bars = make_bar_renderer(screen)
+    draw_interface(screen, arr, title="Binary Search", input_text=str(target),
+                   complexity=BINARY_TIME, muted=muted, bars=bars)
+
+    probe = {"low": low, "mid": (low + high) // 2, "high": high}
+    SCHEDULER.tweens.clear()
+    sounded = 0
 
-    while low <= high:
-        mid = (low + high) // 2
+    def on_step(step):
+        nonlocal comparisons
         comparisons += 1
-        pointers = {"low": low, "mid": mid, "high": high}
-
-        draw_interface(screen, arr, highlight=[mid], title="Binary Search",
-                       message=f"Checking mid index {mid}...", input_text=str(target),
-                       comparisons=comparisons, complexity="O(log n)", pointers=pointers, muted=muted)
-        play_sound("click", muted)
-        pygame.time.delay(500)
-
-        # ✅ FOUND VALUE
-        if arr[mid] == target:
-            play_sound("success", muted)
-
-            # 🎨 Pop-up animation for found bar
-            for lift in range(0, 30, 3):
-                screen.fill((240, 248, 255))
-                for i, val in enumerate(arr):
-                    bar_height = int((val / max_val) * (HEIGHT - 250))
-                    x = i * bar_width
-                    y = HEIGHT - bar_height - 50
-
-                    if i == mid:
-                        y -= lift  # lift up
-                        color = (0, 255, 0)  # bright green
-                    else:
-                        color = (0, 100, 255)
-
-                    pygame.draw.rect(screen, color, (x, y, bar_width - 2, bar_height))
-                    pygame.draw.rect(screen, (255, 255, 255), (x, y, bar_width - 2, bar_height), 1)
-                    val_text = SMALL_FONT.render(str(val), True, (0, 0, 0))
-                    screen.blit(val_text, (x + bar_width // 4, y - 25))
-
-                # Draw pointers (low, mid, high)
-                for key, index in pointers.items():
-                    if index is None:
-                        continue
-                    px = index * bar_width + bar_width // 2
-                    py = HEIGHT - 60
-                    color_map = {"low": (255, 165, 0), "mid": (0, 255, 0), "high": (0, 255, 255)}
-                    pointer_color = color_map.get(key, (255, 255, 255))
-                    pygame.draw.polygon(screen, pointer_color, [
-                        (px - 10, py + 10),
-                        (px + 10, py + 10),
-                        (px, py - 10)
-                    ])
-                    label = SMALL_FONT.render(key.upper(), True, pointer_color)
-                    screen.blit(label, (px - 10, py + 22))
-
-                msg_text = FONT.render(f"✅ Found {target} at index {mid}", True, (0, 150, 0))
-                screen.blit(msg_text, (20, 150))
-
-                pygame.display.flip()
-                pygame.time.delay(30)
-
-            pygame.time.delay(800)
-            return True, comparisons
-
-        # 🔸 Move right
-        elif arr[mid] < target:
-            new_low = mid + 1
-            for t in range(8):
-                interp = {}
-                for k in ("low", "mid", "high"):
-                    start = prev_ptrs.get(k, 0)
-                    end_val = {"low": new_low, "mid": mid, "high": high}.get(k, prev_ptrs.get(k))
-                    interp[k] = start + (end_val - start) * (t / 8.0)
-                draw_interface(screen, arr, highlight=list(range(prev_ptrs["low"], mid + 1)), title="Binary Search",
-                               message=f"{arr[mid]} < {target}, moving right...", input_text=str(target),
-                               comparisons=comparisons, complexity="O(log n)", pointers=interp, muted=muted)
-                pygame.time.delay(30)
-            low = new_low
-            prev_ptrs = {"low": low, "mid": mid, "high": high}
-
-        # 🔹 Move left
+        probe["mid"] = step.a
+        probe["low"], probe["high"] = step.value
+        glide_pointers(probe)
+
+    def render():
+        nonlocal sounded
+        low, mid, high = probe["low"], probe["mid"], probe["high"]
+        if arr[mid] < target:
+            # 🔸 Move right: the left half drops out
+            highlight, message = list(range(low, mid + 1)), f"{arr[mid]} < {target}, moving right..."
+        elif arr[mid] > target:
+            # 🔹 Move left: the right half drops out
+            highlight, message = list(range(mid, high + 1)), f"{arr[mid]} > {target}, moving left..."
         else:
-            new_high = mid - 1
-            for t in range(8):
-                interp = {}
-                for k in ("low", "mid", "high"):
-                    start = prev_ptrs.get(k, 0)
-                    end_val = {"low": low, "mid": mid, "high": new_high}.get(k, prev_ptrs.get(k))
-                    interp[k] = start + (end_val - start) * (t / 8.0)
-                draw_interface(screen, arr, highlight=list(range(mid, prev_ptrs["high"] + 1)), title="Binary Search",
-                               message=f"{arr[mid]} > {target}, moving left...", input_text=str(target),
-                               comparisons=comparisons, complexity="O(log n)", pointers=interp, muted=muted)
-                pygame.time.delay(30)
-            high = new_high
-            prev_ptrs = {"low": low, "mid": mid, "high": high}
+            highlight, message = [mid], f"Checking mid index {mid}..."
+        update_interface(screen, bars, arr, highlight=highlight, message=message,
+                         comparisons=comparisons, complexity=BINARY_TIME, pointers=gliding(probe), muted=muted)
+        if sounded != comparisons:
+            sounded = comparisons
+            play_sound("click", muted)
+
+    mid = SCHEDULER.run(binary_search_steps(arr, target), on_step, render)
+    pointers = dict(probe)
+
+    # ✅ FOUND VALUE
+    if mid is not None:
+        play_sound("success", muted)
+
+        # 🎨 Pop-up animation for found bar
+        found_pop(screen, bars, arr, mid, target, pointers, muted)
+        return True, comparisons
+
 
     # ❌ NOT FOUND
     draw_interface(screen, arr, [], title="Binary Search",
                    message=f"❌ {target} not found", input_text=str(target),
-                   comparisons=comparisons, complexity="O(log n)", muted=muted)
+                   comparisons=comparisons, complexity=BINARY_TIME, muted=muted)
     play_sound("error", muted)
-    pygame.time.delay(1000)
+    SCHEDULER.hold(1000)
     return False, comparisons
 
 
@@ -368,7 +391,7 @@ def binary_search_visual(screen, arr, target, muted):
 # ---------------------------
 def show_retry_overlay(screen, last_algo):
     WIDTH, HEIGHT = screen.get_size()
-    font = pygame.font.Font(None, 50)
+    font = get_font(50)
     options = ["🔁 Try Again", "⬅ Back"]
     selected = 0
 
@@ -407,10 +430,10 @@ def show_retry_overlay(screen, last_algo):
 # ---------------------------
 def run_search_visual(screen):
     arr = [random.randint(10, 99) for _ in range(20)]
-    algorithms = ["Linear Search", "Binary Search", "Back"]
+    algorithms = [a.name for a in algorithms_in("searching")] + ["Back"]
     selected_algo = 0
     WIDTH, HEIGHT = screen.get_size()
-    font = pygame.font.Font(None, 50)
+    font = get_font(50)
     muted = False
 
     while True:
@@ -423,6 +446,9 @@ def run_search_visual(screen):
             label = font.render(algo, True, color)
             rect = label.get_rect(center=(WIDTH // 2, 250 + i * 80))
             screen.blit(label, rect)
+        hint = SMALL_FONT.render(f"Speed: {SCHEDULER.label()}   (+/- to change, 0 = unthrottled)",
+                                 True, (200, 200, 200))
+        screen.blit(hint, hint.get_rect(center=(WIDTH // 2, 180)))
         pygame.display.flip()
 
         for event in pygame.event.get():
@@ -434,6 +460,8 @@ def run_search_visual(screen):
                     selected_algo = (selected_algo - 1) % len(algorithms)
                 elif event.key == pygame.K_DOWN:
                     selected_algo = (selected_algo + 1) % len(algorithms)
+                elif SCHEDULER.handle_event(event):
+                    pass
                 elif event.key == pygame.K_RETURN:
                     if algorithms[selected_algo] == "Back":
                         return
@@ -448,7 +476,7 @@ def run_search_visual(screen):
                         draw_interface(screen, arr_copy, [], algorithms[selected_algo],
                                        "Type number and press Enter to search",
                                        input_text, 0,
-                                       "O(n)" if algorithms[selected_algo] == "Linear Search" else "O(log n)",
+                                       ALGORITHMS[algorithms[selected_algo]].time,
                                        muted=muted)
 
                         for e in pygame.event.get():
@@ -463,10 +491,8 @@ def run_search_visual(screen):
                                     if e.key == pygame.K_RETURN and input_text.strip().isdigit():
                                         target = int(input_text)
                                         searching = True
-                                        if algorithms[selected_algo] == "Linear Search":
-                                            found, comps = linear_search_visual(screen, arr_copy, target, muted)
-                                        else:
-                                            found, comps = binary_search_visual(screen, arr_copy, target, muted)
+                                        search = visual(algorithms[selected_algo])
+                                        found, comps = search(screen, arr_copy, target, muted)
                                         choice = show_retry_overlay(screen, algorithms[selected_algo])
                                         if choice == "⬅ Back":
                                             break  # return to algorithms menu
@@ -0,0 +1,113 @@
+import time
+from algorithms.steps import COMPARE, SWAP
+
+# ---------------------------------------------
+# Operation Counters for the Sorting Algorithms
+# ---------------------------------------------
+# Comparisons and swaps come from the step stream. Array reads and writes
+# are counted by CountingArray, a thin view over the real array that the
+# algorithm is handed instead of it (the renderer keeps reading the raw
+# array, so drawing never inflates the counts). Auxiliary memory and
+# recursion depth are reported by the algorithms themselves through the
+# enter/leave/alloc/free hooks; they default to NO_COUNTER, which ignores them.
+
+
+class NullCounter:
+    def enter(self):
+        pass
+
+    def leave(self):
+        pass
+
+    def alloc(self, n):
+        pass
+
+    def free(self, n):
+        pass
+
+
+NO_COUNTER = NullCounter()
+
+
+class SortCounter(NullCounter):
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.reads = 0
+        self.writes = 0
+        self.aux = 0          # extra elements held right now
+        self.peak_aux = 0
+        self.depth = 0        # current recursion (or explicit-stack) depth
+        self.max_depth = 0
+
+    # ---------- hooks called by the algorithms ----------
+    def enter(self):
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+    def leave(self):
+        self.depth -= 1
+
+    def alloc(self, n):
+        self.aux += n
+        if self.aux > self.peak_aux:
+            self.peak_aux = self.aux
+
+    def free(self, n):
+        self.aux -= n
+
+    # ---------- step stream ----------
+    def observe(self, step):
+        if step.kind == COMPARE:
+            self.comparisons += 1
+        elif step.kind == SWAP:
+            self.swaps += 1
+
+    def report(self):
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "reads": self.reads,
+            "writes": self.writes,
+            "aux_memory": self.peak_aux,
+            "max_depth": self.max_depth,
+        }
+
+
+class CountingArray:
+    """Array view that counts element reads and writes into a SortCounter."""
+
+    def __init__(self, data, counter):
+        self.data = data
+        self.counter = counter
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        value = self.data[i]
+        self.counter.reads += len(value) if isinstance(i, slice) else 1
+        return value
+
+    def __setitem__(self, i, value):
+        self.counter.writes += 1
+        self.data[i] = value
+
+
+def counted_steps(sort_steps, arr, counter):
+    """Runs sort_steps on a counting view of arr, feeding every step to counter."""
+    for step in sort_steps(CountingArray(arr, counter), ops=counter):
+        counter.observe(step)
+        yield step
+
+
+def measure_sort(sort_steps, arr):
+    """Sorts arr headless and returns the counter report plus wall time."""
+    counter = SortCounter()
+    start = time.perf_counter()
+    for _ in counted_steps(sort_steps, arr, counter):
+        pass
+    report = counter.report()
+    report["time_s"] = time.perf_counter() - start
+    return report
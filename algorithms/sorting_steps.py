@@ -0,0 +1,173 @@
+from algorithms.steps import Step, COMPARE, SWAP, WRITE
+from algorithms.sort_counters import NO_COUNTER
+
+# ---------------------------------------------
+# Sorting Algorithms as Step Generators
+# ---------------------------------------------
+# Each generator sorts `arr` in place and yields a Step after every
+# comparison, swap or write. Nothing here imports pygame. A WRITE carries
+# the value just stored, never a read back from arr: arr may be a
+# CountingArray, and a read-back would count as an extra read.
+# `ops` receives auxiliary-memory and recursion-depth events (see
+# algorithms/sort_counters.py); by default they are ignored.
+
+
+def bubble_sort_steps(arr, ops=NO_COUNTER):
+    n = len(arr)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            yield Step(COMPARE, j, j + 1)
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                yield Step(SWAP, j, j + 1)
+
+
+def selection_sort_steps(arr, ops=NO_COUNTER):
+    n = len(arr)
+    for i in range(n):
+        min_idx = i
+        for j in range(i + 1, n):
+            yield Step(COMPARE, min_idx, j)
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            yield Step(SWAP, i, min_idx)
+
+
+def insertion_sort_steps(arr, ops=NO_COUNTER):
+    ops.alloc(1)  # key
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+        while j >= 0:
+            yield Step(COMPARE, j, j + 1)
+            moved = arr[j]
+            if moved <= key:
+                break
+            arr[j + 1] = moved
+            yield Step(WRITE, j + 1, value=moved)
+            j -= 1
+        arr[j + 1] = key
+        yield Step(WRITE, j + 1, value=key)
+    ops.free(1)
+
+
+def merge_sort_steps(arr, l=0, r=None, ops=NO_COUNTER):
+    if r is None:
+        r = len(arr) - 1
+    if l >= r:
+        return
+    ops.enter()
+    m = (l + r) // 2
+    yield from merge_sort_steps(arr, l, m, ops)
+    yield from merge_sort_steps(arr, m + 1, r, ops)
+
+    # list() copies: a NumPy slice would be a view into the buffer being overwritten
+    left = list(arr[l:m + 1])
+    right = list(arr[m + 1:r + 1])
+    ops.alloc(r - l + 1)
+    i = j = 0
+    k = l
+    while i < len(left) and j < len(right):
+        yield Step(COMPARE, l + i, m + 1 + j)
+        if left[i] <= right[j]:
+            value = left[i]
+            i += 1
+        else:
+            value = right[j]
+            j += 1
+        arr[k] = value
+        yield Step(WRITE, k, value=value)
+        k += 1
+    while i < len(left):
+        arr[k] = left[i]
+        yield Step(WRITE, k, value=left[i])
+        i += 1
+        k += 1
+    while j < len(right):
+        arr[k] = right[j]
+        yield Step(WRITE, k, value=right[j])
+        j += 1
+        k += 1
+    ops.free(r - l + 1)
+    ops.leave()
+
+
+def partition_steps(arr, low, high):
+    """Lomuto partition; the final pivot index is the generator's return value."""
+    pivot = arr[high]
+    i = low - 1
+    for j in range(low, high):
+        yield Step(COMPARE, j, high)
+        if arr[j] < pivot:
+            i += 1
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+                yield Step(SWAP, i, j)
+    if i + 1 != high:
+        arr[i + 1], arr[high] = arr[high], arr[i + 1]
+        yield Step(SWAP, i + 1, high)
+    return i + 1
+
+
+def quick_sort_steps(arr, low=0, high=None, ops=NO_COUNTER):
+    # Explicit stack instead of recursion so sorted 10^6-element inputs
+    # cannot overflow Python's recursion limit. Each pending range counts
+    # as one level of depth and two elements of auxiliary memory.
+    if high is None:
+        high = len(arr) - 1
+    stack = [(low, high)]
+    ops.enter()
+    ops.alloc(2)
+    while stack:
+        low, high = stack.pop()
+        ops.leave()
+        ops.free(2)
+        if low < high:
+            pi = yield from partition_steps(arr, low, high)
+            stack.append((pi + 1, high))
+            stack.append((low, pi - 1))
+            for _ in range(2):
+                ops.enter()
+                ops.alloc(2)
+
+
+def sift_down_steps(arr, n, i):
+    while True:
+        largest = i
+        l = 2 * i + 1
+        r = 2 * i + 2
+        if l < n:
+            yield Step(COMPARE, l, largest)
+            if arr[l] > arr[largest]:
+                largest = l
+        if r < n:
+            yield Step(COMPARE, r, largest)
+            if arr[r] > arr[largest]:
+                largest = r
+        if largest == i:
+            return
+        arr[i], arr[largest] = arr[largest], arr[i]
+        yield Step(SWAP, i, largest)
+        i = largest
+
+
+def heap_sort_steps(arr, ops=NO_COUNTER):
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        yield from sift_down_steps(arr, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[i], arr[0] = arr[0], arr[i]
+        yield Step(SWAP, 0, i)
+        yield from sift_down_steps(arr, i, 0)
+
+
+SORTING_STEPS = {
+    "Bubble Sort": bubble_sort_steps,
+    "Selection Sort": selection_sort_steps,
+    "Insertion Sort": insertion_sort_steps,
+    "Merge Sort": merge_sort_steps,
+    "Quick Sort": quick_sort_steps,
+    "Heap Sort": heap_sort_steps,
+}
@@ -0,0 +1,45 @@
+from collections import Counter, namedtuple
+
+# ---------------------------------------------
+# Step Events (shared by every algorithm)
+# ---------------------------------------------
+# Algorithms are written as plain generators that mutate the caller's data
+# in place and yield one Step after each operation has been applied.
+# Visualizers draw the data after every step; headless runners just count.
+
+COMPARE = "compare"      # a, b = indices / cells being compared
+SWAP = "swap"            # a, b = indices that were exchanged
+WRITE = "write"          # a (, b) = index / cell written, value = new value
+VISIT = "visit"          # a = node visited (b = search side in bidirectional search)
+RELAX = "relax"          # a -> b edge relaxed, value = new distance
+PLACE = "place"          # a, b = row, col placed (value = digit for Sudoku)
+BACKTRACK = "backtrack"  # a, b = row, col undone
+
+STEP_KINDS = (COMPARE, SWAP, WRITE, VISIT, RELAX, PLACE, BACKTRACK)
+
+Step = namedtuple("Step", ["kind", "a", "b", "value"], defaults=(None, None, None))
+
+
+def highlight_of(step):
+    """Returns the indices / cells a visualizer should highlight for a step."""
+    if step.b is None:
+        return [step.a]
+    if step.kind in (WRITE, PLACE, BACKTRACK):
+        return [(step.a, step.b)]
+    return [step.a, step.b]
+
+
+# ---------------------------------------------
+# Headless Runner
+# ---------------------------------------------
+def run_headless(steps, limit=None):
+    """Drains a step generator at full speed and returns a Counter of step kinds.
+
+    No pygame is touched, so this works on servers without a display.
+    """
+    counts = Counter()
+    for n, step in enumerate(steps, 1):
+        counts[step.kind] += 1
+        if limit is not None and n >= limit:
+            break
+    return counts
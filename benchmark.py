@@ -0,0 +1,191 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+import registry
+from algorithms.steps import run_headless, COMPARE, SWAP, WRITE
+
+# -----------------------------------------------------
+# 📈 Algorithm Benchmark Suite
+# -----------------------------------------------------
+# Runs every algorithm's step generator headless (no pygame) over a range
+# of sizes, input distributions and seeds, and records wall time, step
+# counts (comparisons, swaps, writes, ...) and peak memory.
+#
+#   python benchmark.py --out results.json
+#   python benchmark.py --only "Quick Sort,Dijkstra" --seeds 5
+#   python benchmark.py --baseline results.json --threshold 0.2
+#
+# With --baseline, any case whose median time grew by more than the
+# threshold is reported and the exit status is 1.
+
+# a time regression must also exceed this many seconds, so microsecond
+# cases do not flap on timer noise
+MIN_REGRESSION_S = 0.001
+
+# name -> (family, setup, default sizes, distributions), for every algorithm
+# in the registry that declares a case
+BENCHMARKS = {
+    a.name: (a.category, registry.benchmark_setup(a.name), a.sizes, registry.benchmark_inputs(a.name))
+    for a in registry.ALGORITHMS.values() if a.case
+}
+
+
+# -----------------------------------------------------
+# ⏱ Runner
+# -----------------------------------------------------
+def measure(setup, n, seed, distribution, memory=True):
+    """Runs one case twice: once timed, once under tracemalloc for peak memory."""
+    steps, check = setup(n, random.Random(seed), distribution)
+    start = time.perf_counter()
+    counts = run_headless(steps)
+    elapsed = time.perf_counter() - start
+    ok = check()
+
+    # tracemalloc slows allocation-heavy code several-fold, so memory gets its own run
+    peak = 0
+    if memory:
+        steps, _ = setup(n, random.Random(seed), distribution)
+        tracemalloc.start()
+        run_headless(steps)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "time_s": elapsed,
+        "comparisons": counts[COMPARE],
+        "swaps": counts[SWAP],
+        "writes": counts[WRITE],
+        "steps": sum(counts.values()),
+        "counts": dict(counts),
+        "peak_kb": peak / 1024,
+        "ok": bool(ok),
+    }
+
+
+def run_suite(names, seeds, sizes=None, memory=True, log=print):
+    results = []
+    for name in names:
+        family, setup, default_sizes, distributions = BENCHMARKS[name]
+        for distribution in distributions:
+            for n in sizes or default_sizes:
+                for seed in range(seeds):
+                    record = {"algorithm": name, "family": family, "distribution": distribution,
+                              "n": n, "seed": seed}
+                    record.update(measure(setup, n, seed, distribution, memory))
+                    results.append(record)
+                if log:
+                    log(f"  {name:<22} {distribution:<10} n={n:<7} done")
+    return results
+
+
+def case_key(record):
+    return record["algorithm"], record["distribution"], record["n"]
+
+
+def summarize(results):
+    """Groups records by (algorithm, distribution, n); medians for time, means for counts."""
+    groups = defaultdict(list)
+    for record in results:
+        groups[case_key(record)].append(record)
+
+    rows = []
+    for key, records in groups.items():
+        rows.append({
+            "key": key,
+            "time_s": statistics.median(r["time_s"] for r in records),
+            "comparisons": statistics.mean(r["comparisons"] for r in records),
+            "swaps": statistics.mean(r["swaps"] for r in records),
+            "writes": statistics.mean(r["writes"] for r in records),
+            "steps": statistics.mean(r["steps"] for r in records),
+            "peak_kb": max(r["peak_kb"] for r in records),
+            "ok": all(r["ok"] for r in records),
+        })
+    return rows
+
+
+def format_table(rows):
+    header = (f"{'Algorithm':<22} {'Input':<15} {'N':>7} {'Time (ms)':>11} {'Compares':>12} "
+              f"{'Swaps':>10} {'Writes':>10} {'Steps':>12} {'Peak KB':>9}  OK")
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        name, distribution, n = row["key"]
+        lines.append(f"{name:<22} {distribution:<15} {n:>7} {row['time_s'] * 1000:>11.2f} "
+                     f"{row['comparisons']:>12.0f} {row['swaps']:>10.0f} {row['writes']:>10.0f} "
+                     f"{row['steps']:>12.0f} {row['peak_kb']:>9.1f}  {'✔' if row['ok'] else '✘'}")
+    return "\n".join(lines)
+
+
+def find_regressions(rows, baseline_results, threshold):
+    """Returns (key, baseline s, current s) for cases slower than baseline by > threshold."""
+    baseline = {row["key"]: row["time_s"] for row in summarize(baseline_results)}
+    regressions = []
+    for row in rows:
+        before = baseline.get(row["key"])
+        if before is None:
+            continue
+        now = row["time_s"]
+        if now > before * (1 + threshold) and now - before > MIN_REGRESSION_S:
+            regressions.append((row["key"], before, now))
+    return regressions
+
+
+# -----------------------------------------------------
+# 🚀 Entry Point
+# -----------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the DAA Visualizer algorithms headless.")
+    parser.add_argument("--only", help="comma-separated algorithm names (default: all)")
+    parser.add_argument("--seeds", type=int, default=3, help="runs per case, one per seed")
+    parser.add_argument("--sizes", help="comma-separated N values overriding each algorithm's defaults")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run (about 2x faster)")
+    parser.add_argument("--out", help="write the raw results as JSON to this file")
+    parser.add_argument("--baseline", help="earlier --out file to compare median times against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        sys.exit(f"❌ Unknown algorithm(s): {', '.join(unknown)}. Choose from: {', '.join(BENCHMARKS)}")
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else None
+
+    print(f"📈 Benchmarking {len(names)} algorithm(s), {args.seeds} seed(s) each...")
+    results = run_suite(names, args.seeds, sizes, memory=not args.no_memory)
+    rows = summarize(results)
+    print()
+    print(format_table(rows))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "seeds": args.seeds, "results": results}, f, indent=1)
+        print(f"\n💾 Results written to {args.out}")
+
+    failed = [row["key"] for row in rows if not row["ok"]]
+    for key in failed:
+        print(f"❌ Wrong result: {key}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(rows, baseline, args.threshold)
+        for (name, distribution, n), before, now in regressions:
+            print(f"🐢 Regression: {name} [{distribution}, n={n}] "
+                  f"{before * 1000:.2f} ms -> {now * 1000:.2f} ms (+{now / before - 1:.0%})")
+        if not regressions:
+            print(f"✅ No regressions above {args.threshold:.0%} against {args.baseline}")
+
+    if failed or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+import argparse
+import multiprocessing
+import os
+import random
+import re
+import shlex
+import struct
+import sys
+import time
+import zlib
+from collections import deque
+
+import pygame
+import registry
+from visuals.tween import TweenEngine
+
+# -----------------------------------------------------
+# 🎞️ Offline Animation Export
+# -----------------------------------------------------
+# Replays one visualizer off-screen (SDL dummy driver) and writes every
+# frame to disk, with no real-time delays:
+#
+#   python export.py "Bubble Sort" --out export/bubble
+#   python export.py Dijkstra --size 8 --format gif --out export/dijkstra
+#   python export.py --list
+#
+# The visual functions themselves draw the frames: the module's SCHEDULER
+# is swapped for a FrameRecorder, which runs a fixed number of steps per
+# frame and grabs the screen after each render. Drawing a frame takes
+# about a millisecond; compressing it takes several times longer, so the raw
+# frames are handed to a process pool that encodes them on every core.
+#
+# PNG output is an ffmpeg-ready sequence (frame_000000.png, ...):
+#   ffmpeg -framerate 30 -i frame_%06d.png -pix_fmt yuv420p out.mp4
+# GIF output needs Pillow (pip install pillow).
+
+WIDTH, HEIGHT = 1000, 600
+FPS = 30
+
+
+# -----------------------------------------------------
+# 🎬 Export Targets
+# -----------------------------------------------------
+# Built from the registry: every algorithm with a visual can be exported.
+# The visual's arguments come from its category (see registry.py), with a
+# default --size; a few algorithms override them.
+#
+# name -> (module, default size, run(module, screen, size))
+def _search_args(m, size):
+    arr = [random.randint(10, 99) for _ in range(size)]
+    return arr, random.choice(arr), True
+
+
+# category -> (default size, args(module, size) for visual(screen, *args))
+CATEGORY_ARGS = {
+    "sorting": (80, lambda m, size: (m.generate_array(size),)),
+    "searching": (20, _search_args),
+    "graph": (6, lambda m, size: (m.generate_random_graph(size),)),
+    "dp": (None, lambda m, size: ()),
+    "backtracking": (None, lambda m, size: ()),
+}
+
+# name -> (default size, args): point-to-point searches want a larger graph with positions
+ALGORITHM_ARGS = {
+    "A*": (300, lambda m, size: (m.generate_random_graph(size, "Geometric"),)),
+    "Bidirectional Dijkstra": (300, lambda m, size: (m.generate_random_graph(size, "Geometric"),)),
+    "N-Queens": (8, lambda m, size: (size,)),
+}
+
+
+def _target(algorithm):
+    module, _, attribute = algorithm.visual.partition(":")
+    default_size, args = ALGORITHM_ARGS.get(algorithm.name, CATEGORY_ARGS[algorithm.category])
+    return (module, default_size,
+            lambda m, screen, size: getattr(m, attribute)(screen, *args(m, size)))
+
+
+TARGETS = {a.name: _target(a) for a in registry.ALGORITHMS.values() if a.visual}
+
+
+# -----------------------------------------------------
+# 🧵 Frame Encoding (runs in the worker processes)
+# -----------------------------------------------------
+def _png_chunk(kind, body):
+    return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+
+def encode_png(data, size, paths):
+    """Writes raw RGB bytes as a PNG with fast (level 1) compression.
+
+    pygame.image.save uses libpng's default level, which costs ~5x as much
+    for frames that are mostly flat colour anyway.
+    """
+    width, height = size
+    stride = width * 3
+    rows = b"".join(b"\x00" + data[y * stride:(y + 1) * stride] for y in range(height))
+    png = (b"\x89PNG\r\n\x1a\n"
+           + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+           + _png_chunk(b"IDAT", zlib.compress(rows, 1))
+           + _png_chunk(b"IEND", b""))
+    for path in paths:  # held frames: same image under several numbers
+        with open(path, "wb") as f:
+            f.write(png)
+
+
+def encode_gif_frame(data, size, paths):
+    from PIL import Image
+    # quantizing is the slow part of GIF encoding, so it happens here in parallel
+    Image.frombytes("RGB", size, data).quantize(256).save(paths[0])
+
+
+class FrameWriter:
+    """Feeds captured frames to a process pool, keeping a bounded number in flight."""
+
+    def __init__(self, out_dir, fmt="png", workers=None):
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.encode = encode_gif_frame if fmt == "gif" else encode_png
+        workers = workers or os.cpu_count()
+        self.pool = multiprocessing.get_context("spawn").Pool(workers)
+        self.limit = 4 * workers
+        self.pending = deque()
+        self.frames = 0
+        self.images = []  # (path, duration in frames), used to assemble the GIF
+
+    def write(self, data, size, repeat=1):
+        if self.fmt == "gif":
+            # a held frame is one GIF frame with a longer duration
+            paths = [os.path.join(self.out_dir, f"gif_{len(self.images):06d}.png")]
+            self.images.append((paths[0], repeat))
+        else:
+            paths = [os.path.join(self.out_dir, f"frame_{self.frames + i:06d}.png") for i in range(repeat)]
+        self.frames += repeat
+
+        while len(self.pending) >= self.limit:
+            self.pending.popleft().get()
+        self.pending.append(self.pool.apply_async(self.encode, (data, size, paths)))
+
+    def close(self, fps):
+        while self.pending:
+            self.pending.popleft().get()
+        self.pool.close()
+        self.pool.join()
+        if self.fmt == "gif":
+            return self._assemble_gif(fps)
+        return self.out_dir
+
+    def _assemble_gif(self, fps):
+        from PIL import Image
+        path = os.path.join(self.out_dir, "animation.gif")
+        frames = (Image.open(p) for p, _ in self.images[1:])
+        first = Image.open(self.images[0][0])
+        first.save(path, save_all=True, append_images=frames, loop=0,
+                   duration=[round(1000 * n / fps) for _, n in self.images])
+        for p, _ in self.images:
+            os.remove(p)
+        return path
+
+
+# -----------------------------------------------------
+# 📼 Recording Scheduler
+# -----------------------------------------------------
+class FrameRecorder:
+    """Stands in for a visual module's StepScheduler during an export.
+
+    run() renders after every `steps_per_frame` steps instead of on a clock,
+    and hold(ms) becomes ms worth of repeated frames, so the exported video
+    plays back at the same pace at any export speed. Tweens advance exactly
+    1/fps per captured frame, so animations export identically every time.
+    """
+
+    def __init__(self, screen, writer, steps_per_frame=1, fps=FPS):
+        self.screen = screen
+        self.writer = writer
+        self.steps_per_frame = steps_per_frame
+        self.fps = fps
+        self.steps_run = 0
+        self.tweens = TweenEngine()
+        self.handlers = []  # no input while exporting
+
+    def capture(self, repeat=1):
+        data = pygame.image.tobytes(self.screen, "RGB")
+        self.writer.write(data, self.screen.get_size(), repeat)
+
+    def label(self):
+        return f"{self.steps_per_frame} steps/frame"
+
+    # pacing is steps_per_frame: speed changes made by the visuals are ignored
+    steps_per_second = None
+
+    def set_speed(self, steps_per_second):
+        pass
+
+    def handle_event(self, event):
+        return False
+
+    def pump(self):
+        pygame.event.pump()
+
+    def run(self, steps, on_step=None, render=None):
+        ran = 0
+        while True:
+            try:
+                step = next(steps)
+            except StopIteration as done:
+                if render:
+                    render()
+                self.capture()
+                return done.value
+            ran += 1
+            self.steps_run += 1
+            if on_step:
+                on_step(step)
+            if ran % self.steps_per_frame == 0 and render:
+                self.tweens.advance(1 / self.fps)
+                render()
+                self.capture()
+
+    def hold(self, ms, render=None):
+        frames = max(1, round(ms * self.fps / 1000))
+        # tweens advance exactly one frame per captured frame, so exports are deterministic
+        while render and self.tweens.active and frames > 1:
+            self.tweens.advance(1 / self.fps)
+            render()
+            self.capture()
+            frames -= 1
+        self.capture(frames)
+
+
+# -----------------------------------------------------
+# 🚀 Entry Point
+# -----------------------------------------------------
+def export(name, out_dir, fmt="png", size=None, seed=0, steps_per_frame=1, fps=FPS, workers=None):
+    """Replays one visualizer into out_dir; returns (frame count, output path)."""
+    if fmt == "gif":
+        import PIL  # noqa: F401  fail before rendering anything if Pillow is missing
+    module_name, default_size, run = TARGETS[name]
+    os.makedirs(out_dir, exist_ok=True)
+
+    # start the workers before SDL is initialized in this process
+    writer = FrameWriter(out_dir, fmt, workers)
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    random.seed(seed)
+    try:
+        import numpy
+        numpy.random.seed(seed)
+    except ModuleNotFoundError:
+        pass
+
+    module = __import__(module_name, fromlist=["SCHEDULER"])
+    module.SCHEDULER = FrameRecorder(screen, writer, steps_per_frame, fps)
+    run(module, screen, size or default_size)
+
+    path = writer.close(fps)
+    pygame.quit()
+    return writer.frames, path
+
+
+def video_name(algorithm):
+    """A shell- and path-safe file name for the algorithm's video ("0/1 Knapsack" -> 0_1_knapsack.mp4)."""
+    return (re.sub(r"[^0-9a-z]+", "_", algorithm.lower()).strip("_") or "export") + ".mp4"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a DAA Visualizer animation to PNG frames or a GIF.")
+    parser.add_argument("algorithm", nargs="?", help="display name, e.g. \"Bubble Sort\" (see --list)")
+    parser.add_argument("--out", default="export", help="output directory")
+    parser.add_argument("--format", choices=["png", "gif"], default="png")
+    parser.add_argument("--size", type=int, help="array length / node count / board size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--steps-per-frame", type=int, default=1)
+    parser.add_argument("--fps", type=int, default=FPS)
+    parser.add_argument("--workers", type=int, help="encoder processes (default: all cores)")
+    parser.add_argument("--list", action="store_true", help="list exportable algorithms")
+    args = parser.parse_args()
+
+    if args.list or not args.algorithm:
+        print("\n".join(TARGETS))
+        return
+    if args.algorithm not in TARGETS:
+        sys.exit(f"❌ Unknown algorithm: {args.algorithm} (see --list)")
+
+    start = time.perf_counter()
+    frames, path = export(args.algorithm, args.out, args.format, args.size, args.seed,
+                          args.steps_per_frame, args.fps, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"🎞️ {frames} frames in {elapsed:.1f}s ({frames / elapsed:.0f} frames/s) -> {path}")
+    if args.format == "png":
+        print(f"   ffmpeg -framerate {args.fps} -i {shlex.quote(os.path.join(path, 'frame_%06d.png'))} "
+              f"-pix_fmt yuv420p {video_name(args.algorithm)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,96 @@
-import pygame
+from visuals import startup  # first, so the startup clock covers every import below
+import importlib
 import sys
-import time
-from menu import show_main_menu
+from functools import partial
+
+with startup.timed("import pygame"):
+    import pygame
+with startup.timed("import menu"):
+    from menu import show_main_menu
+import registry
+from visuals.fonts import get_font, text_cache_stats, warm_fonts
+from visuals.preloader import Preloader
+from visuals.sounds import load_sounds
 
 # -----------------------------------------------------
 # 🧩 Initialize pygame
 # -----------------------------------------------------
-pygame.init()
-pygame.mixer.init()
-
-# Screen setup
+# Only the display starts here. Fonts, the mixer and the visualizer
+# modules are loaded by PRELOADER on a background thread once the menu is
+# up, so none of them delays it. Run with --startup-trace to see where
+# start-up goes.
 WIDTH, HEIGHT = 1000, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("🎮 DAA Visualizer")
+with startup.timed("display init + window"):
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("🎮 DAA Visualizer")
+
+# The intro splash shows preload progress and ends as soon as loading is
+# done (any key skips it); --no-splash goes straight to the menu. With
+# --startup-trace the splash gets its own line and is left out of the
+# menu's time-to-interactive.
+SHOW_SPLASH = "--no-splash" not in sys.argv
+
+# --graph FILE offers a real graph (edge list, DIMACS .gr, Matrix Market) in the graph menu
+GRAPH_FILE = sys.argv[sys.argv.index("--graph") + 1] if "--graph" in sys.argv[:-1] else None
+
+# One visualizer module per registry category. All of them are imported in
+# the background while the menu is up, then sounds load and fonts are warmed.
+CATEGORIES = {category.label: category for category in registry.CATEGORIES}
+PRELOADER = Preloader(
+    [(category.module, partial(importlib.import_module, category.module))
+     for category in CATEGORIES.values()]
+    + [("sounds", load_sounds), ("fonts", warm_fonts)]
+)
+
+# extra arguments for a category's menu entry point
+MENU_OPTIONS = {"graph": {"graph_file": GRAPH_FILE}}
 
 # Fonts
-TITLE_FONT = pygame.font.Font(None, 90)
-SUB_FONT = pygame.font.Font(None, 40)
+TITLE_FONT = get_font(90)
+SUB_FONT = get_font(40)
+SMALL_FONT = get_font(28)
 
 # Colors
 BG_COLOR = (255, 255, 255)
 TEXT_COLOR = (25, 25, 25)
 ACCENT_COLOR = (30, 150, 220)
 
+# -----------------------------------------------------
+# 📦 Preload Progress Bar
+# -----------------------------------------------------
+def draw_progress(screen, y):
+    """Progress bar + current task of the background preloader."""
+    bar = pygame.Rect(WIDTH // 2 - 200, y, 400, 12)
+    pygame.draw.rect(screen, (225, 225, 225), bar, border_radius=6)
+    filled = bar.copy()
+    filled.width = int(bar.width * PRELOADER.progress())
+    if filled.width:
+        pygame.draw.rect(screen, ACCENT_COLOR, filled, border_radius=6)
+    current = PRELOADER.current
+    if current:
+        label = SMALL_FONT.render(f"Loading {current}", True, (120, 120, 120))
+        screen.blit(label, label.get_rect(center=(WIDTH // 2, y + 36)))
+
+
 # -----------------------------------------------------
 # ✨ Splash / Intro Screen
 # -----------------------------------------------------
 def show_splash(screen):
-    """Displays an elegant fade-in splash screen."""
-    screen.fill(BG_COLOR)
+    """Fades the title in over real preload progress; ends when loading is done (any key skips)."""
     title = TITLE_FONT.render("DAA VISUALIZER", True, ACCENT_COLOR)
     sub = SUB_FONT.render("Designed & Developed by Sumit Maurya", True, TEXT_COLOR)
-
-    for alpha in range(0, 255, 8):
+    clock = pygame.time.Clock()
+    alpha = 0
+
+    while not PRELOADER.is_done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                return
+        alpha = min(alpha + 8, 255)
         screen.fill(BG_COLOR)
         title_surf = title.copy()
         title_surf.set_alpha(alpha)
@@ -40,11 +98,9 @@ def show_splash(screen):
         sub_surf.set_alpha(alpha)
         screen.blit(title_surf, title_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40)))
         screen.blit(sub_surf, sub_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 40)))
+        draw_progress(screen, HEIGHT // 2 + 110)
         pygame.display.flip()
-        pygame.time.delay(30)
-
-    time.sleep(0.8)
-    fade_out(screen)
+        clock.tick(60)
 
 
 # -----------------------------------------------------
@@ -64,19 +120,20 @@ def fade_out(screen, color=(255, 255, 255)):
 # -----------------------------------------------------
 # 💡 Loading Overlay (between modules)
 # -----------------------------------------------------
-def show_loading(screen, text="Loading..."):
-    """Displays a quick loading transition."""
-    overlay = pygame.Surface(screen.get_size())
-    overlay.fill(BG_COLOR)
-    loading_text = SUB_FONT.render(text, True, (70, 70, 70))
-    dots = ["", ".", "..", "..."]
-    for i in range(4):
-        screen.blit(overlay, (0, 0))
-        screen.blit(loading_text, loading_text.get_rect(center=(WIDTH // 2 - 20, HEIGHT // 2)))
-        dots_text = SUB_FONT.render(dots[i], True, ACCENT_COLOR)
-        screen.blit(dots_text, (WIDTH // 2 + 120, HEIGHT // 2))
+def show_loading(screen, text, task):
+    """Shows preload progress until `task` has finished; returns at once if it already has."""
+    clock = pygame.time.Clock()
+    while not PRELOADER.is_done(task):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        screen.fill(BG_COLOR)
+        loading_text = SUB_FONT.render(text, True, (70, 70, 70))
+        screen.blit(loading_text, loading_text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+        draw_progress(screen, HEIGHT // 2 + 50)
         pygame.display.flip()
-        pygame.time.delay(250)
+        clock.tick(60)
 
 
 # -----------------------------------------------------
@@ -85,8 +142,11 @@ def show_loading(screen, text="Loading..."):
 def main():
     print("🎯 Launching DAA Visualizer...")
     running = True
+    PRELOADER.start()
 
-    show_splash(screen)  # Intro
+    if SHOW_SPLASH:
+        with startup.excluded("splash screen"):
+            show_splash(screen)  # Intro
 
     while running:
         # Display main menu and get choice
@@ -94,33 +154,17 @@ def main():
         print(f"✅ Selected: {choice}")
 
         try:
-            if choice == "Sorting":
-                show_loading(screen, "Loading Sorting Visualizer")
-                import visuals.sorting as sorting
-                sorting.run_sorting_visual(screen)
-
-            elif choice == "Searching":
-                show_loading(screen, "Loading Searching Visualizer")
-                import algorithms.searching as searching
-                searching.run_search_visual(screen)
-
-            elif choice == "Graphs":
-                show_loading(screen, "Loading Graph Algorithms")
-                import visuals.graph_visual as graph
-                graph.run_graph_visual(screen)
-
-            elif choice == "DP":
-                show_loading(screen, "Loading Dynamic Programming")
-                import visuals.dp_visual as dp
-                dp.run_dp_visual(screen)
-
-            elif choice == "Backtracking":
-                show_loading(screen, "Loading Backtracking Algorithms")
-                import visuals.backtracking_visual as backtrack
-                backtrack.run_backtracking_visual(screen)
+            if choice in CATEGORIES:
+                category = CATEGORIES[choice]
+                show_loading(screen, category.loading, category.module)
+                run_menu = registry.resolve(category.menu)
+                run_menu(screen, **MENU_OPTIONS.get(category.key, {}))
 
             elif choice == "Exit":
                 fade_out(screen)
+                stats = text_cache_stats()
+                print(f"🔤 Text cache: {stats['hits']} hits, {stats['misses']} misses "
+                      f"({stats['hit_rate']:.0%} hit rate)")
                 print("👋 Exiting the DAA Visualizer...")
                 running = False
 
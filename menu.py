@@ -1,21 +1,33 @@
 import pygame
 import sys
+from visuals.layers import StaticLayer
+from visuals.fonts import get_font
+from visuals import startup
+from registry import CATEGORIES
 
 # ----------------------------------------
 # Menu Options
 # ----------------------------------------
-BUTTONS = ["Sorting", "Searching", "Graphs", "DP", "Backtracking", "Exit"]
+BUTTONS = [category.label for category in CATEGORIES] + ["Exit"]
 
 # ----------------------------------------
 # Draw Rounded Background & Title
 # ----------------------------------------
-def draw_background(screen):
-    """Draws a soft white background with slight gradient."""
-    width, height = screen.get_size()
+def paint_background(surface):
+    """Paints a soft white background with slight gradient."""
+    width, height = surface.get_size()
     for y in range(height):
         ratio = y / height
         shade = int(255 - 10 * ratio)
-        pygame.draw.line(screen, (shade, shade, shade), (0, y), (width, y))
+        pygame.draw.line(surface, (shade, shade, shade), (0, y), (width, y))
+
+
+BACKGROUND_LAYER = StaticLayer(paint_background)
+
+
+def draw_background(screen):
+    """Blits the cached gradient (rebuilt only when the window size changes)."""
+    BACKGROUND_LAYER.blit(screen)
 
 # ----------------------------------------
 # Draw Animated Menu
@@ -26,9 +38,12 @@ def draw_menu(screen, selected_index, font, fade, pulse):
     width, height = screen.get_size()
 
     # --- Title ---
-    title_font = pygame.font.Font(None, 90)
+    title_font = get_font(90)
     title_surface = title_font.render("DAA VISUALIZER", True, (20, 90, 160))
-    title_surface.set_alpha(fade)
+    if fade < 255:
+        # rendered text is shared through the cache, so fade a copy
+        title_surface = title_surface.copy()
+        title_surface.set_alpha(fade)
     title_rect = title_surface.get_rect(center=(width // 2, 100))
     screen.blit(title_surface, title_rect)
 
@@ -69,8 +84,7 @@ def draw_menu(screen, selected_index, font, fade, pulse):
 # ----------------------------------------
 def show_main_menu(screen):
     """Displays the minimal white-theme main menu."""
-    pygame.font.init()
-    font = pygame.font.Font(None, 60)
+    font = get_font(60)
     selected = 0
     fade = 0
     fade_in = True
@@ -93,6 +107,7 @@ def show_main_menu(screen):
             pulse_direction *= -1
 
         draw_menu(screen, selected, font, fade, pulse)
+        startup.mark_interactive()
 
         # --- Event Handling ---
         for event in pygame.event.get():
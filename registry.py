@@ -0,0 +1,196 @@
+import importlib
+from collections import namedtuple
+
+# -----------------------------------------------------
+# 🗂️ Algorithm Registry
+# -----------------------------------------------------
+# Every algorithm is declared once, here: its name, category, complexity
+# metadata, visual entry point and headless benchmark case. The main menu,
+# the category menus, the complexity panels, benchmark.py and export.py are
+# all built from these tables.
+#
+# Entry points are "module:attribute" strings, imported the first time
+# they are used, so importing the registry imports no algorithm or visual
+# code: start-up pays for one menu entry per category, however many
+# algorithms there are.
+#
+# Visual entry points take the same arguments within a category:
+#
+#   sorting           visual(screen, arr)
+#   searching         visual(screen, arr, target, muted) -> (found, comparisons)
+#   graph             visual(screen, graph)
+#   dp, backtracking  visual(screen)
+#
+# A case is (ref, args): resolve(ref)(*args) is a benchmark setup(n, rng,
+# distribution) (the ref itself is the setup when there are no args).
+
+# key: benchmark family; menu: entry point run from the main menu;
+# inputs: ref to the benchmark input distributions (None: random only)
+Category = namedtuple("Category", "key label module menu loading inputs")
+
+Algorithm = namedtuple("Algorithm", "name category time space concept color visual case sizes")
+
+CATEGORIES = [
+    Category("sorting", "Sorting", "visuals.sorting", "visuals.sorting:run_sorting_visual",
+             "Loading Sorting Visualizer", "algorithms.benchmark_cases:SORT_DISTRIBUTIONS"),
+    Category("searching", "Searching", "algorithms.searching", "algorithms.searching:run_search_visual",
+             "Loading Searching Visualizer", None),
+    Category("graph", "Graphs", "visuals.graph_visual", "visuals.graph_visual:run_graph_visual",
+             "Loading Graph Algorithms", "algorithms.benchmark_cases:GRAPH_KINDS"),
+    Category("dp", "DP", "visuals.dp_visual", "visuals.dp_visual:run_dp_visual",
+             "Loading Dynamic Programming", None),
+    Category("backtracking", "Backtracking", "visuals.backtracking_visual",
+             "visuals.backtracking_visual:run_backtracking_visual",
+             "Loading Backtracking Algorithms", None),
+]
+
+ALGORITHMS = {}
+
+
+def register(name, category, time, space, concept, color, visual=None, case=None, sizes=()):
+    """Adds one algorithm; visual=None keeps it out of the menus (benchmark only)."""
+    ALGORITHMS[name] = Algorithm(name, category, time, space, concept, color, visual, case, sizes)
+
+
+def case(setup, *args):
+    """A benchmark case from algorithms/benchmark_cases.py."""
+    return f"algorithms.benchmark_cases:{setup}", args
+
+
+# ---------- sorting ----------
+register("Bubble Sort", "sorting", "O(n²)", "O(1)", "Swaps adjacent pairs until nothing moves.",
+         (0, 120, 255), "visuals.sorting:bubble_sort_visual",
+         case("sorting_case", "Bubble Sort"), (100, 200, 500))
+register("Selection Sort", "sorting", "O(n²)", "O(1)", "Moves the smallest remaining item to the front.",
+         (0, 160, 120), "visuals.sorting:selection_sort_visual",
+         case("sorting_case", "Selection Sort"), (100, 200, 500))
+register("Insertion Sort", "sorting", "O(n²)", "O(1)", "Inserts each item into the sorted prefix.",
+         (200, 120, 0), "visuals.sorting:insertion_sort_visual",
+         case("sorting_case", "Insertion Sort"), (100, 200, 500))
+register("Merge Sort", "sorting", "O(n log n)", "O(n)", "Sorts both halves, then merges them.",
+         (150, 50, 150), "visuals.sorting:merge_sort_visual",
+         case("sorting_case", "Merge Sort"), (1000, 2000, 5000))
+register("Quick Sort", "sorting", "O(n log n)", "O(log n)", "Partitions around a pivot, then recurses.",
+         (200, 40, 40), "visuals.sorting:quick_sort_visual",
+         case("sorting_case", "Quick Sort"), (1000, 2000, 5000))
+register("Heap Sort", "sorting", "O(n log n)", "O(1)", "Builds a max-heap and pops it into place.",
+         (0, 140, 180), "visuals.sorting:heap_sort_visual",
+         case("sorting_case", "Heap Sort"), (1000, 2000, 5000))
+
+# ---------- searching ----------
+register("Linear Search", "searching", "O(n)", "O(1)", "Checks every item in turn.",
+         (0, 100, 255), "algorithms.searching:linear_search_visual",
+         case("linear_search_case"), (1000, 10000, 100000))
+register("Binary Search", "searching", "O(log n)", "O(1)", "Halves a sorted range on every probe.",
+         (0, 160, 0), "algorithms.searching:binary_search_visual",
+         case("binary_search_case"), (1000, 10000, 100000))
+
+# ---------- graphs ----------
+register("BFS", "graph", "O(V + E)", "O(V)", "Visits nodes level by level from the start.",
+         (0, 100, 255), "visuals.graph_visual:bfs_visual",
+         case("graph_case", "BFS"), (1000, 10000, 50000))
+register("DFS", "graph", "O(V + E)", "O(V)", "Follows one branch as deep as it goes first.",
+         (0, 160, 0), "visuals.graph_visual:dfs_visual",
+         case("graph_case", "DFS"), (1000, 10000, 50000))
+register("Dijkstra", "graph", "O((V + E) log V)", "O(V)", "Settles nodes in order of distance.",
+         (200, 80, 0), "visuals.graph_visual:dijkstra_visual",
+         case("graph_case", "Dijkstra"), (1000, 10000, 50000))
+register("Dijkstra P2P", "graph", "O((V + E) log V)", "O(V)", "Dijkstra that stops at the target.",
+         (200, 80, 0), None,
+         case("shortest_path_case", "Dijkstra"), (1000, 10000, 50000))
+register("A*", "graph", "O((V + E) log V)", "O(V)", "Dijkstra guided by straight-line distance.",
+         (150, 0, 200), "visuals.graph_visual:astar_visual",
+         case("shortest_path_case", "A*"), (1000, 10000, 50000))
+register("Bidirectional Dijkstra", "graph", "O((V + E) log V)", "O(V)",
+         "Searches from both ends until they meet.",
+         (220, 0, 0), "visuals.graph_visual:bidirectional_dijkstra_visual",
+         case("shortest_path_case", "Bidirectional Dijkstra"),
+         (1000, 10000, 50000))
+
+# ---------- dynamic programming ----------
+register("Floyd–Warshall", "dp", "O(V³)", "O(V²)", "Finds shortest path between all pairs using DP.",
+         (0, 100, 255), "visuals.dp_visual:floyd_warshall_visual",
+         case("floyd_warshall_case"), (100, 250, 500))
+register("0/1 Knapsack", "dp", "O(N·W)", "O(W)", "Maximizes total value under capacity constraints.",
+         (0, 160, 0), "visuals.dp_visual:knapsack_visual",
+         case("knapsack_case"), (100, 300, 1000))
+register("Large Knapsack", "dp", "O(N·W)", "O(N·W)", "Every row of a 3000-item table, as a heatmap.",
+         (0, 160, 0), "visuals.dp_visual:knapsack_heatmap_visual")
+register("LCS", "dp", "O(M·N)", "O(M·N)", "Finds longest subsequence common to two strings.",
+         (180, 60, 60), "visuals.dp_visual:lcs_visual",
+         case("lcs_case"), (50, 100, 200))
+register("LCS Hirschberg", "dp", "O(M·N / w)", "O(M + N)", "Recovers the LCS from half-splits in linear space.",
+         (180, 60, 60), None,
+         case("lcs_engine_case", "hirschberg"), (1000, 10000, 30000))
+register("LCS Bit-Parallel", "dp", "O(M·N / w)", "O(N / w)", "LCS length, one machine word per 64 columns.",
+         (180, 60, 60), None,
+         case("lcs_engine_case", "bit-parallel"), (1000, 10000, 100000))
+register("LCS Table Heatmap", "dp", "O(M·N)", "O(M·N)", "Every row of a 3000 x 3000 table, as a heatmap.",
+         (180, 60, 60), "visuals.dp_visual:lcs_heatmap_visual")
+register("Matrix Chain", "dp", "O(N³)", "O(N²)", "Optimizes matrix multiplication order.",
+         (120, 0, 150), "visuals.dp_visual:matrix_chain_visual",
+         case("matrix_chain_case"), (10, 25, 50))
+register("Matrix Chain NumPy", "dp", "O(N³)", "O(N²)", "The same table, one chain length per array step.",
+         (120, 0, 150), None,
+         case("matrix_chain_engine_case", "dp"), (100, 300, 1000))
+register("Matrix Chain Hu–Shing", "dp", "O(N log N)", "O(N)", "Triangulates the dimension polygon.",
+         (120, 0, 150), None,
+         case("matrix_chain_engine_case", "hu-shing"), (1000, 10000, 30000))
+
+# ---------- backtracking ----------
+register("N-Queens", "backtracking", "O(N!)", "O(N)", "Place N queens safely.",
+         (0, 160, 255), "visuals.backtracking_visual:nqueens_demo",
+         case("nqueens_case"), (6, 8, 10))
+register("N-Queens Count", "backtracking", "O(N!)", "O(N)", "Counts every solution, half the board by symmetry.",
+         (0, 160, 255), None,
+         case("nqueens_count_case"), (10, 12, 14))
+register("Sudoku Solver", "backtracking", "O(9ⁿ)", "O(81)", "Fills the fewest-candidate cell first.",
+         (0, 180, 100), "visuals.backtracking_visual:sudoku_demo",
+         case("sudoku_case"), (9,))
+register("Sudoku Bitset", "backtracking", "O(9ⁿ)", "O(81)", "Row / column / box masks, MRV and singles.",
+         (0, 180, 100), None,
+         case("sudoku_batch_case", "bits"), (10, 100, 300))
+register("Sudoku DLX", "backtracking", "O(9ⁿ)", "O(729)", "Exact cover with Dancing Links.",
+         (0, 180, 100), None,
+         case("sudoku_batch_case", "dlx"), (10, 100, 300))
+register("Rat in a Maze", "backtracking", "O(2^(N²))", "O(N²)", "Find path from start to destination.",
+         (200, 80, 0), "visuals.backtracking_visual:maze_demo",
+         case("maze_case"), (10, 20, 40))
+register("Subset Sum", "backtracking", "O(2ⁿ)", "O(n)", "Find subsets matching target sum.",
+         (150, 50, 150), "visuals.backtracking_visual:subset_sum_demo",
+         case("subset_sum_case"), (8, 12, 16))
+
+
+# -----------------------------------------------------
+# 🔎 Lookups
+# -----------------------------------------------------
+def resolve(ref):
+    """Imports 'module:attribute' (on first use; later calls hit sys.modules) and returns it."""
+    module, _, attribute = ref.partition(":")
+    return getattr(importlib.import_module(module), attribute)
+
+
+def category(key):
+    return next(c for c in CATEGORIES if c.key == key)
+
+
+def algorithms_in(key):
+    """The menu entries of one category, in registration order."""
+    return [a for a in ALGORITHMS.values() if a.category == key and a.visual]
+
+
+def visual(name):
+    """The visual entry point for name, importing its module if needed."""
+    return resolve(ALGORITHMS[name].visual)
+
+
+def benchmark_setup(name):
+    """The benchmark setup(n, rng, distribution) for name."""
+    ref, args = ALGORITHMS[name].case
+    setup = resolve(ref)
+    return setup(*args) if args else setup
+
+
+def benchmark_inputs(name):
+    inputs = category(ALGORITHMS[name].category).inputs
+    return tuple(resolve(inputs)) if inputs else ("random",)
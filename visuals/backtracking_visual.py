@@ -2,83 +2,135 @@ import pygame
 import sys
 import time
 import random
-
-pygame.font.init()
-FONT = pygame.font.Font(None, 40)
-BIG_FONT = pygame.font.Font(None, 60)
-SMALL_FONT = pygame.font.Font(None, 28)
+from algorithms.steps import COMPARE, WRITE, PLACE, BACKTRACK
+from algorithms.nqueens import queens_steps, attacked_squares, count_solutions, first_solution
+from algorithms.sudoku import sudoku_steps, digits_of, parse, shuffled, to_grid, PUZZLES
+from algorithms.backtracking_steps import maze_steps, subset_sum_steps
+from visuals.layers import StaticLayer
+from visuals.fonts import get_font
+from visuals.scheduler import StepScheduler
+from registry import ALGORITHMS, algorithms_in, visual
+
+FONT = get_font(40)
+BIG_FONT = get_font(60)
+SMALL_FONT = get_font(28)
 
 # -------------------------------------------------------------
 # Global speed controller
 # -------------------------------------------------------------
-SPEEDS = {"Slow": 500, "Medium": 200, "Fast": 50}
-current_speed = "Medium"
+SPEEDS = {"Slow": 2, "Medium": 5, "Fast": 20}  # steps per second
+SCHEDULER = StepScheduler(steps_per_second=SPEEDS["Medium"])
 step_counter = 0
 
 
-def get_delay():
-    return SPEEDS[current_speed]
-
-
 def increment_step():
     global step_counter
     step_counter += 1
 
 
+def run_steps(steps, frame_for):
+    """Runs a backtracking generator through the scheduler and returns its result.
+
+    frame_for(step) returns a function drawing that step's frame (or None to keep
+    the previous one); only the newest frame of each batch of steps is drawn.
+    """
+    latest = [None]
+
+    def on_step(step):
+        frame = frame_for(step)
+        if frame is not None:
+            latest[0] = frame
+
+    def render():
+        if latest[0] is not None:
+            latest[0]()
+
+    return SCHEDULER.run(steps, on_step, render)
+
+
 # -------------------------------------------------------------
 # 🧠 Complexity Info Panel
 # -------------------------------------------------------------
-def draw_info_panel(screen, algo_name):
-    WIDTH, HEIGHT = screen.get_size()
-    x, y, w, h = WIDTH - 340, 40, 300, 200
+def paint_info_panel(screen, algo_name):
+    x, y, w, h = 0, 0, 300, 200
     pygame.draw.rect(screen, (240, 245, 255), (x, y, w, h), border_radius=12)
     pygame.draw.rect(screen, (50, 100, 200), (x, y, w, h), 2, border_radius=12)
 
-    info_data = {
-        "N-Queens": {"Time": "O(N!)", "Space": "O(N²)", "Concept": "Place N queens safely.", "Color": (0, 160, 255)},
-        "Sudoku Solver": {"Time": "O(9ⁿ)", "Space": "O(81)", "Concept": "Solve Sudoku with constraint check.", "Color": (0, 180, 100)},
-        "Rat in a Maze": {"Time": "O(2^(N²))", "Space": "O(N²)", "Concept": "Find path from start to destination.", "Color": (200, 80, 0)},
-        "Subset Sum": {"Time": "O(2ⁿ)", "Space": "O(n)", "Concept": "Find subsets matching target sum.", "Color": (150, 50, 150)},
-    }
-
-    info = info_data.get(algo_name, {})
-    color = info.get("Color", (0, 0, 0))
-    title = BIG_FONT.render(algo_name, True, color)
+    info = ALGORITHMS[algo_name]
+    title = BIG_FONT.render(algo_name, True, info.color)
     screen.blit(title, (x + 15, y + 10))
-    screen.blit(FONT.render(f"⏱ {info.get('Time', '-')}", True, (0, 0, 0)), (x + 15, y + 60))
-    screen.blit(FONT.render(f"💾 {info.get('Space', '-')}", True, (0, 0, 0)), (x + 15, y + 90))
+    screen.blit(FONT.render(f"⏱ {info.time}", True, (0, 0, 0)), (x + 15, y + 60))
+    screen.blit(FONT.render(f"💾 {info.space}", True, (0, 0, 0)), (x + 15, y + 90))
 
-    desc = SMALL_FONT.render(info.get("Concept", ""), True, (60, 60, 60))
+    desc = SMALL_FONT.render(info.concept, True, (60, 60, 60))
     screen.blit(desc, (x + 15, y + 130))
 
 
+# a little wider than the 300px box: long titles overhang it, as before
+INFO_PANEL_LAYER = StaticLayer(paint_info_panel, size=(320, 200), alpha=True)
+
+
+def draw_info_panel(screen, algo_name):
+    INFO_PANEL_LAYER.blit(screen, algo_name, pos=(screen.get_width() - 340, 40))
+
+
 # -------------------------------------------------------------
 # 🧭 Global Top Bar (Speed + Steps)
 # -------------------------------------------------------------
 def draw_top_bar(screen):
-    text = FONT.render(f"⚡ Speed: {current_speed}    🪜 Steps: {step_counter}", True, (0, 0, 0))
+    text = FONT.render(f"⚡ Speed: {SCHEDULER.label()}    🪜 Steps: {step_counter}", True, (0, 0, 0))
     screen.blit(text, (40, 20))
 
 
 # -------------------------------------------------------------
 # 🎯 N-Queens Visualization
 # -------------------------------------------------------------
-def draw_queens_board(screen, board, n, row=None, col=None, status=""):
-    screen.fill((255, 255, 255))
-    draw_top_bar(screen)
+QUEENS_SIZES = [4, 6, 8, 10, 12, 14]
+STEP_VIEW_MAX_N = 10  # larger boards skip the step view and go straight to counting
+
+
+def queens_geometry(screen, n):
     cell_size = min(screen.get_width(), screen.get_height() - 100) // n
     offset_x = (screen.get_width() - n * cell_size) // 2
     offset_y = (screen.get_height() - n * cell_size) // 2 + 50
+    return cell_size, offset_x, offset_y
+
 
+def paint_chessboard(screen, n):
+    """Static layer: white background and the n x n squares."""
+    screen.fill((255, 255, 255))
+    cell_size, offset_x, offset_y = queens_geometry(screen, n)
     for i in range(n):
         for j in range(n):
             rect = pygame.Rect(offset_x + j * cell_size, offset_y + i * cell_size, cell_size, cell_size)
             color = (240, 217, 181) if (i + j) % 2 == 0 else (181, 136, 99)
-            if row == i and col == j:
-                color = (255, 230, 120)
             pygame.draw.rect(screen, color, rect)
-            if board[i][j] == 1:
-                pygame.draw.circle(screen, (0, 150, 0), rect.center, cell_size // 3)
+
+
+CHESSBOARD_LAYER = StaticLayer(paint_chessboard)
+
+
+def draw_queens_board(screen, cols, n, row=None, col=None, status=""):
+    CHESSBOARD_LAYER.blit(screen, n)
+    draw_top_bar(screen)
+    cell_size, offset_x, offset_y = queens_geometry(screen, n)
+
+    # the squares the placed queens attack in the rows still to fill
+    shade = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+    shade.fill((200, 0, 0, 70))
+    for i, mask in enumerate(attacked_squares(n, cols)):
+        if cols[i] is None:
+            for j in range(n):
+                if mask >> j & 1:
+                    screen.blit(shade, (offset_x + j * cell_size, offset_y + i * cell_size))
+
+    if row is not None and col is not None:
+        rect = pygame.Rect(offset_x + col * cell_size, offset_y + row * cell_size, cell_size, cell_size)
+        pygame.draw.rect(screen, (255, 230, 120), rect)
+    for i, j in enumerate(cols):
+        if j is not None:
+            center = (offset_x + j * cell_size + cell_size // 2, offset_y + i * cell_size + cell_size // 2)
+            pygame.draw.circle(screen, (0, 150, 0), center, cell_size // 3)
 
     msg = FONT.render(status, True, (0, 0, 0))
     screen.blit(msg, (offset_x, offset_y - 40))
@@ -86,56 +138,107 @@ def draw_queens_board(screen, board, n, row=None, col=None, status=""):
     pygame.display.flip()
 
 
-def is_safe_queen(board, row, col, n):
-    for i in range(row):
-        if board[i][col] == 1:
-            return False
-    for i, j in zip(range(row - 1, -1, -1), range(col - 1, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    for i, j in zip(range(row - 1, -1, -1), range(col + 1, n)):
-        if board[i][j] == 1:
-            return False
-    return True
+def solve_nqueens(screen, n):
+    """Places queens only on free squares (bitmasks), then counts every solution for n."""
+    cols = [None] * n
+
+    def frame_for(step):
+        r, c = step.a, step.b
+        if step.kind == PLACE:
+            increment_step()
+            status = f"Placed Queen at ({r},{c}) ✅"
+        else:
+            status = f"Backtracking from ({r},{c}) 🔄"
+        return lambda: draw_queens_board(screen, cols, n, r, c, status)
+
+    solved = run_steps(queens_steps(n, cols), frame_for)
+    if solved:
+        start = time.perf_counter()
+        solutions, nodes = count_solutions(n)
+        elapsed = max(time.perf_counter() - start, 1e-6)
+        rate = nodes / elapsed / 1e6
+        draw_queens_board(screen, cols, n, status=f"✅ {solutions:,} solutions, {rate:.1f}M nodes/s")
+        SCHEDULER.hold(1500)
+    return solved
+
+
+def count_nqueens(screen, n):
+    """Count mode: shows the first solution, then counts every one, a first-row subtree at a time."""
+    cols, _ = first_solution(n)
+    if cols is None:
+        draw_queens_board(screen, [None] * n, n, status="❌ No solution")
+        SCHEDULER.hold(1500)
+        return False
 
+    def progress(done, total):
+        draw_queens_board(screen, cols, n, status=f"Counting... {done}/{total} subtrees")
+        SCHEDULER.pump()
 
-def solve_nqueens(screen, board, row, n):
-    if row == n:
-        draw_queens_board(screen, board, n, status="✅ Solution Found!")
-        time.sleep(1)
-        return True
-    for col in range(n):
-        increment_step()
-        draw_queens_board(screen, board, n, row, col, f"Trying row {row}, col {col}")
-        pygame.time.delay(get_delay())
-        if is_safe_queen(board, row, col, n):
-            board[row][col] = 1
-            draw_queens_board(screen, board, n, row, col, f"Placed Queen at ({row},{col}) ✅")
-            pygame.time.delay(get_delay())
-            if solve_nqueens(screen, board, row + 1, n):
-                return True
-            board[row][col] = 0
-            draw_queens_board(screen, board, n, row, col, f"Backtracking from ({row},{col}) 🔄")
-            pygame.time.delay(get_delay())
-    return False
+    draw_queens_board(screen, cols, n, status="Counting...")
+    start = time.perf_counter()
+    solutions, nodes = count_solutions(n, progress=progress)
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    draw_queens_board(screen, cols, n, status=f"✅ {solutions:,} solutions, {nodes / elapsed / 1e6:.1f}M nodes/s")
+    SCHEDULER.hold(2000)
+    return True
 
 
 # -------------------------------------------------------------
 # 🧩 Sudoku Visualization
 # -------------------------------------------------------------
-def draw_sudoku(screen, grid, r=None, c=None, msg=""):
+SUDOKU_CELL, SUDOKU_X, SUDOKU_Y = 50, 150, 80
+
+
+def paint_sudoku_grid(screen):
+    """Static layer: background and the empty 9x9 grid."""
     screen.fill((250, 250, 250))
-    draw_top_bar(screen)
-    size = 50
-    offset_x, offset_y = 150, 80
+    size = SUDOKU_CELL
     for i in range(9):
         for j in range(9):
-            rect = pygame.Rect(offset_x + j * size, offset_y + i * size, size, size)
-            color = (200, 255, 200) if (i, j) == (r, c) else (230, 230, 230)
-            pygame.draw.rect(screen, color, rect)
+            rect = pygame.Rect(SUDOKU_X + j * size, SUDOKU_Y + i * size, size, size)
+            pygame.draw.rect(screen, (230, 230, 230), rect)
             pygame.draw.rect(screen, (0, 0, 0), rect, 1)
-            if grid[i][j] != 0:
-                val = FONT.render(str(grid[i][j]), True, (0, 0, 0))
+    for k in range(0, 10, 3):
+        pygame.draw.line(screen, (0, 0, 0), (SUDOKU_X + k * size, SUDOKU_Y), (SUDOKU_X + k * size, SUDOKU_Y + 9 * size), 3)
+        pygame.draw.line(screen, (0, 0, 0), (SUDOKU_X, SUDOKU_Y + k * size), (SUDOKU_X + 9 * size, SUDOKU_Y + k * size), 3)
+
+
+SUDOKU_GRID_LAYER = StaticLayer(paint_sudoku_grid)
+
+# the current cell: the MRV pick, a single filled in, a guess, an undo
+SUDOKU_CELL_COLORS = {COMPARE: (255, 240, 150), WRITE: (190, 225, 255),
+                      PLACE: (200, 255, 200), BACKTRACK: (255, 200, 200)}
+
+
+def draw_candidates(screen, x, y, candidates):
+    """Pencil marks: digits still possible in green, eliminated ones greyed and struck out."""
+    font = get_font(16)
+    third = SUDOKU_CELL // 3
+    for d in range(1, 10):
+        cx = x + (d - 1) % 3 * third + third // 2
+        cy = y + (d - 1) // 3 * third + third // 2
+        ok = candidates >> d & 1
+        label = font.render(str(d), True, (0, 140, 0) if ok else (170, 170, 170))
+        screen.blit(label, label.get_rect(center=(cx, cy)))
+        if not ok:
+            pygame.draw.line(screen, (220, 60, 60), (cx - 5, cy + 5), (cx + 5, cy - 5), 2)
+
+
+def draw_sudoku(screen, grid, givens, r=None, c=None, msg="", kind=None, candidates=None):
+    SUDOKU_GRID_LAYER.blit(screen)
+    draw_top_bar(screen)
+    size = SUDOKU_CELL
+    offset_x, offset_y = SUDOKU_X, SUDOKU_Y
+    if r is not None and c is not None:
+        rect = pygame.Rect(offset_x + c * size, offset_y + r * size, size, size)
+        pygame.draw.rect(screen, SUDOKU_CELL_COLORS.get(kind, (200, 255, 200)), rect.inflate(-2, -2))
+        if kind == COMPARE:
+            draw_candidates(screen, rect.x, rect.y, candidates)
+    for i in range(9):
+        for j in range(9):
+            if grid[i][j] != 0 and not (kind == COMPARE and (i, j) == (r, c)):
+                color = (0, 0, 0) if (i, j) in givens else (30, 90, 200)
+                val = FONT.render(str(grid[i][j]), True, color)
                 screen.blit(val, (offset_x + j * size + 15, offset_y + i * size + 8))
     draw_info_panel(screen, "Sudoku Solver")
     tip = FONT.render(msg, True, (0, 0, 0))
@@ -143,36 +246,29 @@ def draw_sudoku(screen, grid, r=None, c=None, msg=""):
     pygame.display.flip()
 
 
-def is_valid_sudoku(grid, row, col, num):
-    for i in range(9):
-        if grid[row][i] == num or grid[i][col] == num:
-            return False
-    start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-    for i in range(start_row, start_row + 3):
-        for j in range(start_col, start_col + 3):
-            if grid[i][j] == num:
-                return False
-    return True
-
-
 def solve_sudoku(screen, grid):
-    for row in range(9):
-        for col in range(9):
-            if grid[row][col] == 0:
-                for num in range(1, 10):
-                    increment_step()
-                    draw_sudoku(screen, grid, row, col, f"Trying {num} at ({row},{col})")
-                    pygame.time.delay(get_delay())
-                    if is_valid_sudoku(grid, row, col, num):
-                        grid[row][col] = num
-                        if solve_sudoku(screen, grid):
-                            return True
-                        grid[row][col] = 0
-                        draw_sudoku(screen, grid, row, col, f"Backtracking ({row},{col})")
-                return False
-    draw_sudoku(screen, grid, msg="✅ Sudoku Solved!")
-    time.sleep(1)
-    return True
+    """MRV: the cell with the fewest candidates is filled (singles) or guessed on next."""
+    givens = {(i, j) for i in range(9) for j in range(9) if grid[i][j]}
+
+    def frame_for(step):
+        r, c, kind = step.a, step.b, step.kind
+        if kind == COMPARE:
+            increment_step()
+            left = " ".join(map(str, digits_of(step.value)))
+            msg = f"MRV ({r},{c}): {left} left" if left else f"Dead end at ({r},{c})"
+        elif kind == WRITE:
+            msg = f"Single: only {step.value} fits ({r},{c})"
+        elif kind == PLACE:
+            msg = f"Guess {step.value} at ({r},{c})"
+        else:
+            msg = f"Backtracking ({r},{c})"
+        return lambda: draw_sudoku(screen, grid, givens, r, c, msg, kind, step.value)
+
+    solved = run_steps(sudoku_steps(grid), frame_for)
+    if solved:
+        draw_sudoku(screen, grid, givens, msg="✅ Sudoku Solved!")
+        SCHEDULER.hold(1000)
+    return solved
 
 
 # -------------------------------------------------------------
@@ -203,24 +299,19 @@ def draw_maze(screen, maze, path=None, pos=None):
 
 def solve_maze(screen, maze, x, y, path):
     n = len(maze)
-    if x == n - 1 and y == n - 1:
-        path.append((x, y))
-        draw_maze(screen, maze, path)
-        time.sleep(1)
-        return True
-    if 0 <= x < n and 0 <= y < n and maze[x][y] == 1:
+
+    def frame_for(step):
+        if (step.a, step.b) == (n - 1, n - 1):
+            return None
         increment_step()
-        maze[x][y] = 0
-        path.append((x, y))
-        draw_maze(screen, maze, path, (x, y))
-        pygame.time.delay(get_delay())
-        if solve_maze(screen, maze, x + 1, y, path) or solve_maze(screen, maze, x, y + 1, path):
-            return True
-        path.pop()
-        draw_maze(screen, maze, path, (x, y))
-        pygame.time.delay(get_delay())
-        maze[x][y] = 1
-    return False
+        pos = (step.a, step.b)
+        return lambda: draw_maze(screen, maze, path, pos)
+
+    solved = run_steps(maze_steps(maze, x, y, path), frame_for)
+    if solved:
+        draw_maze(screen, maze, path)
+        SCHEDULER.hold(1000)
+    return solved
 
 
 # -------------------------------------------------------------
@@ -243,51 +334,84 @@ def draw_subset(screen, arr, chosen, idx, target, msg=""):
     pygame.display.flip()
 
 
-def subset_sum_visual(screen, arr, target, idx=0, current=None, chosen=None):
-    if current is None:
-        current = []
-    if chosen is None:
-        chosen = [False] * len(arr)
-    increment_step()
-    if sum(current) == target:
-        draw_subset(screen, arr, chosen, idx, target, f"✅ Found Subset {current}")
-        time.sleep(1)
-        return True
-    if idx >= len(arr) or sum(current) > target:
-        return False
-    chosen[idx] = True
-    draw_subset(screen, arr, chosen, idx, target, f"Including {arr[idx]}")
-    pygame.time.delay(get_delay())
-    if subset_sum_visual(screen, arr, target, idx + 1, current + [arr[idx]], chosen):
-        return True
-    chosen[idx] = False
-    draw_subset(screen, arr, chosen, idx, target, f"Excluding {arr[idx]}")
-    pygame.time.delay(get_delay())
-    return subset_sum_visual(screen, arr, target, idx + 1, current, chosen)
+def subset_sum_visual(screen, arr, target):
+    chosen = [False] * len(arr)
+
+    def frame_for(step):
+        increment_step()
+        verb = "Including" if step.kind == PLACE else "Excluding"
+        idx, msg = step.a, f"{verb} {arr[step.a]}"
+        return lambda: draw_subset(screen, arr, chosen, idx, target, msg)
+
+    found = run_steps(subset_sum_steps(arr, target, chosen), frame_for)
+    if found:
+        current = [num for num, keep in zip(arr, chosen) if keep]
+        draw_subset(screen, arr, chosen, len(arr), target, f"✅ Found Subset {current}")
+        SCHEDULER.hold(1000)
+    return found
+
+
+# -------------------------------------------------------------
+# 📋 Demo Inputs (also replayed by export.py)
+# -------------------------------------------------------------
+MAZE = [[1, 0, 0, 0],
+        [1, 1, 0, 1],
+        [0, 1, 0, 0],
+        [1, 1, 1, 1]]
+
+SUBSET_ARR, SUBSET_TARGET = [3, 34, 4, 12, 5, 2], 9
+
+
+# the registry's entry points: each runs its demo on a fresh copy of the input
+def nqueens_demo(screen, n=8):
+    if n > STEP_VIEW_MAX_N:
+        return count_nqueens(screen, n)
+    return solve_nqueens(screen, n)
+
+
+def sudoku_demo(screen, puzzle=None):
+    """puzzle: an 81-character line; by default a shuffled copy of a built-in puzzle."""
+    cells = parse(puzzle) if puzzle else shuffled(parse(random.choice([PUZZLES["easy"], PUZZLES["medium"]])))
+    return solve_sudoku(screen, to_grid(cells))
+
+
+def maze_demo(screen):
+    return solve_maze(screen, [row[:] for row in MAZE], 0, 0, [])
+
+
+def subset_sum_demo(screen):
+    return subset_sum_visual(screen, SUBSET_ARR, SUBSET_TARGET)
 
 
 # -------------------------------------------------------------
 # 🎮 Main Backtracking Menu
 # -------------------------------------------------------------
 def run_backtracking_visual(screen):
-    global current_speed, step_counter
-    algos = ["N-Queens", "Sudoku Solver", "Rat in a Maze", "Subset Sum", "Back"]
+    global step_counter
+    queens_idx = QUEENS_SIZES.index(8)
+    algos = [a.name for a in algorithms_in("backtracking")] + ["Back"]
     selected = 0
     WIDTH, HEIGHT = screen.get_size()
-    font = pygame.font.Font(None, 50)
+    font = get_font(50)
     running = True
 
     while running:
         screen.fill((30, 30, 30))
         title = BIG_FONT.render("Backtracking Visuals", True, (0, 255, 255))
         screen.blit(title, (WIDTH // 2 - 200, 100))
-        hint = SMALL_FONT.render("Press 1=Slow  2=Medium  3=Fast", True, (200, 200, 200))
-        screen.blit(hint, (WIDTH // 2 - 160, 180))
+        hint = SMALL_FONT.render(f"Speed: {SCHEDULER.label()}   1=Slow  2=Medium  3=Fast  +/-  0=Unthrottled",
+                                 True, (200, 200, 200))
+        screen.blit(hint, hint.get_rect(center=(WIDTH // 2, 190)))
+        n = QUEENS_SIZES[queens_idx]
+        mode = "step view" if n <= STEP_VIEW_MAX_N else "count mode"
+        size_hint = SMALL_FONT.render(f"N-Queens board: {n}x{n}, {mode}   (Left/Right to change)",
+                                      True, (200, 200, 200))
+        screen.blit(size_hint, size_hint.get_rect(center=(WIDTH // 2, 215)))
 
         for i, algo in enumerate(algos):
             color = (0, 255, 0) if i == selected else (255, 255, 255)
             label = font.render(algo, True, color)
-            rect = label.get_rect(center=(WIDTH // 2, 250 + i * 80))
+            rect = label.get_rect(center=(WIDTH // 2, 270 + i * 80))
             screen.blit(label, rect)
         pygame.display.flip()
 
@@ -301,33 +425,18 @@ def run_backtracking_visual(screen):
                 elif event.key == pygame.K_DOWN:
                     selected = (selected + 1) % len(algos)
                 elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3]:
-                    current_speed = {pygame.K_1: "Slow", pygame.K_2: "Medium", pygame.K_3: "Fast"}[event.key]
+                    preset = {pygame.K_1: "Slow", pygame.K_2: "Medium", pygame.K_3: "Fast"}[event.key]
+                    SCHEDULER.set_speed(SPEEDS[preset])
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    step = 1 if event.key == pygame.K_RIGHT else -1
+                    queens_idx = (queens_idx + step) % len(QUEENS_SIZES)
                 elif event.key == pygame.K_RETURN:
                     step_counter = 0
-                    if algos[selected] == "N-Queens":
-                        n = 8
-                        board = [[0 for _ in range(n)] for _ in range(n)]
-                        solve_nqueens(screen, board, 0, n)
-                    elif algos[selected] == "Sudoku Solver":
-                        grid = [[0,0,0,2,6,0,7,0,1],
-                                [6,8,0,0,7,0,0,9,0],
-                                [1,9,0,0,0,4,5,0,0],
-                                [8,2,0,1,0,0,0,4,0],
-                                [0,0,4,6,0,2,9,0,0],
-                                [0,5,0,0,0,3,0,2,8],
-                                [0,0,9,3,0,0,0,7,4],
-                                [0,4,0,0,5,0,0,3,6],
-                                [7,0,3,0,1,8,0,0,0]]
-                        solve_sudoku(screen, grid)
-                    elif algos[selected] == "Rat in a Maze":
-                        maze = [[1, 0, 0, 0],
-                                [1, 1, 0, 1],
-                                [0, 1, 0, 0],
-                                [1, 1, 1, 1]]
-                        path = []
-                        solve_maze(screen, maze, 0, 0, path)
-                    elif algos[selected] == "Subset Sum":
-                        arr = [3, 34, 4, 12, 5, 2]
-                        subset_sum_visual(screen, arr, target=9)
-                    elif algos[selected] == "Back":
+                    if algos[selected] == "Back":
                         return
+                    if algos[selected] == "N-Queens":
+                        visual(algos[selected])(screen, QUEENS_SIZES[queens_idx])
+                    else:
+                        visual(algos[selected])(screen)
+                else:
+                    SCHEDULER.handle_event(event)
@@ -0,0 +1,124 @@
+import pygame
+
+# ---------------------------------------------
+# Incremental Bar Renderer (dirty rectangles)
+# ---------------------------------------------
+# Draws an array as bottom-aligned bars and, after the first frame, repaints
+# only the columns whose bar or highlight changed. Each step of a sort touches
+# one or two indices, so a frame costs O(changed bars) instead of O(N) and
+# only those column rects are pushed with pygame.display.update(rects).
+
+LABEL_OFFSET = 22  # value labels sit this far above their bar
+
+
+class BarRenderer:
+    def __init__(self, screen, bottom, max_height, colors=((0, 0, 255), (0, 255, 0)),
+                 background=(255, 255, 255), outline=None, label_font=None,
+                 label_color=(0, 0, 0), gap=2):
+        """background is a fill color or a full-screen Surface to restore columns from."""
+        self.screen = screen
+        self.bottom = bottom
+        self.max_height = max_height
+        self.colors = colors
+        self.background = background
+        self.outline = outline
+        self.label_font = label_font
+        self.label_color = label_color
+        self.gap = gap
+        label_room = LABEL_OFFSET if label_font else 0
+        self.top = bottom - max_height - label_room
+
+        self.count = 0
+        self.bar_width = 1
+        self.max_val = 1
+        self.highlight = set()
+        self.dirty = set()
+
+    # ---------- geometry ----------
+    def column_rect(self, i):
+        return pygame.Rect(i * self.bar_width, self.top, self.bar_width, self.bottom - self.top)
+
+    def area_rect(self):
+        return pygame.Rect(0, self.top, self.screen.get_width(), self.bottom - self.top)
+
+    def _restore(self, rect):
+        if isinstance(self.background, pygame.Surface):
+            self.screen.blit(self.background, rect, rect)
+        else:
+            self.screen.fill(self.background, rect)
+
+    def _draw_bar(self, arr, i):
+        val = arr[i]
+        color = self.colors[1] if i in self.highlight else self.colors[0]
+        bar_height = int((val / self.max_val) * self.max_height)
+        x = i * self.bar_width
+        y = self.bottom - bar_height
+        # bars no wider than the gap are drawn gapless: the gap would leave nothing
+        width = self.bar_width - self.gap if self.bar_width > self.gap else self.bar_width
+        rect = (x, y, width, bar_height)
+        pygame.draw.rect(self.screen, color, rect)
+        if self.outline:
+            pygame.draw.rect(self.screen, self.outline, rect, 1)
+        if self.label_font:
+            t = self.label_font.render(str(val), True, self.label_color)
+            self.screen.blit(t, (x + max(2, self.bar_width // 4), y - LABEL_OFFSET))
+
+    # ---------- drawing ----------
+    def mark(self, *indices):
+        """Flags indices changed outside the highlight so the next draw repaints them."""
+        self.dirty.update(indices)
+
+    def draw_all(self, arr, highlight=()):
+        """Repaints every bar; returns the single rect covering the bar area."""
+        self.count = len(arr)
+        self.bar_width = max(1, self.screen.get_width() // max(1, self.count))
+        self.max_val = max(arr) if arr else 1
+        self.highlight = set(highlight)
+        self.dirty.clear()
+
+        area = self.area_rect()
+        self._restore(area)
+        for i in range(self.count):
+            self._draw_bar(arr, i)
+        return [area]
+
+    def draw(self, arr, highlight=()):
+        """Repaints only bars whose value or highlight changed; returns their rects."""
+        highlight = set(highlight)
+        changed = self.dirty | highlight | self.highlight
+        if len(arr) != self.count or any(arr[i] > self.max_val for i in changed):
+            return self.draw_all(arr, highlight)
+
+        self.highlight = highlight
+        self.dirty.clear()
+        rects = []
+        for i in changed:
+            rect = self.column_rect(i)
+            self._restore(rect)
+            self._draw_bar(arr, i)
+            rects.append(rect)
+        return rects
+
+    def redraw_region(self, arr, rect, skip=()):
+        """Restores rect and repaints the bars crossing it, clipped to it (for effects drawn on top).
+
+        skip: indices left out, e.g. a bar the caller redraws somewhere else.
+        """
+        rect = pygame.Rect(rect).clip(self.screen.get_rect())
+        old_clip = self.screen.get_clip()
+        self.screen.set_clip(rect)
+        self._restore(rect)
+        first = max(0, rect.left // self.bar_width)
+        last = min(self.count, rect.right // self.bar_width + 1)
+        for i in range(first, last):
+            if i not in skip:
+                self._draw_bar(arr, i)
+        self.screen.set_clip(old_clip)
+        return rect
+
+    def update(self, arr, highlight=(), extra_rects=()):
+        """draw() followed by pushing just the changed rects to the display."""
+        rects = self.draw(arr, highlight)
+        rects.extend(extra_rects)
+        pygame.display.update(rects)
+        return rects
@@ -0,0 +1,125 @@
+import numpy as np
+import pygame
+
+# ---------------------------------------------
+# Level-of-Detail Column Renderer (large N)
+# ---------------------------------------------
+# For arrays wider than the window (10^5 - 10^7 values) every pixel column
+# stands for a bin of N / WIDTH consecutive elements. A column is drawn as
+#   dark fill   from the bottom up to the bin's minimum,
+#   light band  from the minimum up to the maximum,
+#   mean line   one pixel at the bin's mean,
+# straight into a surface through pygame.surfarray. After the first frame
+# only columns whose bins were touched by a step are re-binned and
+# repainted, so a frame costs O(changed columns), however large N is.
+# Exposes the same draw_all / mark / draw / update API as BarRenderer.
+
+BACKGROUND, RANGE, FILL, MEAN, HIGHLIGHT = range(5)
+
+
+class ColumnRenderer:
+    def __init__(self, screen, bottom, max_height, colors=((0, 0, 255), (0, 255, 0)),
+                 range_color=(150, 170, 255), mean_color=(0, 0, 120), background=(255, 255, 255)):
+        self.screen = screen
+        self.bottom = bottom
+        self.max_height = max_height
+        self.top = bottom - max_height
+        self.width = screen.get_width()
+        self.surface = pygame.Surface((self.width, max_height), 0, 32)
+        # index -> RGB for the BACKGROUND / RANGE / FILL / MEAN / HIGHLIGHT codes
+        self.palette = np.array([background, range_color, colors[0], mean_color, colors[1]], dtype=np.uint8)
+        self.rows = np.arange(max_height)[None, :]
+
+        self.count = 0
+        self.max_val = 1
+        self.edges = None
+        self.highlight = set()
+        self.dirty = set()
+
+    # ---------- binning ----------
+    def column_of(self, i):
+        return i * self.width // self.count
+
+    def _bin_stats(self, arr, cols):
+        starts, ends = self.edges[cols], self.edges[cols + 1]
+        mins = np.empty(len(cols))
+        maxs = np.empty(len(cols))
+        means = np.empty(len(cols))
+        for k, (s, e) in enumerate(zip(starts, ends)):
+            seg = arr[s:e]
+            mins[k], maxs[k], means[k] = seg.min(), seg.max(), seg.mean()
+        return mins, maxs, means
+
+    def _paint(self, cols, mins, maxs, means, highlighted):
+        scale = self.max_height / self.max_val
+        h = self.max_height
+        lo = (h - mins * scale).astype(np.int64)[:, None]
+        hi = (h - maxs * scale).astype(np.int64)[:, None]
+        mid = (h - means * scale).astype(np.int64)[:, None]
+
+        codes = np.full((len(cols), h), BACKGROUND, dtype=np.uint8)
+        codes[self.rows >= hi] = RANGE
+        codes[self.rows >= lo] = FILL
+        codes[self.rows == np.minimum(mid, h - 1)] = MEAN
+        codes[highlighted] = np.where(codes[highlighted] == BACKGROUND, BACKGROUND, HIGHLIGHT)
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        pixels[cols] = self.palette[codes]
+        del pixels  # unlock the surface
+
+    # ---------- drawing ----------
+    def mark(self, *indices):
+        """Flags indices changed outside the highlight so the next draw re-bins their columns."""
+        self.dirty.update(indices)
+
+    def draw_all(self, arr, highlight=()):
+        """Bins the whole array (vectorized) and repaints every column."""
+        arr = np.asarray(arr)
+        self.count = len(arr)
+        self.max_val = max(1, int(arr.max())) if self.count else 1
+        self.edges = (np.arange(self.width + 1) * self.count) // self.width
+        self.highlight = {self.column_of(i) for i in highlight}
+        self.dirty.clear()
+
+        starts = self.edges[:-1]
+        mins = np.minimum.reduceat(arr, starts).astype(np.float64)
+        maxs = np.maximum.reduceat(arr, starts).astype(np.float64)
+        means = np.add.reduceat(arr, starts, dtype=np.float64) / np.diff(self.edges)
+        cols = np.arange(self.width)
+        highlighted = np.isin(cols, list(self.highlight))
+        self._paint(cols, mins, maxs, means, highlighted)
+
+        area = pygame.Rect(0, self.top, self.width, self.max_height)
+        self.screen.blit(self.surface, area)
+        return [area]
+
+    def draw(self, arr, highlight=()):
+        """Re-bins and repaints only the columns touched since the last frame."""
+        if len(arr) != self.count:
+            return self.draw_all(arr, highlight)
+
+        highlight_cols = {self.column_of(i) for i in highlight}
+        changed = {self.column_of(i) for i in self.dirty} | highlight_cols | self.highlight
+        self.highlight = highlight_cols
+        self.dirty.clear()
+        if not changed:
+            return []
+
+        cols = np.fromiter(sorted(changed), dtype=np.int64)
+        mins, maxs, means = self._bin_stats(arr, cols)
+        if maxs.max() > self.max_val:
+            return self.draw_all(arr, highlight)  # element indices: draw_all maps them itself
+        self._paint(cols, mins, maxs, means, np.isin(cols, list(highlight_cols)))
+
+        rects = []
+        for c in cols:
+            rect = pygame.Rect(int(c), self.top, 1, self.max_height)
+            self.screen.blit(self.surface, rect, pygame.Rect(int(c), 0, 1, self.max_height))
+            rects.append(rect)
+        return rects
+
+    def update(self, arr, highlight=(), extra_rects=()):
+        rects = self.draw(arr, highlight)
+        rects.extend(extra_rects)
+        pygame.display.update(rects)
+        return rects
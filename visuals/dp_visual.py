@@ -2,66 +2,52 @@ import pygame
 import sys
 import math
 import random
-
-pygame.font.init()
-FONT = pygame.font.Font(None, 32)
-BIG_FONT = pygame.font.Font(None, 48)
-SMALL_FONT = pygame.font.Font(None, 24)
+import numpy as np
+from algorithms.steps import COMPARE, WRITE
+from algorithms.dp_steps import lcs_steps, matrix_chain_steps, new_table, new_chain_table
+from algorithms.floyd_warshall import distance_matrix, broadcast_rounds, reconstruct_path
+from algorithms.lcs import lcs_traceback, lcs_table_rows
+from algorithms.matrix_chain import parenthesization
+from algorithms.knapsack import (knapsack_rounds, value_dtype, choice_table, took, reconstruct_items,
+                                 random_items)
+from visuals.layers import StaticLayer
+from visuals.scheduler import StepScheduler
+from visuals.fonts import get_font
+from visuals.table_view import TableView
+from registry import ALGORITHMS, algorithms_in, visual
+
+FONT = get_font(32)
+BIG_FONT = get_font(48)
+SMALL_FONT = get_font(24)
+
+# about the old 250 ms per cell; +/- and 0 change it during a run
+SCHEDULER = StepScheduler(steps_per_second=4)
 
 # -------------------------------------------------------------
 # 🧠 Complexity Info Panel
 # -------------------------------------------------------------
-def draw_info_panel(screen, algo_name):
-    """Draws algorithm-specific complexity and info box."""
-    WIDTH, HEIGHT = screen.get_size()
-    x, y, w, h = WIDTH - 340, 40, 300, 180
+def paint_info_panel(screen, algo_name):
+    """Paints the algorithm-specific complexity and info box."""
+    x, y, w, h = 0, 0, 300, 180
 
     # Draw box background
     pygame.draw.rect(screen, (240, 245, 255), (x, y, w, h), border_radius=12)
     pygame.draw.rect(screen, (0, 80, 180), (x, y, w, h), 2, border_radius=12)
 
-    info_data = {
-        "Floyd–Warshall": {
-            "Time": "O(V³)",
-            "Space": "O(V²)",
-            "Concept": "Finds shortest path between all pairs using DP.",
-            "Color": (0, 100, 255),
-        },
-        "0/1 Knapsack": {
-            "Time": "O(N·W)",
-            "Space": "O(N·W)",
-            "Concept": "Maximizes total value under capacity constraints.",
-            "Color": (0, 160, 0),
-        },
-        "LCS": {
-            "Time": "O(M·N)",
-            "Space": "O(M·N)",
-            "Concept": "Finds longest subsequence common to two strings.",
-            "Color": (180, 60, 60),
-        },
-        "Matrix Chain": {
-            "Time": "O(N³)",
-            "Space": "O(N²)",
-            "Concept": "Optimizes matrix multiplication order.",
-            "Color": (120, 0, 150),
-        }
-    }
-
-    info = info_data.get(algo_name, {})
-    title_color = info.get("Color", (0, 0, 0))
+    info = ALGORITHMS[algo_name]
 
     # Title
-    title = BIG_FONT.render(algo_name, True, title_color)
+    title = BIG_FONT.render(algo_name, True, info.color)
     screen.blit(title, (x + 15, y + 10))
 
     # Time & Space
-    time_text = FONT.render(f"⏱ Time: {info.get('Time', '-')}", True, (0, 0, 0))
-    space_text = FONT.render(f"💾 Space: {info.get('Space', '-')}", True, (0, 0, 0))
+    time_text = FONT.render(f"⏱ Time: {info.time}", True, (0, 0, 0))
+    space_text = FONT.render(f"💾 Space: {info.space}", True, (0, 0, 0))
     screen.blit(time_text, (x + 15, y + 60))
     screen.blit(space_text, (x + 15, y + 90))
 
     # Concept (wrapped)
-    words = info.get("Concept", "").split(" ")
+    words = info.concept.split(" ")
     line, lines = "", []
     for w_ in words:
         if len(line + w_) < 30:
@@ -76,6 +62,14 @@ def draw_info_panel(screen, algo_name):
         screen.blit(desc, (x + 15, y + 120 + i * 20))
 
 
+INFO_PANEL_LAYER = StaticLayer(paint_info_panel, size=(300, 180), alpha=True)
+
+
+def draw_info_panel(screen, algo_name):
+    """Blits the cached info box; it is only re-rendered when algo_name changes."""
+    INFO_PANEL_LAYER.blit(screen, algo_name, pos=(screen.get_width() - 340, 40))
+
+
 # -------------------------------------------------------------
 # 🎨 Utility: Matrix Drawing
 # -------------------------------------------------------------
@@ -116,134 +110,289 @@ def draw_matrix(screen, matrix, title, highlights=None, arrow=None,
     pygame.display.flip()
 
 
+# -------------------------------------------------------------
+# ⏱ Scheduled Table Animation
+# -------------------------------------------------------------
+def animate_table(screen, steps, table, algo_name, describe, **layout):
+    """Runs DP steps through the scheduler and redraws the table once per frame.
+
+    describe(step) returns the frame title for the step, or None to keep the last one.
+    """
+    state = {"title": None, "cell": None}
+
+    def on_step(step):
+        title = describe(step)
+        if title is not None:
+            state["title"], state["cell"] = title, (step.a, step.b)
+
+    def render():
+        if state["title"] is None:
+            return
+        draw_matrix(screen, table, state["title"], highlights=[state["cell"]],
+                    arrow=state["cell"], **layout)
+        draw_info_panel(screen, algo_name)
+        pygame.display.flip()
+
+    SCHEDULER.run(steps, on_step, render)
+
+
 # -------------------------------------------------------------
 # 1️⃣ Floyd–Warshall Visualization
 # -------------------------------------------------------------
-def floyd_warshall_visual(screen):
-    n = 5
-    dist = [[math.inf] * n for _ in range(n)]
+def distance_table(dist):
+    """The matrix as a list-of-lists of ints (∞ for unreachable), for draw_matrix."""
+    return [[int(v) if v != math.inf else math.inf for v in row] for row in dist.tolist()]
+
+
+def floyd_warshall_visual(screen, n=6):
+    src, dst, weights = [], [], []
     for i in range(n):
-        dist[i][i] = 0
         for j in range(n):
             if i != j and random.random() < 0.5:
-                dist[i][j] = random.randint(1, 9)
+                src.append(i)
+                dst.append(j)
+                weights.append(random.randint(1, 9))
+    dist, nxt = distance_matrix(n, src, dst, weights)
 
-    draw_matrix(screen, dist, "Floyd–Warshall (Initial)")
+    draw_matrix(screen, distance_table(dist), "Floyd–Warshall (Initial)")
     draw_info_panel(screen, "Floyd–Warshall")
     pygame.display.flip()
-    pygame.time.delay(1000)
-
-    for k in range(n):
-        for i in range(n):
-            for j in range(n):
-                draw_matrix(screen, dist, f"Step k={k+1}, i={i}, j={j}",
-                            highlights=[(i, j)], arrow=(i, j))
-                draw_info_panel(screen, "Floyd–Warshall")
-                pygame.display.flip()
-                pygame.time.delay(300)
+    SCHEDULER.hold(1000)
+
+    # one frame per k: the whole matrix relaxed through node k at once
+    state = {"title": None, "cells": [], "k": 0, "before": dist.copy()}
+
+    def on_step(step):
+        changed = np.argwhere(dist != state["before"])
+        state["before"][:] = dist
+        state["cells"] = [tuple(cell) for cell in changed.tolist()]
+        state["k"] = step.a
+        state["title"] = f"k={step.a}: {step.value} paths shortened via {step.a}"
+
+    def render():
+        if state["title"] is None:
+            return
+        draw_matrix(screen, distance_table(dist), state["title"], highlights=state["cells"],
+                    arrow=(0, state["k"]))
+        draw_info_panel(screen, "Floyd–Warshall")
+        pygame.display.flip()
 
-                if dist[i][k] + dist[k][j] < dist[i][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
+    SCHEDULER.run(broadcast_rounds(dist, nxt), on_step, render)
 
-    draw_matrix(screen, dist, "Floyd–Warshall (Final)")
+    # show the longest of the shortest paths, rebuilt from the next-hop matrix
+    reachable = np.where(np.isfinite(dist), dist, -1)
+    i, j = np.unravel_index(np.argmax(reachable), dist.shape)
+    path = reconstruct_path(nxt, i, j)
+    title = "Floyd–Warshall (Final)"
+    if len(path) > 1:
+        title = f"Path {' -> '.join(map(str, path))} = {int(dist[i, j])}"
+    draw_matrix(screen, distance_table(dist), title, highlights=list(zip(path, path[1:])))
     draw_info_panel(screen, "Floyd–Warshall")
     pygame.display.flip()
-    pygame.time.delay(2000)
+    SCHEDULER.hold(2000)
 
 
 # -------------------------------------------------------------
 # 2️⃣ 0/1 Knapsack Visualization
 # -------------------------------------------------------------
-def knapsack_visual(screen):
-    n, W = 5, 10
-    weights = [2, 3, 4, 5, 9]
-    values = [3, 4, 5, 8, 10]
-    dp = [[0] * (W + 1) for _ in range(n + 1)]
-
-    for i in range(1, n + 1):
-        for w in range(W + 1):
-            if weights[i - 1] <= w:
-                dp[i][w] = max(dp[i - 1][w],
-                               values[i - 1] + dp[i - 1][w - weights[i - 1]])
-            else:
-                dp[i][w] = dp[i - 1][w]
-
-            draw_matrix(screen, dp, f"Knapsack (i={i}, w={w})",
-                        highlights=[(i, w)], arrow=(i, w), cell_size=50, start_x=100, start_y=120)
-            draw_info_panel(screen, "0/1 Knapsack")
-            pygame.display.flip()
-            pygame.time.delay(200)
+def knapsack_visual(screen, weights=None, values=None, capacity=10):
+    """Random items unless weights and values are given; one frame per item added."""
+    if weights is None:
+        weights = [random.randint(1, 6) for _ in range(5)]
+        values = [random.randint(1, 12) for _ in range(5)]
+    n = len(weights)
+    dp = np.zeros(capacity + 1, dtype=value_dtype(values))
+    choices = choice_table(n, capacity)
+
+    # the engine keeps one row; the rows it has been through are kept here for display only
+    rows = [dp.tolist()]
+    layout = dict(cell_size=50, start_x=100, start_y=120)
+
+    def on_step(step):
+        rows.append(dp.tolist())
+
+    def render():
+        i = len(rows) - 2
+        taken = [(i + 1, c) for c in range(capacity + 1) if took(choices, i, c)]
+        title = f"Item {i + 1} (w={weights[i]}, v={values[i]}): taken at {len(taken)} capacities"
+        draw_matrix(screen, rows, title, highlights=taken, **layout)
+        draw_info_panel(screen, "0/1 Knapsack")
+        pygame.display.flip()
 
-    draw_matrix(screen, dp, "Knapsack Complete", cell_size=50, start_x=100, start_y=120)
+    SCHEDULER.run(knapsack_rounds(weights, values, dp, choices), on_step, render)
+
+    # walk back up the rows: every taken item moves left by its weight
+    chosen = reconstruct_items(weights, choices, capacity)
+    c, path = capacity, []
+    for i in range(n, 0, -1):
+        path.append((i, c))
+        if i - 1 in chosen:
+            c -= weights[i - 1]
+    title = f"Take items {', '.join(str(i + 1) for i in chosen) or 'none'}: value {dp[-1]}"
+    draw_matrix(screen, rows, title, highlights=path, **layout)
     draw_info_panel(screen, "0/1 Knapsack")
     pygame.display.flip()
-    pygame.time.delay(2000)
+    SCHEDULER.hold(2000)
 
 
 # -------------------------------------------------------------
 # 3️⃣ Longest Common Subsequence Visualization
 # -------------------------------------------------------------
-def lcs_visual(screen):
-    X = "ACDB"
-    Y = "ACB"
+def lcs_visual(screen, X=None, Y=None):
+    """The full table, for short strings (random DNA unless given); see algorithms/lcs.py for long ones."""
+    X = X or "".join(random.choice("ACGT") for _ in range(6))
+    Y = Y or "".join(random.choice("ACGT") for _ in range(5))
     m, n = len(X), len(Y)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if X[i - 1] == Y[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-
-            draw_matrix(screen, dp, f"LCS '{X}' & '{Y}' (i={i}, j={j})",
-                        highlights=[(i, j)], arrow=(i, j), cell_size=60)
-            draw_info_panel(screen, "LCS")
-            pygame.display.flip()
-            pygame.time.delay(300)
+    dp = new_table(m + 1, n + 1)
+
+    def describe(step):
+        if step.kind == WRITE:
+            return f"LCS '{X}' & '{Y}' (i={step.a}, j={step.b})"
+
+    animate_table(screen, lcs_steps(X, Y, dp), dp, "LCS", describe, cell_size=60)
 
-    draw_matrix(screen, dp, "LCS Complete", cell_size=60)
+    subsequence, path = lcs_traceback(X, Y, dp)
+    draw_matrix(screen, dp, f"LCS '{subsequence}' (length {len(subsequence)})",
+                highlights=path, cell_size=60)
     draw_info_panel(screen, "LCS")
     pygame.display.flip()
-    pygame.time.delay(2000)
+    SCHEDULER.hold(2000)
 
 
 # -------------------------------------------------------------
 # 4️⃣ Matrix Chain Multiplication Visualization
 # -------------------------------------------------------------
-def matrix_chain_visual(screen):
-    dims = [5, 10, 3, 12, 5, 50, 6]
+def matrix_chain_visual(screen, dims=None):
+    """Random dimensions unless given; ends on the optimal parenthesization."""
+    dims = dims or [random.randint(2, 20) for _ in range(7)]
     n = len(dims) - 1
-    m = [[0 if i == j else math.inf for j in range(n)] for i in range(n)]
-
-    for L in range(2, n + 1):
-        for i in range(n - L + 1):
-            j = i + L - 1
-            for k in range(i, j):
-                q = m[i][k] + m[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
-                if q < m[i][j]:
-                    m[i][j] = q
-
-                draw_matrix(screen, m, f"Matrix Chain (i={i}, j={j}, k={k})",
-                            highlights=[(i, j)], arrow=(i, j), cell_size=60)
-                draw_info_panel(screen, "Matrix Chain")
-                pygame.display.flip()
-                pygame.time.delay(250)
-
-    draw_matrix(screen, m, "Matrix Chain Complete", cell_size=60)
+    m = new_chain_table(n)
+    split = new_table(n, n)
+
+    def describe(step):
+        if step.kind == COMPARE:
+            return f"Matrix Chain (i={step.a}, j={step.b}, k={step.value})"
+
+    animate_table(screen, matrix_chain_steps(dims, m, split), m, "Matrix Chain", describe, cell_size=70)
+
+    order = parenthesization(np.array(split), n)
+    draw_matrix(screen, m, f"{order} = {m[0][n - 1]}", cell_size=70)
     draw_info_panel(screen, "Matrix Chain")
     pygame.display.flip()
-    pygame.time.delay(2000)
+    SCHEDULER.hold(2000)
+
+
+# -------------------------------------------------------------
+# 🌡 Large Tables as Heatmaps
+# -------------------------------------------------------------
+# The engines fill NumPy tables of millions of cells; a TableView shows them
+# as a heatmap, repainting only the rows written since the last frame.
+# Wheel / drag / arrow keys zoom and pan (down to labelled cells), F fits.
+HEATMAP_RECT = (20, 100, 620, 480)
+HEATMAP_SECONDS = 15  # default run length; +/- still change the speed
+
+
+def run_heatmap(screen, view, steps, algo_name, describe):
+    """Runs steps at about HEATMAP_SECONDS for the whole table, one mark per written row."""
+    state = {"title": f"{algo_name}: starting"}
+
+    def on_step(step):
+        view.mark(step.a)
+        state["title"] = describe(step)
+
+    def render(full=False):
+        header = pygame.Rect(0, 0, HEATMAP_RECT[0] + HEATMAP_RECT[2], HEATMAP_RECT[1])
+        screen.fill((245, 250, 255), header)
+        screen.blit(FONT.render(state["title"], True, (0, 0, 0)), (20, 20))
+        status = f"{view.status()}   wheel / drag / arrows, F = fit"
+        screen.blit(SMALL_FONT.render(status, True, (60, 60, 60)), (20, 62))
+        rects = view.draw(screen)
+        if full:
+            draw_info_panel(screen, algo_name)
+            pygame.display.flip()
+        else:
+            pygame.display.update([header] + rects)
+
+    screen.fill((245, 250, 255))
+    view.full = True
+    render(full=True)
+    speed = SCHEDULER.steps_per_second
+    if speed is not None:
+        SCHEDULER.set_speed(max(speed, view.table.shape[0] / HEATMAP_SECONDS))
+    SCHEDULER.handlers.append(view.handle_event)
+    try:
+        SCHEDULER.run(steps, on_step, render)
+        view.rescale()
+        return render
+    finally:
+        SCHEDULER.handlers.remove(view.handle_event)
+        SCHEDULER.set_speed(speed)
+
+
+def knapsack_heatmap_visual(screen, n=3000, capacity=3000):
+    """Every row of an n-item knapsack (9 * 10^6 cells), with the chosen items outlined."""
+    weights, values = random_items(n, capacity)
+    dp = np.zeros(capacity + 1, dtype=value_dtype(values))
+    choices = choice_table(n, capacity)
+    # the engine keeps one row; the rows it has been through are kept here for display only
+    table = np.zeros((n + 1, capacity + 1), dtype=dp.dtype)
+    view = TableView(table, HEATMAP_RECT)
+
+    def steps():
+        for step in knapsack_rounds(weights, values, dp, choices):
+            table[step.a + 1] = dp
+            yield step._replace(a=step.a + 1)
+
+    def describe(step):
+        return f"Item {step.a}/{n} (w={weights[step.a - 1]}): best {step.value}"
+
+    render = run_heatmap(screen, view, steps(), "Large Knapsack", describe)
+
+    chosen = reconstruct_items(weights, choices, capacity)
+    c, cells = capacity, []
+    for i in chosen[::-1]:
+        cells.append((i + 1, c))
+        c -= weights[i]
+    view.highlight(cells)
+    SCHEDULER.handlers.append(view.handle_event)
+    try:
+        render(full=True)
+        SCHEDULER.hold(5000, render)
+    finally:
+        SCHEDULER.handlers.remove(view.handle_event)
+
+
+def lcs_heatmap_visual(screen, m=3000, n=3000):
+    """The full table of two random DNA strings (9 * 10^6 cells), with the traceback outlined."""
+    X = "".join(random.choice("ACGT") for _ in range(m))
+    Y = "".join(random.choice("ACGT") for _ in range(n))
+    table = np.zeros((m + 1, n + 1), dtype=np.int32)
+    view = TableView(table, HEATMAP_RECT)
+
+    def describe(step):
+        return f"Row {step.a}/{m}: LCS of the prefixes {step.value}"
+
+    render = run_heatmap(screen, view, lcs_table_rows(X, Y, table), "LCS Table Heatmap", describe)
+
+    subsequence, path = lcs_traceback(X, Y, table)
+    view.highlight(path)
+    SCHEDULER.handlers.append(view.handle_event)
+    try:
+        render(full=True)
+        SCHEDULER.hold(5000, render)
+    finally:
+        SCHEDULER.handlers.remove(view.handle_event)
 
 
 # -------------------------------------------------------------
 # 🧩 DP Visual Menu
 # -------------------------------------------------------------
 def run_dp_visual(screen):
-    algos = ["Floyd–Warshall", "0/1 Knapsack", "LCS", "Matrix Chain", "Back"]
+    algos = [a.name for a in algorithms_in("dp")] + ["Back"]
     selected = 0
     WIDTH, HEIGHT = screen.get_size()
-    font = pygame.font.Font(None, 50)
+    spacing = min(80, (HEIGHT - 260) // len(algos))
+    font = get_font(min(50, spacing))
     running = True
 
     while running:
@@ -254,9 +403,13 @@ def run_dp_visual(screen):
         for i, algo in enumerate(algos):
             color = (0, 255, 0) if i == selected else (255, 255, 255)
             label = font.render(algo, True, color)
-            rect = label.get_rect(center=(WIDTH // 2, 250 + i * 80))
+            rect = label.get_rect(center=(WIDTH // 2, 250 + i * spacing))
             screen.blit(label, rect)
 
+        hint = SMALL_FONT.render(f"Speed: {SCHEDULER.label()}   (+/- to change, 0 = unthrottled)",
+                                 True, (200, 200, 200))
+        screen.blit(hint, hint.get_rect(center=(WIDTH // 2, 175)))
+
         pygame.display.flip()
 
         for event in pygame.event.get():
@@ -269,13 +422,8 @@ def run_dp_visual(screen):
                 elif event.key == pygame.K_DOWN:
                     selected = (selected + 1) % len(algos)
                 elif event.key == pygame.K_RETURN:
-                    if algos[selected] == "Floyd–Warshall":
-                        floyd_warshall_visual(screen)
-                    elif algos[selected] == "0/1 Knapsack":
-                        knapsack_visual(screen)
-                    elif algos[selected] == "LCS":
-                        lcs_visual(screen)
-                    elif algos[selected] == "Matrix Chain":
-                        matrix_chain_visual(screen)
-                    elif algos[selected] == "Back":
+                    if algos[selected] == "Back":
                         return
+                    visual(algos[selected])(screen)
+                else:
+                    SCHEDULER.handle_event(event)
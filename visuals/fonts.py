@@ -0,0 +1,117 @@
+import string
+import threading
+from collections import OrderedDict
+import pygame
+
+# ---------------------------------------------
+# Shared Font Pool + Rendered Text Cache
+# ---------------------------------------------
+# Every module asks get_font(size) instead of building pygame.font.Font
+# objects itself, so one Font exists per (name, size) in the whole process.
+# The returned PooledFont renders through a bounded LRU cache of text
+# surfaces, so bar labels, edge weights and matrix values that repeat every
+# frame are rasterized once. Cached surfaces are shared: copy() one before
+# changing its alpha or drawing on it.
+#
+# FONT_LOCK serializes font opening and rendering, so the background
+# preloader (visuals/preloader.py) can warm fonts while the menu draws.
+
+TEXT_CACHE_SIZE = 2048
+FONT_LOCK = threading.RLock()
+
+
+class TextCache:
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, key, text, antialias, color, background=None):
+        with FONT_LOCK:
+            surface = self.entries.get(key)
+            if surface is not None:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return surface
+
+            self.misses += 1
+            surface = font.render(text, antialias, color, background)
+            self.entries[key] = surface
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+            return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+TEXT_CACHE = TextCache()
+
+
+class PooledFont:
+    """Drop-in stand-in for pygame.font.Font whose render() goes through TEXT_CACHE."""
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size_px = size
+        self._font = None
+
+    @property
+    def font(self):
+        # opened on first use, so module-level FONT = get_font(...) costs nothing at import
+        if self._font is None:
+            with FONT_LOCK:
+                if self._font is None:
+                    if not pygame.font.get_init():
+                        pygame.font.init()
+                    self._font = pygame.font.Font(self.name, self.size_px)
+        return self._font
+
+    def warm(self):
+        """Opens the font and rasterizes every printable ASCII glyph into SDL_ttf's glyph cache."""
+        with FONT_LOCK:
+            self.font.render(string.printable.strip(), True, (0, 0, 0))
+
+    def render(self, text, antialias, color, background=None):
+        key = (self.name, self.size_px, text, tuple(color), antialias,
+               tuple(background) if background is not None else None)
+        return TEXT_CACHE.render(self.font, key, text, antialias, color, background)
+
+    def __getattr__(self, attr):
+        # size(), get_height(), set_bold() ... come straight from the real font
+        return getattr(self.font, attr)
+
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Returns the process-wide font for (name, size); the font file is opened on first render."""
+    key = (name, size)
+    if key not in _fonts:
+        _fonts[key] = PooledFont(name, size)
+    return _fonts[key]
+
+
+def warm_fonts():
+    """Warms every font registered so far (call after the visual modules are imported)."""
+    for font in list(_fonts.values()):
+        font.warm()
+
+
+def text_cache_stats():
+    return TEXT_CACHE.stats()
@@ -1,13 +1,36 @@
 import pygame
+import os
 import sys
-import math
 import random
-from collections import deque
-import heapq
+import numpy as np
+from algorithms.steps import VISIT, RELAX
+from algorithms.graph_steps import (bfs_steps, dfs_steps, dijkstra_steps, astar_steps,
+                                    bidirectional_dijkstra_steps, euclidean_heuristic)
+from algorithms.graph_generators import GRAPH_GENERATORS
+from algorithms.graph_loaders import load_graph, describe
+from visuals.layers import StaticLayer
+from visuals.scheduler import StepScheduler
+from visuals.fonts import get_font
+from registry import algorithms_in, visual
 
-pygame.font.init()
-FONT = pygame.font.Font(None, 32)
-BIG_FONT = pygame.font.Font(None, 48)
+FONT = get_font(32)
+BIG_FONT = get_font(48)
+SMALL_FONT = get_font(28)
+
+# the old 500 ms per visited node; +/- and 0 change it during a run
+SCHEDULER = StepScheduler(steps_per_second=2)
+
+# Left/Right cycles the node count, Tab the generator (see algorithms/graph_generators.py)
+GRAPH_SIZES = [6, 12, 300, 10_000, 100_000, 1_000_000]
+GRAPH_KINDS = list(GRAPH_GENERATORS)
+DETAIL_LIMIT = 12  # up to this many nodes: circles, ids and weight labels
+EDGE_LINE_LIMIT = 50_000  # the dot view draws edge lines only up to this many edges
+GRAPH_AREA = pygame.Rect(50, 100, 900, 470)  # node positions are scaled into this
+
+FORWARD_COLOR = (0, 200, 0)  # settled from the start
+BACKWARD_COLOR = (255, 140, 0)  # settled from the target (bidirectional search)
+ENDPOINT_COLOR = (150, 0, 200)
+PATH_COLOR = (220, 0, 0)
 
 # ---------------------------------------------
 # Node class and Graph drawing
@@ -20,134 +43,331 @@ class Node:
         self.visited = False
 
 
-def draw_graph(screen, nodes, edges, highlight_nodes=None, title="Graph Visualization"):
-    if highlight_nodes is None:
-        highlight_nodes = []
-
-    screen.fill((255, 255, 255))
-
-    # Draw edges
+def draw_edges(surface, nodes, edges):
+    """Static layer: white background, edge lines and weight labels."""
+    surface.fill((255, 255, 255))
     for (a, b, w) in edges:
         color = (150, 150, 150)
-        pygame.draw.line(screen, color, (nodes[a].x, nodes[a].y), (nodes[b].x, nodes[b].y), 2)
+        pygame.draw.line(surface, color, (nodes[a].x, nodes[a].y), (nodes[b].x, nodes[b].y), 2)
         mid_x = (nodes[a].x + nodes[b].x) // 2
         mid_y = (nodes[a].y + nodes[b].y) // 2
         weight_text = FONT.render(str(w), True, (0, 0, 0))
-        screen.blit(weight_text, (mid_x, mid_y))
+        surface.blit(weight_text, (mid_x, mid_y))
+
+
+EDGE_LAYER = StaticLayer(draw_edges)
+
+
+def draw_graph(screen, nodes, edges, highlight_nodes=None, title="Graph Visualization",
+               node_colors=None, path=None, info=None):
+    """node_colors: node -> color overrides; path: node list drawn over the edges; info: line under the title."""
+    if highlight_nodes is None:
+        highlight_nodes = []
+    node_colors = node_colors or {}
+
+    # Edges only change with the graph itself, so they come from the cached layer
+    EDGE_LAYER.blit(screen, nodes, edges)
+    if path:
+        pygame.draw.lines(screen, PATH_COLOR, False, [(nodes[u].x, nodes[u].y) for u in path], 6)
 
     # Draw nodes
     for i, node in enumerate(nodes):
-        color = (0, 255, 0) if i in highlight_nodes else (0, 0, 255)
+        color = (0, 255, 0) if i in highlight_nodes else node_colors.get(i, (0, 0, 255))
         pygame.draw.circle(screen, color, (node.x, node.y), 25)
         id_text = FONT.render(str(node.id), True, (255, 255, 255))
         screen.blit(id_text, (node.x - 8, node.y - 10))
 
     title_text = BIG_FONT.render(title, True, (0, 0, 0))
     screen.blit(title_text, (20, 20))
+    if info:
+        screen.blit(SMALL_FONT.render(info, True, (80, 80, 80)), (20, 70))
     pygame.display.flip()
 
 
-def generate_random_graph(num_nodes=6):
-    nodes = []
-    edges = []
+def generate_random_graph(num_nodes=6, kind="G(n,p)", seed=None):
+    """Seeded CompactGraph from GRAPH_GENERATORS (small G(n,p) keeps the old 40% edge chance).
+
+    Without a seed one is drawn from `random`, so random.seed() still makes it repeatable.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    generator = GRAPH_GENERATORS[kind]
+    if kind == "G(n,p)" and num_nodes <= DETAIL_LIMIT:
+        return generator(num_nodes, p=0.4, seed=seed)
+    return generator(num_nodes, seed=seed)
+
+
+def pick_endpoints(graph):
+    """Start in the top-left corner, target in the bottom-right: a long query worth pruning."""
+    diagonal = graph.xs.astype(np.float64) + graph.ys
+    return int(diagonal.argmin()), int(diagonal.argmax())
+
+
+def layout_nodes(graph):
+    """Screen-space Node objects for the detailed (small graph) view."""
+    xs = GRAPH_AREA.x + graph.xs * GRAPH_AREA.width
+    ys = GRAPH_AREA.y + graph.ys * GRAPH_AREA.height
+    return [Node(int(x), int(y), i) for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist()))]
+
+
+# ---------------------------------------------
+# Graph Views (detailed for small graphs, dots for large ones)
+# ---------------------------------------------
+# Both take mark(node, color) from the step callbacks, show_path(path) once
+# a route is known and draw(title, info) once per frame.
+class DetailView:
+    def __init__(self, screen, graph):
+        self.screen = screen
+        self.nodes = layout_nodes(graph)
+        self.edges = graph.edges()  # each undirected edge once
+        self.colors = {}
+        self.path = None
+
+    def mark(self, u, color=FORWARD_COLOR):
+        self.colors[u] = color
+
+    def show_path(self, path):
+        self.path = path
+
+    def draw(self, title, info=None):
+        draw_graph(self.screen, self.nodes, self.edges, title=title,
+                   node_colors=self.colors, path=self.path, info=info)
+
+
+DOT_COLOR = (0, 0, 255)
+DOT_OFFSETS = ((0, 0), (1, 0), (0, 1), (1, 1))  # 2x2 px per node
+
+
+def dot_positions(graph):
+    px = (GRAPH_AREA.x + graph.xs * GRAPH_AREA.width).astype(np.int32)
+    py = (GRAPH_AREA.y + graph.ys * GRAPH_AREA.height).astype(np.int32)
+    return px, py
+
+
+def paint_dots(surface, px, py, nodes, color):
+    pixels = pygame.surfarray.pixels3d(surface)
+    for dx, dy in DOT_OFFSETS:
+        pixels[px[nodes] + dx, py[nodes] + dy] = color
+    del pixels  # unlocks the surface
+
+
+def draw_dot_layer(surface, graph):
+    """Static layer for large graphs: background, edge lines while there are few enough, node dots."""
+    surface.fill((255, 255, 255))
+    px, py = dot_positions(graph)
+    if graph.num_arcs // 2 <= EDGE_LINE_LIMIT:
+        src, dst, _ = graph.edge_arrays()
+        for a, b in zip(src.tolist(), dst.tolist()):
+            pygame.draw.line(surface, (200, 200, 200), (px[a], py[a]), (px[b], py[b]))
+    paint_dots(surface, px, py, np.arange(len(graph)), DOT_COLOR)
+
+
+DOT_LAYER = StaticLayer(draw_dot_layer)
+
 
-    # Random node positions
-    for i in range(num_nodes):
-        x = random.randint(100, 900)
-        y = random.randint(120, 500)
-        nodes.append(Node(x, y, i))
+class DotView:
+    """Large graphs: a node is a 2x2 dot; only nodes marked since the last frame are painted."""
 
-    # Random edges with weights
-    for i in range(num_nodes):
-        for j in range(i + 1, num_nodes):
-            if random.random() < 0.4:  # 40% chance of edge
-                w = random.randint(1, 9)
-                edges.append((i, j, w))
-                edges.append((j, i, w))
+    def __init__(self, screen, graph):
+        self.screen = screen
+        self.num_nodes = len(graph)
+        self.px, self.py = dot_positions(graph)
+        self.surface = DOT_LAYER.get(screen, graph).copy()
+        self.pending = {}  # color -> nodes marked since the last frame
+        self.marked = 0
+
+    def mark(self, u, color=FORWARD_COLOR):
+        self.pending.setdefault(color, []).append(u)
+
+    def show_path(self, path):
+        points = [(int(self.px[u]), int(self.py[u])) for u in path]
+        if len(points) > 1:
+            pygame.draw.lines(self.surface, PATH_COLOR, False, points, 3)
+        for point in (points[0], points[-1]):
+            pygame.draw.circle(self.surface, ENDPOINT_COLOR, point, 6)
+
+    def draw(self, title, info=None):
+        for color, nodes in self.pending.items():
+            paint_dots(self.surface, self.px, self.py, np.array(nodes, dtype=np.int64), color)
+            self.marked += len(nodes)
+        self.pending.clear()
+        self.screen.blit(self.surface, (0, 0))
+        title_text = BIG_FONT.render(title, True, (0, 0, 0))
+        self.screen.blit(title_text, (20, 20))
+        line = f"{self.marked:,} / {self.num_nodes:,} nodes" + (f"   {info}" if info else "")
+        self.screen.blit(SMALL_FONT.render(line, True, (80, 80, 80)), (20, 70))
+        pygame.display.flip()
+
+
+def make_graph_view(screen, graph):
+    return DetailView(screen, graph) if len(graph) <= DETAIL_LIMIT else DotView(screen, graph)
 
-    return nodes, edges
 
 # ---------------------------------------------
 # BFS Visualization
 # ---------------------------------------------
-def bfs_visual(screen, nodes, edges, start=0):
-    adj = {i: [] for i in range(len(nodes))}
-    for (a, b, w) in edges:
-        adj[a].append(b)
-
-    visited = set()
-    q = deque([start])
-    visited.add(start)
-
-    while q:
-        current = q.popleft()
-        draw_graph(screen, nodes, edges, highlight_nodes=visited, title=f"BFS: Visiting Node {current}")
-        pygame.time.delay(500)
-        for neighbor in adj[current]:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                q.append(neighbor)
-    pygame.time.delay(1000)
+def bfs_visual(screen, graph, start=0):
+    view = make_graph_view(screen, graph)
+    current = [start]
+
+    def on_step(step):
+        current[0] = step.a
+        view.mark(step.a)
+
+    SCHEDULER.run(bfs_steps(graph, start), on_step,
+                  lambda: view.draw(f"BFS: Visiting Node {current[0]}"))
+    SCHEDULER.hold(1000)
 
 # ---------------------------------------------
 # DFS Visualization
 # ---------------------------------------------
-def dfs_visual(screen, nodes, edges, start=0):
-    adj = {i: [] for i in range(len(nodes))}
-    for (a, b, w) in edges:
-        adj[a].append(b)
+def dfs_visual(screen, graph, start=0):
+    view = make_graph_view(screen, graph)
+    current = [start]
 
-    visited = set()
+    def on_step(step):
+        current[0] = step.a
+        view.mark(step.a)
 
-    def dfs(u):
-        visited.add(u)
-        draw_graph(screen, nodes, edges, highlight_nodes=visited, title=f"DFS: Visiting Node {u}")
-        pygame.time.delay(500)
-        for v in adj[u]:
-            if v not in visited:
-                dfs(v)
-
-    dfs(start)
-    pygame.time.delay(1000)
+    SCHEDULER.run(dfs_steps(graph, start), on_step,
+                  lambda: view.draw(f"DFS: Visiting Node {current[0]}"))
+    SCHEDULER.hold(1000)
 
 # ---------------------------------------------
 # Dijkstra Visualization
 # ---------------------------------------------
-def dijkstra_visual(screen, nodes, edges, start=0):
-    adj = {i: [] for i in range(len(nodes))}
-    for (a, b, w) in edges:
-        adj[a].append((b, w))
+def dijkstra_visual(screen, graph, start=0):
+    view = make_graph_view(screen, graph)
+    title = [f"Dijkstra: Node {start}, Dist=0"]
+    counts = {VISIT: 0, RELAX: 0}
+
+    def on_step(step):
+        counts[step.kind] += 1
+        if step.kind == VISIT:
+            view.mark(step.a)
+            title[0] = f"Dijkstra: Node {step.a}, Dist={step.value}"
+        else:
+            title[0] = f"Dijkstra: Relax {step.a} -> {step.b}, Dist={step.value}"
+
+    SCHEDULER.run(dijkstra_steps(graph, start), on_step,
+                  lambda: view.draw(title[0], search_info(counts)))
+    SCHEDULER.hold(1200)
+
+# ---------------------------------------------
+# Point-to-Point Shortest Paths (A*, Bidirectional)
+# ---------------------------------------------
+SHORTEST_PATH_MODES = ("Dijkstra", "A*", "Bidirectional Dijkstra")
+
+
+def search_info(counts):
+    return f"settled {counts[VISIT]:,}   relaxations {counts[RELAX]:,}"
 
-    dist = {i: math.inf for i in range(len(nodes))}
-    dist[start] = 0
-    pq = [(0, start)]
-    visited = set()
 
-    while pq:
-        d, u = heapq.heappop(pq)
-        if u in visited:
-            continue
-        visited.add(u)
+def shortest_path_steps(graph, mode, start, target):
+    if mode == "A*":
+        return astar_steps(graph, start, target, euclidean_heuristic(graph, target))
+    if mode == "Bidirectional Dijkstra":
+        return bidirectional_dijkstra_steps(graph, start, target, graph.reverse())
+    return dijkstra_steps(graph, start, target=target)
 
-        draw_graph(screen, nodes, edges, highlight_nodes=visited, title=f"Dijkstra: Node {u}, Dist={d}")
-        pygame.time.delay(700)
 
-        for v, w in adj[u]:
-            if d + w < dist[v]:
-                dist[v] = d + w
-                heapq.heappush(pq, (dist[v], v))
+def count_settled(steps):
+    """Drains a search headless (pumping events now and then) and returns its settled-node count."""
+    settled = 0
+    for n, step in enumerate(steps):
+        settled += step.kind == VISIT
+        if n % 50_000 == 0:
+            SCHEDULER.pump()
+    return settled
 
-    pygame.time.delay(1200)
+
+def shortest_path_visual(screen, graph, mode="A*", start=None, target=None):
+    """Runs one point-to-point query; the summary compares settled nodes with plain Dijkstra."""
+    if start is None or target is None:
+        start, target = pick_endpoints(graph)
+    view = make_graph_view(screen, graph)
+    view.mark(start, ENDPOINT_COLOR)
+    view.mark(target, ENDPOINT_COLOR)
+    counts = {VISIT: 0, RELAX: 0}
+
+    def on_step(step):
+        counts[step.kind] += 1
+        if step.kind == VISIT and step.a not in (start, target):
+            view.mark(step.a, BACKWARD_COLOR if step.b == 1 else FORWARD_COLOR)
+
+    title = f"{mode}: {start} -> {target}"
+    result = SCHEDULER.run(shortest_path_steps(graph, mode, start, target), on_step,
+                           lambda: view.draw(title, search_info(counts)))
+
+    if result is None:
+        title = f"{mode}: {target} is unreachable"
+    else:
+        dist, path = result
+        view.show_path(path)
+        title = f"{mode}: dist {dist}, {len(path) - 1} edges"
+    info = search_info(counts)
+    if mode != "Dijkstra":
+        # pruning gain: what plain Dijkstra settles answering the same query
+        view.draw(title, info + "   (measuring plain Dijkstra...)")
+        baseline = count_settled(dijkstra_steps(graph, start, target=target))
+        info += f"   Dijkstra settles {baseline:,} ({baseline / max(counts[VISIT], 1):.1f}x)"
+    view.draw(title, info)
+    SCHEDULER.hold(2500)
+    return result
+
+
+def astar_visual(screen, graph):
+    return shortest_path_visual(screen, graph, "A*")
+
+
+def bidirectional_dijkstra_visual(screen, graph):
+    return shortest_path_visual(screen, graph, "Bidirectional Dijkstra")
 
 # ---------------------------------------------
 # Main Graph Visualization Menu
 # ---------------------------------------------
-def run_graph_visual(screen):
-    nodes, edges = generate_random_graph()
-    algos = ["BFS", "DFS", "Dijkstra", "Back"]
+def show_generating(screen, kind, num_nodes):
+    """One frame of feedback while a large graph is built."""
+    show_status(screen, f"Generating {kind} graph with {num_nodes:,} nodes...")
+
+
+def show_status(screen, message):
+    screen.fill((30, 30, 30))
+    text = FONT.render(message, True, (200, 200, 200))
+    screen.blit(text, text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2)))
+    pygame.display.flip()
+
+
+def load_graph_file(screen, path):
+    """Loads a graph file with a progress line; returns (graph, one-line load summary)."""
+    name = os.path.basename(path)
+
+    def progress(done, total):
+        show_status(screen, f"Loading {name}... {done / total:.0%}")
+        SCHEDULER.pump()
+
+    graph, stats = load_graph(path, progress)
+    if not len(graph):
+        raise ValueError(f"{name}: the graph has no nodes")
+    print(f"📂 {describe(stats)}")
+    mb, parse_s = stats.bytes / 1e6, max(stats.parse_s, 1e-9)
+    return graph, f"{name} ({mb / parse_s:,.0f} MB/s)"
+
+
+def run_graph_visual(screen, graph_file=None):
+    """graph_file: an edge list, DIMACS .gr or Matrix Market file offered next to the generators."""
+    size_idx = kind_idx = 0
+    kinds = GRAPH_KINDS + ([graph_file] if graph_file else [])
+    if graph_file:
+        kind_idx = len(kinds) - 1
+        graph, source = load_graph_file(screen, graph_file)
+    else:
+        graph = generate_random_graph(GRAPH_SIZES[size_idx], GRAPH_KINDS[kind_idx])
+        source = GRAPH_KINDS[kind_idx]
+    algos = [a.name for a in algorithms_in("graph")] + ["Back"]
     selected = 0
     WIDTH, HEIGHT = screen.get_size()
-    font = pygame.font.Font(None, 50)
+    font = get_font(44)
     running = True
 
     while running:
@@ -159,9 +379,17 @@ def run_graph_visual(screen):
         for i, algo in enumerate(algos):
             color = (0, 255, 0) if i == selected else (255, 255, 255)
             label = font.render(algo, True, color)
-            rect = label.get_rect(center=(WIDTH // 2, 250 + i * 80))
+            rect = label.get_rect(center=(WIDTH // 2, 260 + i * 55))
             screen.blit(label, rect)
 
+        hint = SMALL_FONT.render(f"Speed: {SCHEDULER.label()}   (+/- to change, 0 = unthrottled)",
+                                 True, (200, 200, 200))
+        screen.blit(hint, hint.get_rect(center=(WIDTH // 2, 180)))
+        graph_hint = SMALL_FONT.render(
+            f"Graph: {source}, {len(graph):,} nodes, {graph.num_arcs // (1 if graph.directed else 2):,} "
+            f"{'arcs' if graph.directed else 'edges'}   (Left/Right size, Tab type)", True, (200, 200, 200))
+        screen.blit(graph_hint, graph_hint.get_rect(center=(WIDTH // 2, 210)))
+
         pygame.display.flip()
 
         # Handle inputs
@@ -174,13 +402,23 @@ def run_graph_visual(screen):
                     selected = (selected - 1) % len(algos)
                 elif event.key == pygame.K_DOWN:
                     selected = (selected + 1) % len(algos)
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_TAB):
+                    if event.key == pygame.K_TAB:
+                        kind_idx = (kind_idx + 1) % len(kinds)
+                    else:
+                        step = 1 if event.key == pygame.K_RIGHT else -1
+                        size_idx = (size_idx + step) % len(GRAPH_SIZES)
+                        kind_idx %= len(GRAPH_KINDS)  # sizes apply to generated graphs
+                    if kinds[kind_idx] == graph_file:
+                        graph, source = load_graph_file(screen, graph_file)
+                    else:
+                        source = GRAPH_KINDS[kind_idx]
+                        show_generating(screen, source, GRAPH_SIZES[size_idx])
+                        graph = generate_random_graph(GRAPH_SIZES[size_idx], source)
                 elif event.key == pygame.K_RETURN:
-                    if algos[selected] == "BFS":
-                        bfs_visual(screen, nodes, edges)
-                    elif algos[selected] == "DFS":
-                        dfs_visual(screen, nodes, edges)
-                    elif algos[selected] == "Dijkstra":
-                        dijkstra_visual(screen, nodes, edges)
-                    elif algos[selected] == "Back":
+                    if algos[selected] == "Back":
                         return
-                    pygame.time.delay(600)
+                    visual(algos[selected])(screen, graph)
+                    SCHEDULER.hold(600)
+                else:
+                    SCHEDULER.handle_event(event)
@@ -0,0 +1,48 @@
+import pygame
+
+# ---------------------------------------------
+# Static Layers (pre-rendered, cached surfaces)
+# ---------------------------------------------
+# Backgrounds, grids, edges and info panels do not change between steps.
+# A visualizer declares each of them once as a StaticLayer; the layer is
+# painted into its own surface the first time it is used and only repainted
+# when its inputs or the window size change. Everything that does change per
+# step (bars, nodes, queens, digits, text) is drawn on top as before.
+
+
+def _same_inputs(old, new):
+    if old is None or len(old) != len(new):
+        return False
+    return all(a is b or a == b for a, b in zip(old, new))
+
+
+class StaticLayer:
+    def __init__(self, draw, size=None, alpha=False):
+        """draw(surface, *inputs) paints the layer.
+
+        size: fixed (w, h) for panels; None makes the layer follow the window size.
+        alpha: True for layers with transparent parts (rounded panels, overlays).
+        """
+        self.draw = draw
+        self.size = size
+        self.alpha = alpha
+        self.surface = None
+        self.inputs = None
+        self.builds = 0  # how many times the layer was actually rendered
+
+    def invalidate(self):
+        self.surface = None
+
+    def get(self, screen, *inputs):
+        """Returns the cached surface, re-rendering it only if something it depends on changed."""
+        size = self.size or screen.get_size()
+        if (self.surface is None or self.surface.get_size() != size
+                or not _same_inputs(self.inputs, inputs)):
+            self.surface = pygame.Surface(size, pygame.SRCALPHA if self.alpha else 0)
+            self.draw(self.surface, *inputs)
+            self.inputs = inputs
+            self.builds += 1
+        return self.surface
+
+    def blit(self, screen, *inputs, pos=(0, 0)):
+        screen.blit(self.get(screen, *inputs), pos)
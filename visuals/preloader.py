@@ -0,0 +1,52 @@
+import threading
+from visuals import startup
+
+# ---------------------------------------------
+# Background Asset / Module Preloader
+# ---------------------------------------------
+# main.py starts one of these right after the window opens. A daemon thread
+# works through a list of (label, task) pairs: importing the visualizer
+# modules, loading sounds and warming fonts. The splash and loading
+# screens draw its real progress, and a module that has already been
+# preloaded opens from the menu with no loading screen at all.
+#
+# A task that raises is recorded in `errors` and skipped; the main thread
+# then redoes that work itself and reports the error the usual way.
+
+
+class Preloader:
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+        self.finished = {label: threading.Event() for label, _ in self.tasks}
+        self.errors = {}
+        self.done = 0
+        self.current = None
+        self.thread = threading.Thread(target=self._run, name="preloader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _run(self):
+        for label, task in self.tasks:
+            self.current = label
+            try:
+                with startup.timed(f"preload {label}"):
+                    task()
+            except Exception as e:
+                self.errors[label] = e
+            self.done += 1
+            self.finished[label].set()
+        self.current = None
+
+    # ---------- progress ----------
+    def progress(self):
+        """Fraction of tasks finished, 0.0 - 1.0."""
+        return self.done / len(self.tasks) if self.tasks else 1.0
+
+    def is_done(self, label=None):
+        """True once `label` (or, without a label, every task) has finished."""
+        if label is None:
+            return self.done == len(self.tasks)
+        event = self.finished.get(label)
+        return event is None or event.is_set()
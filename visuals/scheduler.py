@@ -0,0 +1,160 @@
+import sys
+import time
+import pygame
+from visuals.tween import TweenEngine
+
+# ---------------------------------------------
+# Frame-Budgeted Step Scheduler
+# ---------------------------------------------
+# Replaces the fixed pygame.time.delay() after every algorithm step. Each
+# frame the scheduler pulls as many steps from a step generator as the
+# current steps-per-second rate allows (and as fit in the frame's time
+# budget), then renders once. At slow rates that is one step every few
+# frames; unthrottled it is thousands of steps per frame, so a 5,000-element
+# bubble sort finishes in seconds instead of days.
+#
+# The scheduler also owns a TweenEngine (`tweens`) and advances it from the
+# same frame clock, rendering extra frames while anything is animating, so
+# pointer glides and pops play alongside the step stream.
+#
+# Keys while an algorithm runs:  +  faster   -  slower   0  unthrottled
+#
+# Views with their own input (pan / zoom) add a handler(event) -> bool to
+# `handlers`; an event a handler consumes makes the next frame render even
+# when no step ran.
+
+FPS = 60
+MIN_STEPS_PER_SECOND = 0.25
+MAX_STEPS_PER_SECOND = 1_000_000  # doubling past this switches to unthrottled
+
+
+class StepScheduler:
+    def __init__(self, steps_per_second=None, fps=FPS, budget=0.8):
+        """steps_per_second=None runs unthrottled.
+
+        budget: share of each frame that may be spent running steps;
+        the rest is left for rendering and event handling.
+        """
+        self.steps_per_second = steps_per_second
+        self.fps = fps
+        self.budget = budget
+        self.clock = pygame.time.Clock()
+        self.steps_run = 0
+        self.tweens = TweenEngine()
+        self.handlers = []
+        self.redraw = False
+
+    # ---------- speed control ----------
+    def set_speed(self, steps_per_second):
+        self.steps_per_second = steps_per_second
+
+    def faster(self):
+        if self.steps_per_second is None:
+            return
+        self.steps_per_second *= 2
+        if self.steps_per_second > MAX_STEPS_PER_SECOND:
+            self.steps_per_second = None
+
+    def slower(self):
+        if self.steps_per_second is None:
+            self.steps_per_second = MAX_STEPS_PER_SECOND
+        else:
+            self.steps_per_second = max(MIN_STEPS_PER_SECOND, self.steps_per_second / 2)
+
+    def label(self):
+        if self.steps_per_second is None:
+            return "∞ steps/s"
+        return f"{self.steps_per_second:g} steps/s"
+
+    def handle_event(self, event):
+        """Applies speed keys, then the view handlers; returns True if the event was consumed."""
+        if event.type != pygame.KEYDOWN:
+            return self._dispatch(event)
+        if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.faster()
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.slower()
+        elif event.key in (pygame.K_0, pygame.K_KP0):
+            self.steps_per_second = None
+        else:
+            return self._dispatch(event)
+        return True
+
+    def _dispatch(self, event):
+        for handler in self.handlers:
+            if handler(event):
+                self.redraw = True
+                return True
+        return False
+
+    def pump(self):
+        """Keeps the window responsive between frames."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            self.handle_event(event)
+
+    # ---------- running ----------
+    def run(self, steps, on_step=None, render=None):
+        """Drives a step generator to completion and returns its return value.
+
+        on_step(step) is called for every step (cheap bookkeeping only);
+        render() is called at most once per frame, after a batch of steps
+        or while a tween is still moving.
+        """
+        frame_time = 1.0 / self.fps
+        credit = 1.0  # show the first step straight away
+        last = time.perf_counter()
+
+        while True:
+            now = time.perf_counter()
+            if self.steps_per_second is not None:
+                # cap the carry-over so a hitch does not turn into a burst
+                credit = min(credit + self.steps_per_second * (now - last),
+                             max(1.0, self.steps_per_second * frame_time * 2))
+            animating = self.tweens.active
+            self.tweens.advance(now - last)
+            last = now
+            deadline = now + frame_time * self.budget
+
+            ran = 0
+            while self.steps_per_second is None or ran + 1 <= credit:
+                try:
+                    step = next(steps)
+                except StopIteration as done:
+                    if render:
+                        render()
+                    return done.value
+                ran += 1
+                self.steps_run += 1
+                if on_step:
+                    on_step(step)
+                if time.perf_counter() >= deadline:
+                    break
+
+            if self.steps_per_second is not None:
+                credit -= ran
+            if (ran or animating or self.redraw) and render:
+                self.redraw = False
+                render()
+            self.pump()
+            self.clock.tick(self.fps)
+
+    def hold(self, ms, render=None):
+        """Leaves the current frame on screen for ms while still handling events.
+
+        render(), if given, is called each frame while tweens are moving.
+        """
+        last = time.perf_counter()
+        end = last + ms / 1000
+        while last < end:
+            animating = self.tweens.active
+            now = time.perf_counter()
+            self.tweens.advance(now - last)
+            last = now
+            if (animating or self.redraw) and render:
+                self.redraw = False
+                render()
+            self.pump()
+            self.clock.tick(self.fps)
@@ -2,178 +2,201 @@ import pygame
 import random
 import sys
 from visuals.ui_manager import VisualUI
+from visuals.bar_renderer import BarRenderer
+from visuals.scheduler import StepScheduler
+from algorithms.steps import highlight_of
+from algorithms.sort_counters import SortCounter, counted_steps, measure_sort
+from algorithms.sorting_steps import (bubble_sort_steps, selection_sort_steps, insertion_sort_steps,
+                                      merge_sort_steps, quick_sort_steps, heap_sort_steps, SORTING_STEPS)
+from visuals.fonts import get_font
+from registry import algorithms_in, visual
 
 
-pygame.font.init()
-FONT = pygame.font.Font(None, 40)
-BIG_FONT = pygame.font.Font(None, 60)
+FONT = get_font(40)
+BIG_FONT = get_font(60)
+SMALL_FONT = get_font(28)
+
+# roughly the old 15 ms per step; +/- and 0 change it while sorting
+SCHEDULER = StepScheduler(steps_per_second=60)
+
+# Left/Right in the menu cycles the array size. Anything wider than the
+# window is held in a NumPy buffer and drawn one bin per pixel column.
+ARRAY_SIZES = [80, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# "Compare All" skips sorts that would take minutes at the current size
+QUADRATIC_SORTS = {a.name for a in algorithms_in("sorting") if a.time == "O(n²)"}
+COMPARE_LIMITS = (2_000, 100_000)  # quadratic sorts, all sorts
 
 # ---------------------------------------------
 # Utility: Draw Array
 # ---------------------------------------------
-def draw_array(screen, arr, highlight=[], title="Sorting Visualizer"):
-    WIDTH, HEIGHT = screen.get_size()
+def make_bar_renderer(screen, arr=()):
+    """Bars for small arrays, per-pixel-column bins once a bar would be under 1 px wide."""
+    HEIGHT = screen.get_height()
+    if len(arr) > screen.get_width():
+        from visuals.column_renderer import ColumnRenderer
+        return ColumnRenderer(screen, bottom=HEIGHT, max_height=HEIGHT - 150)
+    return BarRenderer(screen, bottom=HEIGHT, max_height=HEIGHT - 150)
+
+
+def generate_array(size):
+    if size > 1_000:
+        import numpy as np
+        return np.random.randint(10, 401, size=size, dtype=np.int32)
+    return [random.randint(10, 400) for _ in range(size)]
+
+
+def draw_hud(screen, counts):
+    """Operation counters under the title; returns the rect to update."""
+    rect = pygame.Rect(0, 75, screen.get_width(), 36)
+    screen.fill((255, 255, 255), rect)
+    text = SMALL_FONT.render(
+        f"Compares {counts['comparisons']:,}   Swaps {counts['swaps']:,}   "
+        f"Reads {counts['reads']:,}   Writes {counts['writes']:,}   "
+        f"Aux {counts['aux_memory']:,}   Depth {counts['max_depth']}", True, (60, 60, 60))
+    screen.blit(text, (20, rect.y + 4))
+    return rect
+
+
+def draw_array(screen, arr, highlight=[], title="Sorting Visualizer", bars=None, counts=None):
+    """Full-frame redraw. Pass `bars` to leave that renderer in sync for later bars.update()."""
     screen.fill((255, 255, 255))
-    bar_width = WIDTH // len(arr)
-    max_val = max(arr)
-
-    for i, val in enumerate(arr):
-        color = (0, 255, 0) if i in highlight else (0, 0, 255)
-        bar_height = int((val / max_val) * (HEIGHT - 150))
-        pygame.draw.rect(screen, color, (i * bar_width, HEIGHT - bar_height, bar_width - 2, bar_height))
+    if bars is None:
+        bars = make_bar_renderer(screen, arr)
+    bars.draw_all(arr, highlight)
 
     title_text = FONT.render(title, True, (0, 0, 0))
     screen.blit(title_text, (20, 20))
+    if counts is not None:
+        draw_hud(screen, counts)
     pygame.display.flip()
 
 
 # ---------------------------------------------
 # Sorting Algorithms with Visualization
 # ---------------------------------------------
+# The algorithms live in algorithms/sorting_steps.py; these functions only
+# consume the step stream. After one full frame, the scheduler runs a batch of
+# steps per frame and only the bars those steps touched are repainted
+# (highlight_of covers every index a step swapped or wrote). The algorithm
+# works on a counting view of arr, so the HUD shows its operation counts
+# live; each visual returns the final counts as a report dict.
+def animate_steps(screen, arr, sort_steps, title):
+    bars = make_bar_renderer(screen, arr)
+    counter = SortCounter()
+    draw_array(screen, arr, title=title, bars=bars, counts=counter.report())
+    last = []
+
+    def on_step(step):
+        touched = highlight_of(step)
+        bars.mark(*touched)
+        last[:] = touched
+
+    SCHEDULER.run(counted_steps(sort_steps, arr, counter), on_step,
+                  lambda: bars.update(arr, last, [draw_hud(screen, counter.report())]))
+    return counter.report()
+
+
 def bubble_sort_visual(screen, arr):
-    n = len(arr)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            draw_array(screen, arr, [j, j + 1], "Bubble Sort")
-            pygame.time.delay(15)
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-    draw_array(screen, arr)
-    pygame.time.delay(400)
+    report = animate_steps(screen, arr, bubble_sort_steps, "Bubble Sort")
+    draw_array(screen, arr, title="Bubble Sort", counts=report)
+    SCHEDULER.hold(400)
+    return report
 
 
 def selection_sort_visual(screen, arr):
-    n = len(arr)
-    for i in range(n):
-        min_idx = i
-        for j in range(i + 1, n):
-            draw_array(screen, arr, [min_idx, j], "Selection Sort")
-            pygame.time.delay(15)
-            if arr[j] < arr[min_idx]:
-                min_idx = j
-        arr[i], arr[min_idx] = arr[min_idx], arr[i]
-    draw_array(screen, arr)
-    pygame.time.delay(400)
+    report = animate_steps(screen, arr, selection_sort_steps, "Selection Sort")
+    draw_array(screen, arr, title="Selection Sort", counts=report)
+    SCHEDULER.hold(400)
+    return report
 
 
 def insertion_sort_visual(screen, arr):
-    for i in range(1, len(arr)):
-        key = arr[i]
-        j = i - 1
-        while j >= 0 and arr[j] > key:
-            arr[j + 1] = arr[j]
-            draw_array(screen, arr, [j, j + 1], "Insertion Sort")
-            pygame.time.delay(15)
-            j -= 1
-        arr[j + 1] = key
-    draw_array(screen, arr)
-    pygame.time.delay(400)
-
-
-def merge_sort_visual(screen, arr, l=0, r=None):
-    if r is None:
-        r = len(arr) - 1
-
-    def merge(l, m, r):
-        left = arr[l:m + 1]
-        right = arr[m + 1:r + 1]
-        i = j = 0
-        k = l
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                arr[k] = left[i]
-                i += 1
-            else:
-                arr[k] = right[j]
-                j += 1
-            draw_array(screen, arr, [k], "Merge Sort")
-            pygame.time.delay(20)
-            k += 1
-        while i < len(left):
-            arr[k] = left[i]
-            draw_array(screen, arr, [k], "Merge Sort")
-            pygame.time.delay(20)
-            i += 1
-            k += 1
-        while j < len(right):
-            arr[k] = right[j]
-            draw_array(screen, arr, [k], "Merge Sort")
-            pygame.time.delay(20)
-            j += 1
-            k += 1
-
-    if l < r:
-        m = (l + r) // 2
-        merge_sort_visual(screen, arr, l, m)
-        merge_sort_visual(screen, arr, m + 1, r)
-        merge(l, m, r)
-
-
-def partition(arr, low, high, screen):
-    pivot = arr[high]
-    i = low - 1
-    for j in range(low, high):
-        draw_array(screen, arr, [j, high], "Quick Sort")
-        pygame.time.delay(15)
-        if arr[j] < pivot:
-            i += 1
-            arr[i], arr[j] = arr[j], arr[i]
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
-
-
-def quick_sort_visual(screen, arr, low=0, high=None):
-    if high is None:
-        high = len(arr) - 1
-    if low < high:
-        pi = partition(arr, low, high, screen)
-        quick_sort_visual(screen, arr, low, pi - 1)
-        quick_sort_visual(screen, arr, pi + 1, high)
-
-
-def heapify(arr, n, i, screen):
-    largest = i
-    l = 2 * i + 1
-    r = 2 * i + 2
-    if l < n and arr[l] > arr[largest]:
-        largest = l
-    if r < n and arr[r] > arr[largest]:
-        largest = r
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        draw_array(screen, arr, [i, largest], "Heap Sort")
-        pygame.time.delay(25)
-        heapify(arr, n, largest, screen)
+    report = animate_steps(screen, arr, insertion_sort_steps, "Insertion Sort")
+    draw_array(screen, arr, title="Insertion Sort", counts=report)
+    SCHEDULER.hold(400)
+    return report
+
+
+def merge_sort_visual(screen, arr):
+    return animate_steps(screen, arr, merge_sort_steps, "Merge Sort")
+
+
+def quick_sort_visual(screen, arr):
+    return animate_steps(screen, arr, quick_sort_steps, "Quick Sort")
 
 
 def heap_sort_visual(screen, arr):
-    n = len(arr)
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i, screen)
-    for i in range(n - 1, 0, -1):
-        arr[i], arr[0] = arr[0], arr[i]
-        draw_array(screen, arr, [i], "Heap Sort")
-        pygame.time.delay(25)
-        heapify(arr, i, 0, screen)
+    return animate_steps(screen, arr, heap_sort_steps, "Heap Sort")
+
+
+# ---------------------------------------------
+# Compare All: measured answer for this input
+# ---------------------------------------------
+def compare_sorts(arr):
+    """Runs every sort headless on a copy of arr; returns {name: report or None if skipped}."""
+    reports = {}
+    for name, sort_steps in SORTING_STEPS.items():
+        limit = COMPARE_LIMITS[0] if name in QUADRATIC_SORTS else COMPARE_LIMITS[1]
+        reports[name] = measure_sort(sort_steps, arr.copy()) if len(arr) <= limit else None
+    return reports
+
+
+def draw_comparison(screen, reports, n):
+    screen.fill((255, 255, 255))
+    screen.blit(FONT.render(f"All Sorts on This Input (N={n:,})", True, (0, 0, 0)), (20, 20))
+
+    columns = [("Algorithm", 20), ("Time (ms)", 230), ("Compares", 370), ("Swaps", 510),
+               ("Reads", 620), ("Writes", 740), ("Aux", 860), ("Depth", 930)]
+    for label, x in columns:
+        screen.blit(SMALL_FONT.render(label, True, (0, 0, 150)), (x, 100))
+
+    timed = {name: r["time_s"] for name, r in reports.items() if r is not None}
+    fastest = min(timed, key=timed.get) if timed else None
+    for row, (name, r) in enumerate(reports.items()):
+        y = 145 + row * 45
+        color = (0, 150, 0) if name == fastest else (0, 0, 0)
+        if r is None:
+            cells = [name, "skipped (too large)"]
+        else:
+            cells = [name, f"{r['time_s'] * 1000:.1f}", f"{r['comparisons']:,}", f"{r['swaps']:,}",
+                     f"{r['reads']:,}", f"{r['writes']:,}", f"{r['aux_memory']:,}", str(r['max_depth'])]
+        for (label, x), cell in zip(columns, cells):
+            screen.blit(SMALL_FONT.render(cell, True, color), (x, y))
+
+    hint = SMALL_FONT.render("Press any key to return", True, (120, 120, 120))
+    screen.blit(hint, hint.get_rect(center=(screen.get_width() // 2, screen.get_height() - 30)))
+    pygame.display.flip()
+
+
+def compare_sorts_visual(screen, arr):
+    screen.fill((255, 255, 255))
+    screen.blit(FONT.render("Measuring every sort...", True, (0, 0, 0)), (20, 20))
+    pygame.display.flip()
+
+    reports = compare_sorts(arr)
+    draw_comparison(screen, reports, len(arr))
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                return reports
+        SCHEDULER.clock.tick(30)
 
 
 # ---------------------------------------------
 # Menu to Choose Algorithm
 # ---------------------------------------------
 def run_sorting_visual(screen):
-    arr = [random.randint(10, 400) for _ in range(80)]
-    algorithms = [
-        "Bubble Sort",
-        "Selection Sort",
-        "Insertion Sort",
-        "Merge Sort",
-        "Quick Sort",
-        "Heap Sort",
-        "Back"
-    ]
+    size_idx = 0
+    arr = generate_array(ARRAY_SIZES[size_idx])
+    algorithms = [a.name for a in algorithms_in("sorting")] + ["Compare All", "Back"]
     selected = 0
     WIDTH, HEIGHT = screen.get_size()
-    font = pygame.font.Font(None, 50)
+    font = get_font(44)
     running = True
 
     while running:
@@ -185,9 +208,16 @@ def run_sorting_visual(screen):
         for i, algo in enumerate(algorithms):
             color = (0, 255, 0) if i == selected else (255, 255, 255)
             label = font.render(algo, True, color)
-            rect = label.get_rect(center=(WIDTH // 2, 250 + i * 70))
+            rect = label.get_rect(center=(WIDTH // 2, 255 + i * 42))
             screen.blit(label, rect)
 
+        hint = SMALL_FONT.render(f"Speed: {SCHEDULER.label()}   (+/- to change, 0 = unthrottled)",
+                                 True, (200, 200, 200))
+        screen.blit(hint, hint.get_rect(center=(WIDTH // 2, 180)))
+        size_hint = SMALL_FONT.render(f"Array size: {len(arr):,}   (Left/Right to change)",
+                                      True, (200, 200, 200))
+        screen.blit(size_hint, size_hint.get_rect(center=(WIDTH // 2, 210)))
+
         pygame.display.flip()
 
         # Handle inputs
@@ -200,20 +230,17 @@ def run_sorting_visual(screen):
                     selected = (selected - 1) % len(algorithms)
                 elif event.key == pygame.K_DOWN:
                     selected = (selected + 1) % len(algorithms)
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    step = 1 if event.key == pygame.K_RIGHT else -1
+                    size_idx = (size_idx + step) % len(ARRAY_SIZES)
+                    arr = generate_array(ARRAY_SIZES[size_idx])
                 elif event.key == pygame.K_RETURN:
-                    if algorithms[selected] == "Bubble Sort":
-                        bubble_sort_visual(screen, arr.copy())
-                    elif algorithms[selected] == "Selection Sort":
-                        selection_sort_visual(screen, arr.copy())
-                    elif algorithms[selected] == "Insertion Sort":
-                        insertion_sort_visual(screen, arr.copy())
-                    elif algorithms[selected] == "Merge Sort":
-                        merge_sort_visual(screen, arr.copy())
-                    elif algorithms[selected] == "Quick Sort":
-                        quick_sort_visual(screen, arr.copy())
-                        draw_array(screen, arr, title="Quick Sort")
-                    elif algorithms[selected] == "Heap Sort":
-                        heap_sort_visual(screen, arr.copy())
+                    if algorithms[selected] == "Compare All":
+                        compare_sorts_visual(screen, arr)
                     elif algorithms[selected] == "Back":
                         return
-                    pygame.time.delay(500)
+                    else:
+                        visual(algorithms[selected])(screen, arr.copy())
+                    SCHEDULER.hold(500)
+                else:
+                    SCHEDULER.handle_event(event)
@@ -5,11 +5,12 @@ import random
 from collections import deque
 import heapq
 from visuals.ui_manager import VisualUI
+from visuals.fonts import get_font
 
 
 pygame.font.init()
-FONT = pygame.font.Font(None, 32)
-BIG_FONT = pygame.font.Font(None, 48)
+FONT = get_font(32)
+BIG_FONT = get_font(48)
 
 # ---------------------------------------------
 # Graph Setup and Visualization Helpers
@@ -143,7 +144,7 @@ def run_graph_visual(screen):
     selected = 0
     running = True
     WIDTH, HEIGHT = screen.get_size()
-    font = pygame.font.Font(None, 50)
+    font = get_font(50)
 
     while running:
         # Draw menu
@@ -0,0 +1,55 @@
+import os
+import threading
+import pygame
+from visuals import startup
+
+# ---------------------------------------------
+# Lazily Loaded Sound Effects
+# ---------------------------------------------
+# The mixer is started and the effects are decoded on the first
+# play_sound() call, not at import, so audio start-up (often the slowest
+# init on desktop Linux) is paid only by visualizers that actually beep.
+# Paths are resolved from this file, so the game can be launched from any
+# working directory. main.py's preloader usually calls load_sounds() in the
+# background before the first effect is needed.
+
+SOUND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "sounds")
+SOUND_FILES = {"click": "click.wav", "success": "success.ogg", "error": "error.wav"}
+
+_sounds = None  # effect name -> pygame.mixer.Sound, filled on first use
+_lock = threading.Lock()  # the preloader may be loading while a sound is played
+
+
+def load_sounds():
+    """Starts the mixer and loads every effect once; failures just leave that effect silent."""
+    global _sounds
+    with _lock:
+        if _sounds is not None:
+            return _sounds
+        sounds = {}
+        with startup.timed("mixer init + sounds"):
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+            except pygame.error as e:
+                print(f"⚠️ Sound disabled, mixer failed to start: {e}")
+                _sounds = sounds
+                return _sounds
+
+            for effect, filename in SOUND_FILES.items():
+                try:
+                    sounds[effect] = pygame.mixer.Sound(os.path.join(SOUND_DIR, filename))
+                except (pygame.error, FileNotFoundError) as e:
+                    print(f"⚠️ Sound file failed to load: {filename} ({e})")
+        _sounds = sounds
+        return _sounds
+
+
+def play_sound(effect, muted=False):
+    """Play sound effect if available and not muted."""
+    if muted:
+        return
+    sounds = _sounds if _sounds is not None else load_sounds()
+    sound = sounds.get(effect)
+    if sound is not None:
+        sound.play()
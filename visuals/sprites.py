@@ -0,0 +1,97 @@
+from collections import OrderedDict
+import pygame
+
+# ---------------------------------------------
+# Pre-rendered Glow / Highlight Sprites
+# ---------------------------------------------
+# Glow rings and highlight halos used to be drawn into a full-screen SRCALPHA
+# surface per ring per frame, which makes every effect a full-screen alpha
+# composite. Here each effect is rendered once into a sprite just big enough
+# to hold it, keyed by (kind, size, color, alpha) in a bounded LRU cache, and
+# blitted with its own small bounding rect. Sprites are shared: copy() one
+# before drawing on it.
+
+SPRITE_CACHE_SIZE = 256
+
+
+class SpriteCache:
+    def __init__(self, maxsize=SPRITE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = build()
+        self.entries[key] = surface
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+
+SPRITES = SpriteCache()
+
+
+def _rgb(color):
+    return tuple(color[:3])
+
+
+# ---------- builders ----------
+def disc_sprite(radius, color, alpha):
+    """Flat translucent disc, (2r+1) pixels square."""
+    radius, alpha = int(radius), int(alpha)
+
+    def build():
+        surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*_rgb(color), alpha), (radius, radius), radius)
+        return surface
+
+    return SPRITES.get(("disc", radius, _rgb(color), alpha), build)
+
+
+def glow_sprite(radius, color, alpha):
+    """Radial glow: `alpha` at the centre fading quadratically to 0 at `radius`."""
+    radius, alpha = int(radius), int(alpha)
+
+    def build():
+        surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        # outer to inner: each smaller circle overwrites the centre with a stronger alpha
+        for r in range(radius, 0, -1):
+            a = int(alpha * (1 - r / (radius + 1)) ** 2)
+            pygame.draw.circle(surface, (*_rgb(color), a), (radius, radius), r)
+        return surface
+
+    return SPRITES.get(("glow", radius, _rgb(color), alpha), build)
+
+
+def halo_sprite(size, color, alpha, spread=12, border_radius=8):
+    """Soft rounded-rect halo around a (w, h) box, `spread` pixels wide on each side."""
+    w, h = int(size[0]), int(size[1])
+    alpha = int(alpha)
+
+    def build():
+        surface = pygame.Surface((w + 2 * spread, h + 2 * spread), pygame.SRCALPHA)
+        for s in range(spread, -1, -1):
+            a = int(alpha * (1 - s / (spread + 1)) ** 2)
+            rect = pygame.Rect(spread - s, spread - s, w + 2 * s, h + 2 * s)
+            pygame.draw.rect(surface, (*_rgb(color), a), rect, border_radius=border_radius + s)
+        return surface
+
+    return SPRITES.get(("halo", w, h, _rgb(color), alpha, spread, border_radius), build)
+
+
+# ---------- blitting ----------
+def blit_centered(screen, sprite, center):
+    """Blits sprite centred on `center`; returns the (small) rect it touched."""
+    return screen.blit(sprite, sprite.get_rect(center=(int(center[0]), int(center[1]))))
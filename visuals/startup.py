@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# ---------------------------------------------
+# Startup-Time Instrumentation
+# ---------------------------------------------
+# main.py imports this before anything else and wraps each import / init
+# in timed(). With `python main.py --startup-trace` (or DAA_STARTUP_TRACE=1)
+# every timing is printed as it happens, followed by the time from here to
+# the first frame of the main menu that accepts input. Interpreter start-up
+# itself happens before T0 and is not included, nor is time spent in
+# excluded() blocks such as the splash.
+
+T0 = time.perf_counter()
+ENABLED = "--startup-trace" in sys.argv or bool(os.environ.get("DAA_STARTUP_TRACE"))
+
+timings = []            # (label, ms) in the order they finished
+interactive_ms = None   # ms from T0 to the first interactive menu frame
+
+
+@contextmanager
+def timed(label):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - start) * 1000
+        timings.append((label, ms))
+        if ENABLED:
+            print(f"⏱ {label:<36} {ms:8.1f} ms")
+
+
+@contextmanager
+def excluded(label):
+    """timed(), but the time is left out of time-to-interactive (the splash waits on purpose)."""
+    global T0
+    start = time.perf_counter()
+    try:
+        with timed(label):
+            yield
+    finally:
+        T0 += time.perf_counter() - start
+
+
+def mark_interactive():
+    """Called by the menu once it is drawn and polling input; only the first call counts."""
+    global interactive_ms
+    if interactive_ms is not None:
+        return
+    interactive_ms = (time.perf_counter() - T0) * 1000
+    if ENABLED:
+        print(f"⏱ {'time to interactive menu':<36} {interactive_ms:8.1f} ms")
@@ -0,0 +1,243 @@
+import numpy as np
+import pygame
+from visuals.fonts import get_font
+
+# ---------------------------------------------
+# Virtualized DP Table View (labels / heatmap)
+# ---------------------------------------------
+# Shows a 2-D NumPy table of any size inside one screen rectangle:
+#
+#   labels   cells of LABEL_CELL px or more: boxes with their values
+#   blocks   smaller cells: a colour per cell, one or more pixels wide
+#   sampled  more cells than pixels: every pixel shows one cell under it
+#
+# Only the viewport is ever drawn. row_of[y] / col_of[x] map each pixel to
+# the cell it shows, so a heatmap frame is one gather of at most viewport-
+# size cells straight into a surface through pygame.surfarray, however
+# big the table. mark() collects the cells written since the last frame;
+# draw() repaints only the pixels that show them.
+#
+# Mouse wheel zooms around the pointer, dragging or the arrow keys pan,
+# F fits the whole table again.
+
+LABEL_CELL = 28
+MAX_CELL = 70
+BACKGROUND = (245, 250, 255)
+INF_COLOR = (200, 200, 200)
+HIGHLIGHT = (255, 0, 0)
+# low -> high values
+HEAT_STOPS = [(20, 30, 90), (30, 110, 200), (40, 190, 160), (240, 220, 60), (250, 250, 220)]
+
+
+def heat_palette(stops=HEAT_STOPS, size=256):
+    """A size x 3 colour table interpolated between stops."""
+    stops = np.array(stops, dtype=np.float64)
+    at = np.linspace(0, len(stops) - 1, size)
+    lo = np.minimum(at.astype(int), len(stops) - 2)
+    frac = (at - lo)[:, None]
+    return (stops[lo] * (1 - frac) + stops[lo + 1] * frac).astype(np.uint8)
+
+
+class TableView:
+    def __init__(self, table, rect, vmax=None):
+        self.table = table
+        self.rect = pygame.Rect(rect)
+        self.surface = pygame.Surface(self.rect.size, 0, 32)
+        self.palette = heat_palette()
+        self.vmax = vmax
+        self.dirty = None  # [r0, r1, c0, c1) of the cells written since the last draw
+        self.full = True
+        self.highlights = []
+        self.shown_highlights = []
+        self.dragging = False
+        self.fit()
+
+    # ---------- viewport ----------
+    @property
+    def mode(self):
+        if self.zoom >= LABEL_CELL:
+            return "labels"
+        return "blocks" if self.zoom >= 1 else "sampled"
+
+    def fit(self):
+        rows, cols = self.table.shape
+        self.fit_zoom = min(self.rect.w / cols, self.rect.h / rows, MAX_CELL)
+        self.zoom = self.fit_zoom
+        self.top = self.left = 0.0
+        self._layout()
+
+    def _clamp(self):
+        rows, cols = self.table.shape
+        self.zoom = min(max(self.zoom, self.fit_zoom), MAX_CELL)
+        self.top = min(max(self.top, 0.0), max(0.0, rows - self.rect.h / self.zoom))
+        self.left = min(max(self.left, 0.0), max(0.0, cols - self.rect.w / self.zoom))
+
+    def _layout(self):
+        """Pixel -> cell maps; pixels past the table map to rows / cols (drawn as background)."""
+        rows, cols = self.table.shape
+        ys = self.top + (np.arange(self.rect.h) + 0.5) / self.zoom
+        xs = self.left + (np.arange(self.rect.w) + 0.5) / self.zoom
+        self.row_of = np.minimum(ys.astype(np.int64), rows)
+        self.col_of = np.minimum(xs.astype(np.int64), cols)
+        self.full = True
+
+    def zoom_at(self, factor, pos):
+        """Zooms by factor keeping the cell under screen position pos in place."""
+        x, y = pos[0] - self.rect.x, pos[1] - self.rect.y
+        cell_y, cell_x = self.top + y / self.zoom, self.left + x / self.zoom
+        self.zoom *= factor
+        self._clamp()
+        self.top, self.left = cell_y - y / self.zoom, cell_x - x / self.zoom
+        self._clamp()
+        self._layout()
+
+    def pan(self, dx, dy):
+        """Moves the view by (dx, dy) screen pixels."""
+        self.left -= dx / self.zoom
+        self.top -= dy / self.zoom
+        self._clamp()
+        self._layout()
+
+    def handle_event(self, event):
+        """Pan / zoom input; returns True if the event was consumed."""
+        if event.type == pygame.MOUSEWHEEL:
+            pos = pygame.mouse.get_pos()
+            if self.rect.collidepoint(pos):
+                self.zoom_at(1.25 ** event.y, pos)
+                return True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.dragging = self.rect.collidepoint(event.pos)
+            return self.dragging
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            dragging, self.dragging = self.dragging, False
+            return dragging
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            self.pan(*event.rel)
+            return True
+        elif event.type == pygame.KEYDOWN:
+            step = self.rect.w // 5
+            moves = {pygame.K_LEFT: (step, 0), pygame.K_RIGHT: (-step, 0),
+                     pygame.K_UP: (0, step), pygame.K_DOWN: (0, -step)}
+            if event.key in moves:
+                self.pan(*moves[event.key])
+                return True
+            if event.key == pygame.K_f:
+                self.fit()
+                return True
+        return False
+
+    # ---------- updates ----------
+    def mark(self, i, j=None):
+        """Flags cell (i, j) as written, or all of row i when j is None."""
+        c0, c1 = (0, self.table.shape[1]) if j is None else (j, j + 1)
+        if self.dirty is None:
+            self.dirty = [i, i + 1, c0, c1]
+        else:
+            d = self.dirty
+            d[0], d[1], d[2], d[3] = min(d[0], i), max(d[1], i + 1), min(d[2], c0), max(d[3], c1)
+
+    def _colors(self, values, outside):
+        finite = np.isfinite(values)
+        scale = 255 / self.vmax if self.vmax else 0
+        index = np.clip(np.where(finite, values, 0) * scale, 0, 255).astype(np.intp)
+        colors = self.palette[index]
+        colors[~finite] = INF_COLOR
+        colors[outside] = BACKGROUND
+        return colors
+
+    def _update_vmax(self, values, headroom=1.0):
+        finite = values[np.isfinite(values)]
+        top = float(finite.max()) if finite.size else 0
+        if self.vmax is None or top > self.vmax:
+            self.vmax = max(top * headroom, 1)
+            self.full = True
+
+    def rescale(self):
+        """Spreads the palette over the values now in the table (after a run)."""
+        self.vmax = None
+        self.full = True
+
+    def _paint(self, y0, y1, x0, x1):
+        """Repaints the surface pixels [x0, x1) x [y0, y1)."""
+        rows, cols = self.table.shape
+        r, c = self.row_of[y0:y1], self.col_of[x0:x1]
+        if self.mode == "labels":
+            self._paint_labels(r, c)
+            return
+        values = self.table[np.minimum(r, rows - 1)[:, None], np.minimum(c, cols - 1)[None, :]]
+        colors = self._colors(values.astype(np.float64, copy=False), (r[:, None] >= rows) | (c[None, :] >= cols))
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        pixels[x0:x1, y0:y1] = colors.transpose(1, 0, 2)
+        del pixels  # unlock the surface
+
+    def _paint_labels(self, r, c):
+        rows, cols = self.table.shape
+        font = get_font(min(32, int(self.zoom * 0.45) // 4 * 4))
+        for i in np.unique(r[r < rows]).tolist():
+            for j in np.unique(c[c < cols]).tolist():
+                x = round((j - self.left) * self.zoom)
+                y = round((i - self.top) * self.zoom)
+                size = round(self.zoom)
+                pygame.draw.rect(self.surface, (220, 230, 240), (x, y, size, size))
+                pygame.draw.rect(self.surface, (0, 0, 0), (x, y, size, size), 1)
+                value = self.table[i, j]
+                text = "∞" if value == np.inf else str(int(value)) if float(value).is_integer() else f"{value:.3g}"
+                label = font.render(text, True, (0, 0, 0))
+                self.surface.blit(label, label.get_rect(center=(x + size // 2, y + size // 2)))
+
+    def _cell_rect(self, i, j):
+        x = self.rect.x + (j - self.left) * self.zoom
+        y = self.rect.y + (i - self.top) * self.zoom
+        size = max(self.zoom, 3)
+        return pygame.Rect(int(x), int(y), int(size) + 1, int(size) + 1).clip(self.rect)
+
+    # ---------- drawing ----------
+    def highlight(self, cells):
+        """Cells outlined on top of the table from the next draw on."""
+        self.highlights = list(cells)
+
+    def draw(self, screen):
+        """Blits what changed since the last draw; returns the screen rects touched."""
+        rows, cols = self.table.shape
+        rects = []
+        if self.dirty is not None and not self.full:
+            r0, r1, c0, c1 = self.dirty
+            # growing values repaint everything; headroom keeps that to a few frames per run
+            self._update_vmax(self.table[r0:r1, c0:c1], headroom=1.5)
+        if self.full:
+            if self.vmax is None:
+                self._update_vmax(self.table)
+            self.surface.fill(BACKGROUND)
+            self._paint(0, self.rect.h, 0, self.rect.w)
+            screen.blit(self.surface, self.rect)
+            rects.append(self.rect)
+            self.full = False
+        elif self.dirty is not None:
+            r0, r1, c0, c1 = self.dirty
+            y0, y1 = np.searchsorted(self.row_of, [r0, r1])
+            x0, x1 = np.searchsorted(self.col_of, [c0, c1])
+            if y0 < y1 and x0 < x1:
+                if self.mode == "labels":
+                    self.surface.fill(BACKGROUND, (x0, y0, x1 - x0, y1 - y0))
+                self._paint(y0, y1, x0, x1)
+                area = pygame.Rect(self.rect.x + x0, self.rect.y + y0, x1 - x0, y1 - y0)
+                screen.blit(self.surface, area, area.move(-self.rect.x, -self.rect.y))
+                rects.append(area)
+        self.dirty = None
+
+        # put back what the last outlines covered, then draw the new ones
+        for area in self.shown_highlights:
+            screen.blit(self.surface, area, area.move(-self.rect.x, -self.rect.y))
+        rects.extend(self.shown_highlights)
+        self.shown_highlights = []
+        for i, j in self.highlights:
+            area = self._cell_rect(i, j)
+            if area.w > 0 and area.h > 0:
+                pygame.draw.rect(screen, HIGHLIGHT, area, 2)
+                self.shown_highlights.append(area)
+        rects.extend(self.shown_highlights)
+        return rects
+
+    def status(self):
+        rows, cols = self.table.shape
+        return f"{rows:,} x {cols:,} cells · {self.mode} · {self.zoom:.3g} px/cell"
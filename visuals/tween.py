@@ -0,0 +1,118 @@
+import math
+
+# ---------------------------------------------
+# Fixed-Timestep Tweens
+# ---------------------------------------------
+# Animations (pointer glides, the found-bar pop, color and alpha fades) are
+# tweens keyed by name in a TweenEngine, which every StepScheduler owns. The
+# scheduler advances it from its frame clock while steps keep running, so
+# an animation interpolates between algorithm states without holding the
+# algorithm or the event loop up.
+#
+# Time is consumed in whole TIMESTEP slices, so a tween lands on the same
+# values whatever the frame rate, and a dropped frame just means the next
+# one advances several slices: the animation never runs slow. Animating a
+# key that is already moving retargets it from where it currently is.
+
+TIMESTEP = 1 / 120
+
+
+# ---------- easing ----------
+def linear(t):
+    return t
+
+
+def ease_in_out(t):
+    return 4 * t ** 3 if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_out_back(t, overshoot=1.70158):
+    """Overshoots the end a little, then settles (a 'pop')."""
+    c3 = overshoot + 1
+    return 1 + c3 * (t - 1) ** 3 + overshoot * (t - 1) ** 2
+
+
+def ease_out_elastic(t):
+    if t in (0, 1):
+        return t
+    return 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * (2 * math.pi) / 3) + 1
+
+
+def lerp(a, b, t):
+    """Interpolates numbers or equal-length tuples (positions, colors)."""
+    if isinstance(a, tuple):
+        return tuple(x + (y - x) * t for x, y in zip(a, b))
+    return a + (b - a) * t
+
+
+# ---------- tweens ----------
+class Tween:
+    def __init__(self, start, end, duration, easing=ease_in_out):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.elapsed = 0.0
+
+    @property
+    def done(self):
+        return self.elapsed >= self.duration
+
+    @property
+    def value(self):
+        if self.done:
+            return self.end
+        return lerp(self.start, self.end, self.easing(self.elapsed / self.duration))
+
+    def step(self, dt):
+        self.elapsed = min(self.elapsed + dt, self.duration)
+
+
+class TweenEngine:
+    def __init__(self, timestep=TIMESTEP):
+        self.timestep = timestep
+        self.tweens = {}  # key -> running Tween
+        self.values = {}  # key -> current value (kept after the tween ends)
+        self.accumulator = 0.0
+
+    @property
+    def active(self):
+        return bool(self.tweens)
+
+    def animate(self, key, end, duration, easing=ease_in_out, start=None):
+        """Tweens key to `end` from its current value (or `start`)."""
+        if start is None:
+            start = self.values.get(key, end)
+        self.values[key] = start
+        self.tweens[key] = Tween(start, end, duration, easing)
+
+    def set(self, key, value):
+        """Jumps key to value, cancelling any tween on it."""
+        self.tweens.pop(key, None)
+        self.values[key] = value
+
+    def value(self, key, default=None):
+        return self.values.get(key, default)
+
+    def advance(self, dt):
+        """Consumes dt seconds of frame time in whole timesteps; returns True while anything moves."""
+        self.accumulator += dt
+        steps = int(self.accumulator / self.timestep)
+        if steps:
+            self.accumulator -= steps * self.timestep
+            for key, tween in list(self.tweens.items()):
+                # easing is a function of elapsed time, so n slices at once == n single slices
+                tween.step(steps * self.timestep)
+                self.values[key] = tween.value
+                if tween.done:
+                    del self.tweens[key]
+        return self.active
+
+    def clear(self):
+        self.tweens.clear()
+        self.values.clear()
+        self.accumulator = 0.0
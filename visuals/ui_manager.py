@@ -1,4 +1,5 @@
 import pygame
+from visuals.fonts import get_font
 
 # -------------------------------------------------
 # 🧠 Visual Layout Manager (Scrolling + Theme)
@@ -9,13 +10,17 @@ class VisualUI:
         self.title = title
         self.scroll_offset = 0
         self.scroll_speed = 30
-        self.font = pygame.font.Font(None, 36)
-        self.big_font = pygame.font.Font(None, 60)
+        self.font = get_font(36)
+        self.big_font = get_font(60)
         self.bg_color = (255, 255, 255)
         self.text_color = (30, 30, 30)
         self.accent = (30, 150, 220)
         self.border = (200, 200, 200)
-        self.max_y = 0  # max content height
+        self.max_y = 0  # total content height, as reported by the content callback
+        self.view_top = 100  # scroll area starts below the header
+        self.canvas = None  # viewport-sized backing surface, kept between frames
+        self.drawn_offset = 0  # scroll_offset the canvas was last painted at
+        self.dirty = True
 
     # Draws clean white background + title
     def draw_header(self):
@@ -24,27 +29,59 @@ class VisualUI:
         self.screen.blit(title_text, (50, 30))
         pygame.draw.line(self.screen, self.accent, (50, 85), (950, 85), 3)
 
-    # Safe drawing area that auto scrolls if content too tall
-    def draw_scrollable_area(self, draw_content_callback):
-        """draw_content_callback(y_offset) must draw visuals using the given Y offset."""
-        height = self.screen.get_height()
-        surface = pygame.Surface((self.screen.get_width(), 2000))  # large virtual canvas
-        surface.fill(self.bg_color)
+    # Persistent, viewport-sized scroll canvas
+    def draw_scrollable_area(self, draw_content_callback, content_height=None):
+        """Blits the scrollable region below the header, repainting only what changed.
 
-        # Call visual drawing function
-        draw_content_callback(surface)
+        draw_content_callback(surface, view, y_offset) paints content whose
+        content-space rect intersects `view`, at screen-canvas position
+        y + y_offset; the surface is clipped to `view`, so anything outside it
+        may (and should) be skipped. It returns the total content height, or
+        None to keep the last one (content_height= sets it up front).
+        """
+        width, height = self.screen.get_size()
+        view_h = max(height - self.view_top, 1)
+        if self.canvas is None or self.canvas.get_size() != (width, view_h):
+            # sized to the viewport, so memory is independent of content height
+            self.canvas = pygame.Surface((width, view_h))
+            self.dirty = True
+        if content_height is not None and content_height != self.max_y:
+            self.max_y = content_height
+            self.dirty = True
+        self.clamp_scroll()
 
-        # Get total content height
-        self.max_y = surface.get_height()
+        delta = self.scroll_offset - self.drawn_offset
+        if self.dirty or abs(delta) >= view_h:
+            self._paint(draw_content_callback, pygame.Rect(0, self.scroll_offset, width, view_h))
+        elif delta:
+            # shift what is already drawn and paint only the exposed strip
+            self.canvas.scroll(0, -delta)
+            strip_top = self.scroll_offset + view_h - delta if delta > 0 else self.scroll_offset
+            self._paint(draw_content_callback, pygame.Rect(0, strip_top, width, abs(delta)))
 
-        # Scroll boundary checks
-        if self.scroll_offset < 0:
-            self.scroll_offset = 0
-        elif self.scroll_offset > self.max_y - height + 100:
-            self.scroll_offset = self.max_y - height + 100
+        self.screen.blit(self.canvas, (0, self.view_top))
 
-        # Render only visible portion
-        self.screen.blit(surface, (0, -self.scroll_offset))
+    def _paint(self, draw_content_callback, view):
+        y_offset = -self.scroll_offset
+        self.canvas.set_clip(view.move(0, y_offset))
+        self.canvas.fill(self.bg_color)
+        total = draw_content_callback(self.canvas, view, y_offset)
+        self.canvas.set_clip(None)
+        self.drawn_offset = self.scroll_offset
+        self.dirty = False
+        if total is not None and total != self.max_y:
+            # content grew/shrank: re-clamp, and repaint next frame if that moved the view
+            self.max_y = total
+            self.clamp_scroll()
+            self.dirty = self.scroll_offset != self.drawn_offset
+
+    def clamp_scroll(self):
+        view_h = self.screen.get_height() - self.view_top
+        self.scroll_offset = max(0, min(self.scroll_offset, self.max_y - view_h))
+
+    def invalidate(self):
+        """Forces a full repaint of the visible area on the next draw (call when content changes)."""
+        self.dirty = True
 
     def handle_scroll(self, event):
         """Handles scroll up/down using mouse wheel or arrow keys."""